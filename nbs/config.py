@@ -4,6 +4,9 @@
 __all__ = [
     "AUDIO_PATH",
     "load_env",
+    "Settings",
+    "get_settings",
+    "reload_settings",
     "get_RSS_URL",
     "get_gemini_api_key",
     "get_openai_api_key",
@@ -14,19 +17,150 @@ __all__ = [
     "get_audio_path",
     "get_DB_VARS",
     "get_WEB_filename",
+    "get_RSS_cache_file",
+    "get_WHISPER_VARS",
 ]
 
+# %% py config.ipynb 1
 import os
+import threading
+from dataclasses import dataclass, fields
+from typing import Optional, Set
 
-# %% py config.ipynb 1
-from dotenv import find_dotenv, load_dotenv
+from dotenv import dotenv_values, find_dotenv
+
+_env_lock = threading.RLock()
+_dotenv_path: Optional[str] = None  # None tant que le fichier .env n'a pas été cherché
+_dotenv_mtime: Optional[float] = None
+_dotenv_keys: Set[str] = set()  # variables définies par le fichier .env
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """Date de modification du fichier, ou None s'il n'existe pas."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
 
-def load_env() -> None:
+def load_env(force: bool = False) -> None:
     """
     Charge les variables d'environnement à partir d'un fichier .env.
+
+    Le fichier n'est cherché (find_dotenv remonte l'arborescence) et lu qu'une fois par processus.
+    Les variables déjà définies dans l'environnement du processus ne sont pas écrasées.
+
+    Args:
+        force (bool, optional): Si True, relit le fichier .env : les variables qu'il avait définies
+            prennent leur nouvelle valeur. Défaut False.
+    """
+    global _dotenv_path, _dotenv_mtime
+    with _env_lock:
+        if _dotenv_path is not None and not force:
+            return
+        path = find_dotenv()
+        values = dotenv_values(path) if path else {}
+        for key, value in values.items():
+            if value is not None and (key not in os.environ or key in _dotenv_keys):
+                os.environ[key] = value
+                _dotenv_keys.add(key)
+        _dotenv_path = path
+        _dotenv_mtime = _get_mtime(path) if path else None
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Valeurs brutes des variables d'environnement de configuration, lues une seule fois.
+
+    Chaque champ correspond à la variable d'environnement de même nom en majuscules
+    (None si elle n'est pas définie) ; les valeurs par défaut sont appliquées par les
+    fonctions get_*. L'instance partagée est retournée par get_settings.
+    """
+
+    rss_lmelp_url: Optional[str] = None
+    rss_cache_file: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    google_project_id: Optional[str] = None
+    google_auth_file: Optional[str] = None
+    azure_api_key: Optional[str] = None
+    azure_endpoint: Optional[str] = None
+    azure_api_version: Optional[str] = None
+    db_host: Optional[str] = None
+    db_name: Optional[str] = None
+    db_logs: Optional[str] = None
+    db_max_pool_size: Optional[str] = None
+    web_lmelp_filename: Optional[str] = None
+    whisper_batch_size: Optional[str] = None
+    whisper_vad: Optional[str] = None
+    # whisper.cpp (voir mongo_episode.extract_whisper_cpp et WhisperCppServer)
+    whisper_cpp_mode: Optional[str] = None
+    whisper_cpp_script: Optional[str] = None
+    whisper_cpp_binary: Optional[str] = None
+    models_dir: Optional[str] = None
+    whisper_model_filename: Optional[str] = None
+    whisper_model_url: Optional[str] = None
+    whisper_server_url: Optional[str] = None
+    whisper_server_port: Optional[str] = None
+    whisper_server_binary: Optional[str] = None
+    whisper_server_entrypoint: Optional[str] = None
+    whisper_docker_image: Optional[str] = None
+    whisper_threads: Optional[str] = None
+    whisper_cpuset: Optional[str] = None
+    # "true" : la configuration est relue quand le fichier .env est modifié (un stat par appel)
+    config_watch_dotenv: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Lit les variables d'environnement (sans charger le fichier .env)."""
+        return cls(
+            **{field.name: os.getenv(field.name.upper()) for field in fields(cls)}
+        )
+
+
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """
+    Retourne la configuration partagée, lue au premier appel (fichier .env compris).
+
+    Les appels suivants ne touchent ni au système de fichiers ni à l'environnement, sauf si
+    CONFIG_WATCH_DOTENV vaut "true" : la configuration est alors relue dès que la date de
+    modification du fichier .env change.
+
+    Returns:
+        Settings: La configuration courante.
+    """
+    global _settings
+    with _env_lock:
+        settings = _settings
+        if (
+            settings is not None
+            and (settings.config_watch_dotenv or "").lower() == "true"
+            and _dotenv_path
+            and _get_mtime(_dotenv_path) != _dotenv_mtime
+        ):
+            return reload_settings()
+        if settings is None:
+            load_env()
+            settings = _settings = Settings.from_env()
+        return settings
+
+
+def reload_settings() -> Settings:
+    """
+    Relit le fichier .env et l'environnement, puis remplace la configuration partagée.
+
+    Returns:
+        Settings: La nouvelle configuration.
     """
-    _ = load_dotenv(find_dotenv())
+    global _settings
+    with _env_lock:
+        load_env(force=True)
+        _settings = Settings.from_env()
+        return _settings
 
 
 # %% py config.ipynb 3
@@ -38,8 +172,7 @@ def get_RSS_URL() -> str:
         str: L'URL du flux RSS. Si la variable d'environnement `RSS_LMELP_URL` n'est pas définie,
         retourne une URL par défaut.
     """
-    load_env()
-    RSS_LMELP_URL = os.getenv("RSS_LMELP_URL")
+    RSS_LMELP_URL = get_settings().rss_lmelp_url
     if RSS_LMELP_URL is None:
         RSS_LMELP_URL = "https://radiofrance-podcast.net/podcast09/rss_14007.xml"
     return RSS_LMELP_URL
@@ -53,8 +186,7 @@ def get_gemini_api_key() -> str:
     Returns:
         str: The Gemini API key.
     """
-    load_env()
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    gemini_api_key = get_settings().gemini_api_key
     return gemini_api_key
 
 
@@ -65,8 +197,7 @@ def get_openai_api_key() -> str:
     Returns:
         str: The OpenAI API key.
     """
-    load_env()
-    openai_api_key = os.getenv("OPENAI_API_KEY")
+    openai_api_key = get_settings().openai_api_key
     return openai_api_key
 
 
@@ -77,8 +208,7 @@ def get_google_projectID() -> str:
     Returns:
         str: The Google Project ID.
     """
-    load_env()
-    google_projectID = os.getenv("GOOGLE_PROJECT_ID")
+    google_projectID = get_settings().google_project_id
     return google_projectID
 
 
@@ -89,8 +219,7 @@ def get_google_auth_file() -> str:
     Returns:
         str: The path to the Google authentication file.
     """
-    load_env()
-    google_auth_file = os.getenv("GOOGLE_AUTH_FILE")
+    google_auth_file = get_settings().google_auth_file
     return google_auth_file
 
 
@@ -101,11 +230,8 @@ def get_azure_openai_keys() -> tuple[str, str, str]:
     Returns:
         tuple: A tuple containing the Azure API key, endpoint, and API version.
     """
-    load_env()
-    azure_api_key = os.getenv("AZURE_API_KEY")
-    azure_endpoint = os.getenv("AZURE_ENDPOINT")
-    azure_api_version = os.getenv("AZURE_API_VERSION")
-    return azure_api_key, azure_endpoint, azure_api_version
+    settings = get_settings()
+    return settings.azure_api_key, settings.azure_endpoint, settings.azure_api_version
 
 
 # %% py config.ipynb 8
@@ -169,8 +295,7 @@ from typing import Optional, Tuple
 def get_DB_VARS() -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Retrieve the database configuration variables from the environment.
 
-    This function loads the environment variables and retrieves the following
-    database configuration variables:
+    The values come from the shared settings (see get_settings), read once:
         - DB_HOST: The hostname for the database.
         - DB_NAME: The name of the database.
         - DB_LOGS: A flag indicating if logging is enabled.
@@ -179,11 +304,8 @@ def get_DB_VARS() -> Tuple[Optional[str], Optional[str], Optional[str]]:
         Tuple[Optional[str], Optional[str], Optional[str]]:
             A tuple containing (DB_HOST, DB_NAME, DB_LOGS).
     """
-    load_env()
-    DB_HOST: Optional[str] = os.getenv("DB_HOST")
-    DB_NAME: Optional[str] = os.getenv("DB_NAME")
-    DB_LOGS: Optional[str] = os.getenv("DB_LOGS")
-    return DB_HOST, DB_NAME, DB_LOGS
+    settings = get_settings()
+    return settings.db_host, settings.db_name, settings.db_logs
 
 
 # %% py config.ipynb 15
@@ -194,17 +316,55 @@ def get_WEB_filename() -> str:
     """
     Get the filename of the WEB_LMELP file.
 
-    This function loads environment variables and retrieves the value of the
-    `WEB_LMELP_FILENAME` environment variable. If the variable is not set,
+    This function retrieves the value of the `WEB_LMELP_FILENAME` environment
+    variable from the shared settings (see get_settings). If the variable is not set,
     it returns a default file path.
 
     Returns:
         str: The filename of the WEB_LMELP file.
     """
-    load_env()
-
-    WEB_LMELP_FILENAME = os.getenv("WEB_LMELP_FILENAME")
+    WEB_LMELP_FILENAME = get_settings().web_lmelp_filename
     if WEB_LMELP_FILENAME is None:
         WEB_LMELP_FILENAME = "db/À écouter plus tard I Radio France/À écouter plus tard I Radio France.html"
 
     return str(Path(get_git_root(""), WEB_LMELP_FILENAME))
+
+
+def get_RSS_cache_file() -> str:
+    """
+    Get the path of the local copy of the RSS feed.
+
+    The feed is cached there together with its ETag/Last-Modified validators
+    (in a sibling `.json` file) so that the next fetch can be conditional.
+    If the `RSS_CACHE_FILE` environment variable is not set, the file lives in
+    the user cache directory.
+
+    Returns:
+        str: The path of the RSS feed cache file.
+    """
+    RSS_CACHE_FILE = get_settings().rss_cache_file
+    if RSS_CACHE_FILE is None:
+        return str(Path.home() / ".cache" / "lmelp" / "rss_feed.xml")
+
+    return str(Path(get_git_root(""), RSS_CACHE_FILE))
+
+
+# %% py config.ipynb 18
+import os
+from typing import Tuple
+
+
+def get_WHISPER_VARS() -> Tuple[int, bool]:
+    """Retrieve the Whisper transcription settings from the environment.
+
+    The values come from the shared settings (see get_settings):
+        - WHISPER_BATCH_SIZE: number of audio chunks decoded together (default 4).
+        - WHISPER_VAD: "true" to only transcribe speech regions (default false).
+
+    Returns:
+        Tuple[int, bool]: A tuple containing (WHISPER_BATCH_SIZE, WHISPER_VAD).
+    """
+    settings = get_settings()
+    WHISPER_BATCH_SIZE: int = int(settings.whisper_batch_size or "4")
+    WHISPER_VAD: bool = (settings.whisper_vad or "false").lower() == "true"
+    return WHISPER_BATCH_SIZE, WHISPER_VAD
@@ -2,9 +2,19 @@
 
 # %% auto 0
 __all__ = [
+    "DEFAULT_MAX_POOL_SIZE",
+    "LOG_BATCH_SIZE",
+    "LOG_FLUSH_INTERVAL_S",
+    "LOG_QUEUE_MAXSIZE",
+    "LOG_DROP_POLICIES",
     "T",
+    "get_client",
+    "close_clients",
     "get_collection",
+    "MongoLogWriter",
+    "flush_logs",
     "mongolog",
+    "mongolog_many",
     "print_logs",
     "BaseEntity",
     "Editeur",
@@ -12,9 +22,89 @@ __all__ = [
 ]
 
 # %% py mongo helper.ipynb 2
+import atexit
+import os
+import threading
+from typing import Dict, Optional
+
 import pymongo
 from pymongo.collection import Collection
 
+from config import get_settings
+
+DEFAULT_MAX_POOL_SIZE: int = 20
+
+_clients: Dict[str, pymongo.MongoClient] = {}
+_clients_pid: int = os.getpid()
+_clients_lock = threading.Lock()
+
+
+def _reset_clients_after_fork() -> None:
+    """Oublie les clients hérités du processus parent (pymongo n'est pas fork-safe).
+
+    Les clients ne sont pas fermés : leurs sockets appartiennent au parent.
+    """
+    global _clients, _clients_pid, _clients_lock
+    _clients = {}
+    _clients_pid = os.getpid()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+def get_client(
+    target_db: str = "localhost", max_pool_size: Optional[int] = None
+) -> pymongo.MongoClient:
+    """Retourne le client MongoDB partagé pour un hôte donné.
+
+    Un seul client (donc un seul pool de connexions) est créé par hôte et par processus,
+    puis réutilisé par tous les appels suivants. La connexion est paresseuse : aucune
+    socket n'est ouverte avant la première requête.
+
+    Args:
+        target_db (str): L'hôte de la base (e.g., "localhost" ou "nas923").
+        max_pool_size (Optional[int]): Taille maximale du pool, prise en compte uniquement
+            à la création du client. Par défaut, DB_MAX_POOL_SIZE (lu dans get_settings à
+            l'appel) ou DEFAULT_MAX_POOL_SIZE.
+
+    Returns:
+        pymongo.MongoClient: Le client partagé.
+    """
+    if os.getpid() != _clients_pid:
+        _reset_clients_after_fork()
+    with _clients_lock:
+        client = _clients.get(target_db)
+        if client is None:
+            if max_pool_size is None:
+                max_pool_size = int(
+                    get_settings().db_max_pool_size or DEFAULT_MAX_POOL_SIZE
+                )
+            client = pymongo.MongoClient(
+                f"mongodb://{target_db}:27017/",
+                maxPoolSize=max_pool_size,
+                connect=False,
+            )
+            _clients[target_db] = client
+        return client
+
+
+def close_clients() -> None:
+    """Ferme tous les clients MongoDB partagés et vide le registre.
+
+    Appelée automatiquement à la sortie de l'interpréteur ; un appel ultérieur à
+    get_client recrée un client à la demande.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_clients)
+
 
 def get_collection(
     target_db: str = "localhost",
@@ -23,8 +113,9 @@ def get_collection(
 ) -> Collection:
     """Retrieve a MongoDB collection.
 
-    This function connects to a MongoDB database using the provided database host,
-    client name (database name), and collection name, and returns the collection object.
+    This function uses the shared MongoDB client of the provided database host (see
+    get_client), selects the client name (database name) and collection name, and
+    returns the collection object.
 
     Args:
         target_db (str): The database host address (e.g., "localhost" or "nas923").
@@ -34,37 +125,197 @@ def get_collection(
     Returns:
         Collection: The MongoDB collection object.
     """
-    client = pymongo.MongoClient(f"mongodb://{target_db}:27017/")
+    client = get_client(target_db)
     db = client[client_name]
     collection = db[collection_name]
     return collection
 
 
 # %% py mongo helper.ipynb 4
+from collections import deque
 from datetime import datetime
+from typing import Any, Deque, Iterable, List, Tuple
 import pymongo
 from config import get_DB_VARS
 
+LOG_BATCH_SIZE: int = 100
+LOG_FLUSH_INTERVAL_S: float = 2.0
+LOG_QUEUE_MAXSIZE: int = 10000
+LOG_DROP_POLICIES: Tuple[str, ...] = ("oldest", "newest")
+
+
+class MongoLogWriter:
+    """
+    Écrit les logs en arrière-plan, par lots, pour que mongolog n'ajoute pas d'aller-retour à chaque écriture.
+
+    Les entrées sont mises en file en mémoire ; un thread démon les écrit avec insert_many dès que
+    `batch_size` entrées sont en attente, ou au plus tard toutes les `flush_interval_s` secondes.
+    La file est bornée à `maxsize` entrées : au-delà, la plus ancienne ("oldest") ou la nouvelle
+    ("newest") entrée est abandonnée et comptée dans `dropped`. Les logs en attente sont écrits à la
+    sortie de l'interpréteur (close, enregistré avec atexit).
+    """
+
+    def __init__(
+        self,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval_s: float = LOG_FLUSH_INTERVAL_S,
+        maxsize: int = LOG_QUEUE_MAXSIZE,
+        drop_policy: str = "oldest",
+    ) -> None:
+        """
+        Args:
+            batch_size (int, optional): Nombre d'entrées qui déclenche une écriture. Défaut LOG_BATCH_SIZE.
+            flush_interval_s (float, optional): Délai maximal avant l'écriture d'une entrée. Défaut LOG_FLUSH_INTERVAL_S.
+            maxsize (int, optional): Nombre maximal d'entrées en attente. Défaut LOG_QUEUE_MAXSIZE.
+            drop_policy (str, optional): Entrée abandonnée quand la file est pleine, "oldest" ou "newest". Défaut "oldest".
+        """
+        if drop_policy not in LOG_DROP_POLICIES:
+            raise ValueError(
+                f"Politique inconnue: {drop_policy} (attendu: {LOG_DROP_POLICIES})"
+            )
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.maxsize = maxsize
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        # (collection, document) : la collection est résolue à l'appel de mongolog
+        self._queue: Deque[Tuple[Collection, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return (
+            f"MongoLogWriter({len(self._queue)} en attente, {self.dropped} abandonnés)"
+        )
+
+    def _reset_after_fork(self) -> None:
+        """Repart d'un état vide dans le processus enfant.
+
+        La file et le thread appartiennent au parent, et le verrou a pu être copié alors que le
+        thread d'écriture du parent le détenait : il est remplacé sans être acquis.
+        """
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._thread = None
+        self._pid = os.getpid()
+
+    def write(
+        self, collection: Collection, documents: Iterable[Dict[str, Any]]
+    ) -> None:
+        """Met des documents en file pour la collection `collection` (sans attendre l'écriture)."""
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+        with self._condition:
+            for document in documents:
+                if len(self._queue) >= self.maxsize:
+                    self.dropped += 1
+                    if self.drop_policy == "newest":
+                        continue
+                    self._queue.popleft()
+                self._queue.append((collection, document))
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="mongolog", daemon=True
+                )
+                self._thread.start()
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def _take(self) -> List[Tuple[Collection, Dict[str, Any]]]:
+        """Retire de la file toutes les entrées en attente (appelé sous le verrou)."""
+        entries = list(self._queue)
+        self._queue.clear()
+        return entries
+
+    @staticmethod
+    def _insert(entries: List[Tuple[Collection, Dict[str, Any]]]) -> None:
+        """Écrit les entrées avec un insert_many par collection ; une erreur n'interrompt pas l'appelant."""
+        by_collection: Dict[int, Tuple[Collection, List[Dict[str, Any]]]] = {}
+        for collection, document in entries:
+            by_collection.setdefault(id(collection), (collection, []))[1].append(
+                document
+            )
+        for collection, documents in by_collection.values():
+            try:
+                collection.insert_many(documents, ordered=False)
+            except pymongo.errors.PyMongoError as e:
+                print(f"Échec de l'écriture de {len(documents)} log(s): {e}")
+
+    def _run(self) -> None:
+        """Boucle du thread d'écriture."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._queue) >= self.batch_size or self._closed,
+                    timeout=self.flush_interval_s,
+                )
+                entries = self._take()
+                closed = self._closed
+            if entries:
+                self._insert(entries)
+            if closed:
+                return
+
+    def flush(self) -> None:
+        """Écrit immédiatement, depuis le thread appelant, les entrées en attente."""
+        with self._condition:
+            entries = self._take()
+        if entries:
+            self._insert(entries)
+
+    def close(self, timeout_s: float = 10.0) -> None:
+        """Arrête le thread d'écriture après avoir écrit les entrées en attente."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread if self._pid == os.getpid() else None
+        if thread is not None:
+            thread.join(timeout_s)
+        self.flush()
+
+
+_log_writer = MongoLogWriter()
+# enregistré après close_clients : exécuté avant, tant que les clients sont ouverts
+atexit.register(_log_writer.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log_writer._reset_after_fork)
+
+
+def flush_logs() -> None:
+    """Écrit immédiatement les logs en attente (voir MongoLogWriter)."""
+    _log_writer.flush()
+
 
 def mongolog(operation: str, entite: str, desc: str) -> None:
     """Enregistre une opération de log dans la collection 'logs' si la configuration autorise les logs.
 
+    L'écriture est faite en arrière-plan, par lots (voir MongoLogWriter) ; flush_logs force l'écriture.
+
     Args:
         operation (str): L'opération effectuée (par exemple, "insert", "update", "delete").
         entite (str): Le nom de l'entité concernée.
         desc (str): Une description détaillée de l'opération.
     """
+    mongolog_many([(operation, entite, desc)])
+
+
+def mongolog_many(logs: Iterable[Tuple[str, str, str]]) -> None:
+    """Enregistre plusieurs opérations de log si la configuration autorise les logs (écriture en arrière-plan).
+
+    Args:
+        logs (Iterable[Tuple[str, str, str]]): Les triplets (operation, entite, desc), voir mongolog.
+    """
     DB_HOST, DB_NAME, DB_LOGS = get_DB_VARS()
     if DB_LOGS in ["true", "True"]:
-        coll_logs = get_collection(DB_HOST, DB_NAME, "logs")
-        coll_logs.insert_one(
-            {
-                "operation": operation,
-                "entite": entite,
-                "desc": desc,
-                "date": datetime.now(),
-            }
-        )
+        now = datetime.now()
+        documents = [
+            {"operation": operation, "entite": entite, "desc": desc, "date": now}
+            for operation, entite, desc in logs
+        ]
+        if documents:
+            _log_writer.write(get_collection(DB_HOST, DB_NAME, "logs"), documents)
 
 
 def print_logs(n: int = 10) -> None:
@@ -73,6 +324,7 @@ def print_logs(n: int = 10) -> None:
     Args:
         n (int, optional): Le nombre maximum de logs à afficher. Par défaut à 10.
     """
+    flush_logs()
     DB_HOST, DB_NAME, DB_LOGS = get_DB_VARS()
     coll_logs = get_collection(DB_HOST, DB_NAME, "logs")
     for i, log in enumerate(coll_logs.find().sort("date", pymongo.DESCENDING)):
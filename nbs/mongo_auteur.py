@@ -2,19 +2,182 @@
 
 # %% auto 0
 __all__ = [
+    "AUTHOR_NAME_PARTICLES",
     "score_fuzz_threshold",
+    "FUZZ_BLOCKING_MIN_SIZE",
+    "FUZZ_BATCH_SIZE",
     "api_key",
     "cse_id",
+    "AUTHOR_RESOLUTIONS_COLLECTION",
+    "AUTHOR_RESOLUTION_TTL",
+    "AUTHOR_RESOLUTION_NEGATIVE_TTL",
+    "AUTHOR_CHECK_WORKERS",
+    "PROVIDER_RATE_LIMITS",
+    "EPISODE_AUTHORS_COLLECTION",
+    "normalize_author_name",
+    "AuthorIndex",
+    "get_author_index",
     "Auteur",
+    "author_block_keys",
     "AuthorFuzzMatcher",
     "google_search",
+    "AuthorResolutionCache",
+    "get_author_resolution_cache",
+    "RateLimiter",
+    "get_rate_limiter",
+    "get_author_llm",
+    "get_episode_authors_collection",
     "AuthorChecker",
 ]
 
 # %% py mongo helper auteurs.ipynb 2
-from mongo import BaseEntity
+import re
+import threading
+import unicodedata
+from typing import Dict, FrozenSet, List, Optional
+
+from mongo import BaseEntity, get_collection
+from config import get_DB_VARS
 from date_utils import format_date
 
+# particules ignorées par normalize_author_name ("Jean de La Fontaine" -> "jean fontaine")
+AUTHOR_NAME_PARTICLES: FrozenSet[str] = frozenset(
+    {
+        "de",
+        "du",
+        "des",
+        "d",
+        "le",
+        "la",
+        "les",
+        "l",
+        "van",
+        "von",
+        "der",
+        "di",
+        "da",
+        "del",
+    }
+)
+
+
+def normalize_author_name(name: str) -> str:
+    """Normalise un nom d'auteur : sans accents, en minuscules, sans ponctuation ni particules.
+
+    Args:
+        name (str): Le nom tel qu'écrit (base, transcription, LLM...).
+
+    Returns:
+        str: La clé normalisée, par exemple "Jean-Marie Le Clézio" -> "jean marie clezio".
+    """
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    words = re.findall(r"[a-z0-9]+", text)
+    significant = [word for word in words if word not in AUTHOR_NAME_PARTICLES]
+    # un nom fait uniquement de particules ("De La") est gardé tel quel
+    return " ".join(significant or words)
+
+
+class AuthorIndex:
+    """
+    Index en mémoire des noms de la collection auteurs, partagé par les AuthorChecker.
+
+    Les noms sont lus une seule fois (requête avec projection sur 'nom') puis tenus à jour par
+    Auteur.keep et Auteur.remove ; refresh() relit la collection si elle a été modifiée par
+    un autre processus. L'index garde aussi son AuthorFuzzMatcher, préparé une seule fois.
+    """
+
+    def __init__(self, collection_name: str = "auteurs") -> None:
+        """
+        Args:
+            collection_name (str, optional): La collection des auteurs. Défaut "auteurs".
+        """
+        self.collection_name = collection_name
+        # nom normalisé -> nom tel qu'enregistré en base (le premier en cas d'homonymie)
+        self._names: Optional[Dict[str, str]] = None
+        self._matcher = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        state = "non chargé" if self._names is None else f"{len(self._names)} noms"
+        return f"AuthorIndex({self.collection_name}, {state})"
+
+    def _load(self) -> Dict[str, str]:
+        """Lit les noms de la collection (appelé sous le verrou)."""
+        DB_HOST, DB_NAME, _ = get_DB_VARS()
+        collection = get_collection(
+            target_db=DB_HOST, client_name=DB_NAME, collection_name=self.collection_name
+        )
+        names: Dict[str, str] = {}
+        for document in collection.find({}, {"nom": 1, "_id": 0}):
+            if document.get("nom"):
+                names.setdefault(
+                    normalize_author_name(document["nom"]), document["nom"]
+                )
+        return names
+
+    def _get_names(self) -> Dict[str, str]:
+        """Retourne l'index, chargé au premier appel."""
+        with self._lock:
+            if self._names is None:
+                self._names = self._load()
+            return self._names
+
+    def refresh(self) -> None:
+        """Relit tous les noms de la collection."""
+        with self._lock:
+            self._names = self._load()
+            self._matcher = None
+
+    def add(self, nom: str) -> None:
+        """Ajoute un nom à l'index (sans effet tant que l'index n'est pas chargé)."""
+        with self._lock:
+            if self._names is not None and nom:
+                if self._names.setdefault(normalize_author_name(nom), nom) != nom:
+                    return
+                if self._matcher is not None:
+                    self._matcher.add_reference_author(nom)
+
+    def discard(self, nom: str) -> None:
+        """Retire un nom de l'index s'il y figure."""
+        with self._lock:
+            if self._names is not None:
+                key = normalize_author_name(nom)
+                if self._names.get(key) == nom:
+                    del self._names[key]
+                    if self._matcher is not None:
+                        self._matcher.discard_reference_author(nom)
+
+    def get(self, name: str) -> Optional[str]:
+        """Retourne le nom enregistré dont la forme normalisée est celle de `name`, sinon None."""
+        return self._get_names().get(normalize_author_name(name))
+
+    def names(self) -> List[str]:
+        """Retourne tous les noms enregistrés."""
+        return list(self._get_names().values())
+
+    def matcher(self) -> "AuthorFuzzMatcher":
+        """Retourne le AuthorFuzzMatcher des noms enregistrés, construit au premier appel."""
+        names = self._get_names()
+        with self._lock:
+            if self._matcher is None:
+                self._matcher = AuthorFuzzMatcher(names.values())
+            return self._matcher
+
+    def __len__(self) -> int:
+        return len(self._get_names())
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+
+_author_index = AuthorIndex()
+
+
+def get_author_index() -> AuthorIndex:
+    """Retourne l'index partagé des noms d'auteurs (voir AuthorIndex)."""
+    return _author_index
+
 
 class Auteur(BaseEntity):
     collection: str = "auteurs"
@@ -27,6 +190,16 @@ class Auteur(BaseEntity):
         """
         super().__init__(nom, self.collection)
 
+    def keep(self) -> None:
+        """Insère ou met à jour l'auteur en base et dans l'index partagé des noms."""
+        super().keep()
+        get_author_index().add(self.nom)
+
+    def remove(self) -> None:
+        """Supprime l'auteur de la base et de l'index partagé des noms."""
+        super().remove()
+        get_author_index().discard(self.nom)
+
     def some_method(self):
         fmt_date = format_date(self.episode.date, "%Y/%m/%d")
 
@@ -34,19 +207,92 @@ class Auteur(BaseEntity):
 # %% py mongo helper auteurs.ipynb 7
 from thefuzz import fuzz
 from thefuzz import process
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
+
+# scoreur vectorisé (C++) : rapidfuzz est installé avec thefuzz mais reste optionnel,
+# sans lui chaque requête est scorée par thefuzz.process.extractOne
+try:
+    from rapidfuzz import fuzz as rapid_fuzz
+    from rapidfuzz import process as rapid_process
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 score_fuzz_threshold = 80
 
+# en dessous de ce nombre de références, toutes sont scorées (pas de blocage)
+FUZZ_BLOCKING_MIN_SIZE = 1000
+# nombre de requêtes scorées ensemble par match_many (une matrice requêtes x candidats)
+FUZZ_BATCH_SIZE = 256
+
+# classes de consonnes de la clé phonétique (voyelles, h et apostrophes ignorés)
+_PHONETIC_CLASSES = {
+    **dict.fromkeys("bp", "p"),
+    **dict.fromkeys("ckq", "k"),
+    **dict.fromkeys("dt", "t"),
+    **dict.fromkeys("fvw", "f"),
+    **dict.fromkeys("gj", "j"),
+    **dict.fromkeys("sxz", "s"),
+    **dict.fromkeys("mn", "n"),
+    "l": "l",
+    "r": "r",
+}
+
+
+def _phonetic_key(word: str) -> str:
+    """Clé phonétique grossière d'un mot normalisé : "viktor" et "victor" -> "fktr"."""
+    word = word.replace("ph", "f").replace("h", "")
+    if not word:
+        return ""
+    # une voyelle initiale compte, les suivantes non ("hugo" -> "aj", "ugo" -> "aj")
+    key = "a" if word[0] in "aeiouy" else ""
+    for char in word:
+        code = _PHONETIC_CLASSES.get(char, char if char.isdigit() else "")
+        if code and not key.endswith(code):
+            key += code
+    return key[:4]
+
+
+def author_block_keys(key: str) -> Set[str]:
+    """Clés de blocage d'un nom normalisé : préfixe de 3 lettres et clé phonétique de chaque mot.
+
+    Deux noms ne sont comparés que s'ils partagent au moins une clé ; les initiales
+    (mots d'une lettre) n'en produisent pas.
+
+    Args:
+        key (str): Un nom normalisé par normalize_author_name.
+
+    Returns:
+        Set[str]: Les clés de blocage, par exemple "victor hugo" -> {"p:vic", "s:fktr", "p:hug", "s:aj"}.
+    """
+    blocks = set()
+    for word in key.split():
+        if len(word) < 2:
+            continue
+        blocks.add(f"p:{word[:3]}")
+        blocks.add(f"s:{_phonetic_key(word)}")
+    return blocks
+
+
+# index préparé d'un AuthorFuzzMatcher : noms, clés normalisées et seaux de blocage (clé -> positions)
+_FuzzIndex = Tuple[List[str], List[str], Dict[str, List[int]]]
+
 
 class AuthorFuzzMatcher:
-    def __init__(self, reference_authors: Optional[List[str]] = None) -> None:
+    def __init__(self, reference_authors: Optional[Iterable[str]] = None) -> None:
         """Initializes an AuthorFuzzMatcher with a list of known author names.
 
+        Normalized keys and blocking buckets are computed once, on the first match,
+        then kept up to date by add_reference_author and discard_reference_author.
+
         Args:
-            reference_authors (Optional[List[str]]): A list of known author names. Defaults to None.
+            reference_authors (Optional[Iterable[str]]): Known author names. Defaults to None.
         """
         self.reference_authors = set(reference_authors) if reference_authors else set()
+        # remplacé d'un bloc sous le verrou : un appel en cours garde l'index qu'il a lu
+        self._index: Optional[_FuzzIndex] = None
+        self._lock = threading.Lock()
 
     def add_reference_author(self, author: str) -> None:
         """Adds a new reference author to the set.
@@ -54,7 +300,156 @@ class AuthorFuzzMatcher:
         Args:
             author (str): The author name to be added.
         """
-        self.reference_authors.add(author.strip())
+        author = author.strip()
+        with self._lock:
+            if author in self.reference_authors:
+                return
+            self.reference_authors.add(author)
+            if self._index is not None:
+                self._append(self._index, author)
+
+    def discard_reference_author(self, author: str) -> None:
+        """Removes a reference author from the set, if present.
+
+        Args:
+            author (str): The author name to be removed.
+        """
+        with self._lock:
+            if author.strip() in self.reference_authors:
+                self.reference_authors.discard(author.strip())
+                # rare : nouvel index construit à part, les appels en cours lisent l'ancien
+                if self._index is not None:
+                    self._index = self._build_index()
+
+    @staticmethod
+    def _append(index: _FuzzIndex, author: str) -> None:
+        """Ajoute un nom à l'index préparé (appelé sous le verrou).
+
+        La clé est ajoutée avant le nom, et le nom avant ses positions de blocage : un appel
+        concurrent ne voit jamais une position sans nom ni un nom sans clé.
+        """
+        names, keys, blocks = index
+        position = len(names)
+        key = normalize_author_name(author)
+        keys.append(key)
+        names.append(author)
+        for block in author_block_keys(key):
+            blocks.setdefault(block, []).append(position)
+
+    def _build_index(self) -> _FuzzIndex:
+        """Construit un index préparé (ordre trié : résultats reproductibles)."""
+        index: _FuzzIndex = ([], [], {})
+        for author in sorted(self.reference_authors):
+            self._append(index, author)
+        return index
+
+    def _prepare(self) -> _FuzzIndex:
+        """Retourne l'index préparé, construit s'il ne l'est pas."""
+        with self._lock:
+            if self._index is None or len(self._index[0]) != len(
+                self.reference_authors
+            ):
+                self._index = self._build_index()
+            return self._index
+
+    @staticmethod
+    def _candidates(index: _FuzzIndex, key: str) -> Optional[List[int]]:
+        """Positions des références à scorer pour `key` (None : toutes, index trop petit)."""
+        names, _, blocks = index
+        if len(names) < FUZZ_BLOCKING_MIN_SIZE:
+            return None
+        positions = set()
+        for block in author_block_keys(key):
+            positions.update(blocks.get(block, ()))
+        return sorted(positions)
+
+    @staticmethod
+    def _score_batch(
+        index: _FuzzIndex,
+        keys: List[str],
+        candidates: List[Optional[List[int]]],
+    ) -> List[Tuple[Optional[str], int]]:
+        """Meilleure référence et score pour chaque clé normalisée, parmi ses candidats."""
+        names, reference_keys, _ = index
+        results: List[Tuple[Optional[str], int]] = [(None, 0)] * len(keys)
+        # taille lue une fois : les noms ajoutés pendant l'appel sont ignorés
+        size = len(names)
+        if any(positions is None for positions in candidates):
+            columns = list(range(size))
+        else:
+            columns = sorted(set().union(*candidates))
+        if not columns:
+            return results
+        candidates = [columns if p is None else p for p in candidates]
+        if not RAPIDFUZZ_AVAILABLE:
+            # mêmes clés normalisées que rapidfuzz, sans autre prétraitement
+            for i, positions in enumerate(candidates):
+                choices = [reference_keys[p] for p in positions]
+                if choices:
+                    best_key, score = process.extractOne(
+                        keys[i], choices, scorer=fuzz.token_set_ratio, processor=None
+                    )
+                    results[i] = (names[positions[choices.index(best_key)]], score)
+            return results
+        # candidats peu partagés entre les noms : la matrice serait surtout du calcul perdu
+        if len(keys) * len(columns) > 4 * sum(len(p) for p in candidates):
+            for i, positions in enumerate(candidates):
+                if positions:
+                    _, score, best = rapid_process.extractOne(
+                        keys[i],
+                        [reference_keys[p] for p in positions],
+                        scorer=rapid_fuzz.token_set_ratio,
+                        processor=None,
+                    )
+                    results[i] = (names[positions[best]], int(round(score)))
+            return results
+        # une seule matrice noms x union des candidats, calculée en C++
+        column_of = {position: column for column, position in enumerate(columns)}
+        scores = rapid_process.cdist(
+            keys,
+            [reference_keys[position] for position in columns],
+            scorer=rapid_fuzz.token_set_ratio,
+            processor=None,
+            workers=-1,
+        )
+        for i, positions in enumerate(candidates):
+            if positions:
+                row = scores[i, [column_of[p] for p in positions]]
+                best = int(row.argmax())
+                results[i] = (names[positions[best]], int(round(row[best])))
+        return results
+
+    def match_many(
+        self, names: Iterable[str], min_score: int = 80
+    ) -> List[Tuple[Optional[str], int]]:
+        """Finds the best matching reference author for each name, in a few batched scoring passes.
+
+        Names are normalized (see normalize_author_name) and only compared with the references
+        sharing a blocking key (see author_block_keys) once there are FUZZ_BLOCKING_MIN_SIZE
+        references or more; survivors are scored with token set ratio.
+
+        Args:
+            names (Iterable[str]): The names to match against the reference authors.
+            min_score (int, optional): The minimal score required for a match. Defaults to 80.
+
+        Returns:
+            List[Tuple[Optional[str], int]]: One (best matching author or None, score) tuple per name, in input order.
+        """
+        names = list(names)
+        results: List[Tuple[Optional[str], int]] = [(None, 0)] * len(names)
+        if not self.reference_authors:
+            return results
+        index = self._prepare()
+        queries = [i for i, name in enumerate(names) if name]
+        for start in range(0, len(queries), FUZZ_BATCH_SIZE):
+            batch = queries[start : start + FUZZ_BATCH_SIZE]
+            keys = [normalize_author_name(names[i]) for i in batch]
+            scored = self._score_batch(
+                index, keys, [self._candidates(index, k) for k in keys]
+            )
+            for i, (best_match, score) in zip(batch, scored):
+                results[i] = (best_match if score >= min_score else None, score)
+        return results
 
     def find_best_match(
         self, name: str, min_score: int = 80
@@ -70,12 +465,7 @@ class AuthorFuzzMatcher:
         """
         if not name or not self.reference_authors:
             return None, 0
-        best_match, score = process.extractOne(
-            name, self.reference_authors, scorer=fuzz.token_set_ratio
-        )
-        if score >= min_score:
-            return best_match, score
-        return None, score
+        return self.match_many([name], min_score=min_score)[0]
 
 
 # %% py mongo helper auteurs.ipynb 8
@@ -129,12 +519,182 @@ def google_search(query: str) -> Optional[List[Dict[str, Optional[str]]]]:
 
 
 # %% py mongo helper auteurs.ipynb 9
-from typing import List, Optional, Union, Dict
+from typing import Any, List, Optional, Union, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import hashlib
+import time
 from mongo_episode import Episode
 from llm import get_azure_llm
 from llama_index.core.llms import ChatMessage
 import json
 
+AUTHOR_RESOLUTIONS_COLLECTION = "author_resolutions"
+# validité d'une résolution llm / web search ; un verdict négatif est revu plus tôt
+AUTHOR_RESOLUTION_TTL = timedelta(days=180)
+AUTHOR_RESOLUTION_NEGATIVE_TTL = timedelta(days=30)
+
+
+class AuthorResolutionCache:
+    """
+    Cache persistant des noms résolus par llm ou web search (collection author_resolutions).
+
+    Un document par nom normalisé (voir normalize_author_name), en _id : verdict ("found" ou
+    "not_found"), nom corrigé, source, certitude, analyse et date d'expiration. L'index TTL sur
+    expires_at (voir INDEX_SPECS) purge les entrées expirées ; get() les ignore en attendant.
+    """
+
+    def __init__(self, collection_name: str = AUTHOR_RESOLUTIONS_COLLECTION) -> None:
+        """
+        Args:
+            collection_name (str, optional): La collection du cache. Défaut "author_resolutions".
+        """
+        self.collection_name = collection_name
+
+    def __repr__(self) -> str:
+        return f"AuthorResolutionCache({self.collection_name})"
+
+    def _get_collection(self):
+        DB_HOST, DB_NAME, _ = get_DB_VARS()
+        return get_collection(
+            target_db=DB_HOST, client_name=DB_NAME, collection_name=self.collection_name
+        )
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Retourne la résolution encore valide de `name` (positive ou négative), sinon None."""
+        key = normalize_author_name(name)
+        if not key:
+            return None
+        return self._get_collection().find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}}
+        )
+
+    def put(self, details: Dict[str, Any]) -> None:
+        """
+        Enregistre le résultat de check_author pour le nom d'origine (remplace l'existant).
+
+        Args:
+            details (Dict[str, Any]): Le dictionnaire de check_author (author_original,
+                author_corrected, source, et éventuellement score et analyse).
+        """
+        key = normalize_author_name(details["author_original"])
+        if not key:
+            return
+        found = details.get("author_corrected") is not None
+        now = datetime.now(timezone.utc)
+        ttl = AUTHOR_RESOLUTION_TTL if found else AUTHOR_RESOLUTION_NEGATIVE_TTL
+        self._get_collection().update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    "author_original": details["author_original"],
+                    "author_corrected": details.get("author_corrected"),
+                    "verdict": "found" if found else "not_found",
+                    "source": details.get("source"),
+                    "score": details.get("score"),
+                    "analyse": details.get("analyse", ""),
+                    "resolved_at": now,
+                    "expires_at": now + ttl,
+                }
+            },
+            upsert=True,
+        )
+
+    def invalidate(self, name: str) -> None:
+        """Supprime la résolution de `name` : il sera de nouveau vérifié par llm / web search."""
+        self._get_collection().delete_one({"_id": normalize_author_name(name)})
+
+
+_author_resolution_cache = AuthorResolutionCache()
+
+
+def get_author_resolution_cache() -> AuthorResolutionCache:
+    """Retourne le cache partagé des résolutions d'auteurs (voir AuthorResolutionCache)."""
+    return _author_resolution_cache
+
+
+# vérifications simultanées par AuthorChecker.check_authors
+AUTHOR_CHECK_WORKERS = 4
+# limites par fournisseur, partagées par tous les AuthorChecker du processus :
+# appels simultanés et intervalle minimal entre deux départs (quota Custom Search : 100/min)
+PROVIDER_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "azure": {"concurrency": 4, "min_interval_s": 0.2},
+    "google": {"concurrency": 2, "min_interval_s": 0.6},
+}
+
+
+class RateLimiter:
+    """
+    Limite les appels à un fournisseur, à utiliser autour de chaque appel (with limiter: ...).
+
+    Au plus `concurrency` appels en cours, et deux départs espacés d'au moins `min_interval_s`.
+    """
+
+    def __init__(self, concurrency: int = 1, min_interval_s: float = 0.0) -> None:
+        """
+        Args:
+            concurrency (int, optional): Nombre d'appels simultanés. Défaut 1.
+            min_interval_s (float, optional): Intervalle minimal entre deux départs. Défaut 0.
+        """
+        self.concurrency = max(1, int(concurrency))
+        self.min_interval_s = max(0.0, min_interval_s)
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(concurrency={self.concurrency}, min_interval_s={self.min_interval_s})"
+
+    def __enter__(self) -> "RateLimiter":
+        self._slots.acquire()
+        # chaque appel réserve son créneau de départ sous le verrou, puis attend hors verrou
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval_s
+        if start > now:
+            time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._slots.release()
+
+
+_rate_limiters: Dict[str, RateLimiter] = {
+    provider: RateLimiter(**limits) for provider, limits in PROVIDER_RATE_LIMITS.items()
+}
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Retourne le limiteur partagé du fournisseur ("azure" ou "google", voir PROVIDER_RATE_LIMITS)."""
+    return _rate_limiters[provider]
+
+
+# noms cités dans le titre et la description, par épisode : {episode_oid, text_hash, authors}
+EPISODE_AUTHORS_COLLECTION = "episode_authors"
+
+_author_llm = None
+_author_llm_lock = threading.Lock()
+
+
+def get_author_llm():
+    """Retourne le client Azure OpenAI ("gpt-4o") des AuthorChecker, créé au premier appel puis réutilisé."""
+    global _author_llm
+    with _author_llm_lock:
+        if _author_llm is None:
+            _author_llm = get_azure_llm("gpt-4o")
+        return _author_llm
+
+
+def get_episode_authors_collection():
+    """Retourne la collection où sont mémorisés les noms extraits du titre et de la description."""
+    DB_HOST, DB_NAME, _ = get_DB_VARS()
+    return get_collection(
+        target_db=DB_HOST,
+        client_name=DB_NAME,
+        collection_name=EPISODE_AUTHORS_COLLECTION,
+    )
+
 
 class AuthorChecker:
     """Class to verify and correct an author's name using multiple data sources.
@@ -153,8 +713,58 @@ class AuthorChecker:
             episode (Episode): An episode instance containing title and description.
         """
         self.episode = episode
-        self.llm_structured_output = get_azure_llm("gpt-4o")
-        self.authors_titre_description = self._get_authors_from_titre_description()
+        # extraits du titre et de la description au premier besoin (étape 1 de check_author)
+        self._authors_titre_description: Optional[List[str]] = None
+        self._authors_lock = threading.Lock()
+
+    @property
+    def llm_structured_output(self):
+        """The Azure OpenAI client shared by all checkers (see get_author_llm)."""
+        return get_author_llm()
+
+    @property
+    def authors_titre_description(self) -> List[str]:
+        """Names cited in the episode title and description, extracted on first access.
+
+        The extraction is memoized per episode in MongoDB (EPISODE_AUTHORS_COLLECTION) together
+        with a hash of the title and description: it is only redone when they change.
+
+        Returns:
+            List[str]: The names extracted from the title and description.
+        """
+        with self._authors_lock:
+            if self._authors_titre_description is None:
+                self._authors_titre_description = self._load_authors_titre_description()
+            return self._authors_titre_description
+
+    def _load_authors_titre_description(self) -> List[str]:
+        """Lit les noms mémorisés pour l'épisode, ou les extrait par LLM et les mémorise."""
+        titre = self._get_filtered_titre_description("titre")
+        description = self._get_filtered_titre_description("description")
+        text_hash = hashlib.sha1(f"{titre}\n{description}".encode("utf-8")).hexdigest()
+        oid = self.episode.get_oid()
+        if oid is None:
+            return self._get_authors_from_titre_description() or []
+        collection = get_episode_authors_collection()
+        document = collection.find_one({"episode_oid": oid})
+        if document and document.get("text_hash") == text_hash:
+            return document.get("authors", [])
+        authors = self._get_authors_from_titre_description()
+        # échec de l'appel ou réponse illisible : rien n'est mémorisé
+        if authors is None:
+            return []
+        collection.update_one(
+            {"episode_oid": oid},
+            {
+                "$set": {
+                    "text_hash": text_hash,
+                    "authors": authors,
+                    "extracted_at": datetime.now(timezone.utc),
+                }
+            },
+            upsert=True,
+        )
+        return authors
 
     def _get_filtered_titre_description(self, titre_or_description: str) -> str:
         """Filter the given titre or description to avoid Error 400.
@@ -187,11 +797,12 @@ class AuthorChecker:
                 text = text.replace(key, value)
         return text
 
-    def _get_authors_from_titre_description(self) -> List[str]:
+    def _get_authors_from_titre_description(self) -> Optional[List[str]]:
         """Retrieves a list of author names extracted from the episode title and description using LLM.
 
         Returns:
-            List[str]: A list of author names extracted from the title and description.
+            Optional[List[str]]: A list of author names extracted from the title and description,
+                or None if the LLM call failed or its answer could not be parsed.
         """
         response_schema = {
             "type": "json_schema",
@@ -216,29 +827,30 @@ class AuthorChecker:
         try:
             titre = self._get_filtered_titre_description("titre")
             description = self._get_filtered_titre_description("description")
-            response = self.llm_structured_output.chat(
-                messages=[
-                    ChatMessage(
-                        role="system",
-                        content="Tu es un assistant utile qui retourne une liste JSON de noms.",
-                    ),
-                    ChatMessage(
-                        role="user",
-                        content=f"Est-ce que tu peux me lister tous les noms qui sont cités dans le titre et la description de l'épisode suivant : {titre} {description}. ",
-                    ),
-                ],
-                response_format=response_schema,
-            )
+            with get_rate_limiter("azure"):
+                response = self.llm_structured_output.chat(
+                    messages=[
+                        ChatMessage(
+                            role="system",
+                            content="Tu es un assistant utile qui retourne une liste JSON de noms.",
+                        ),
+                        ChatMessage(
+                            role="user",
+                            content=f"Est-ce que tu peux me lister tous les noms qui sont cités dans le titre et la description de l'épisode suivant : {titre} {description}. ",
+                        ),
+                    ],
+                    response_format=response_schema,
+                )
         except Exception as e:
             print(f"Error getting authors from titre/description: {e}")
             print(f"prompt: {titre} {description}")
-            return []
+            return None
         try:
             json_dict = json.loads(response.message.content)
         except json.JSONDecodeError as e:
             print("Error parsing JSON:", e)
             print("Raw response:", response.message.content)
-            return []  # Return an empty list if parsing fails
+            return None  # Return None if parsing fails
         return json_dict["Authors_TitreDescription"]
 
     def _get_authors_from_llm(self, autor: str) -> List[str]:
@@ -287,16 +899,17 @@ class AuthorChecker:
         """
         )
 
-        response = self.llm_structured_output.chat(
-            messages=[
-                ChatMessage(
-                    role="system",
-                    content="Tu es un agent litteraire qui connait parfaitement les auteurs.",
-                ),
-                ChatMessage(role="user", content=f"{prompt}. "),
-            ],
-            response_format=response_schema,
-        )
+        with get_rate_limiter("azure"):
+            response = self.llm_structured_output.chat(
+                messages=[
+                    ChatMessage(
+                        role="system",
+                        content="Tu es un agent litteraire qui connait parfaitement les auteurs.",
+                    ),
+                    ChatMessage(role="user", content=f"{prompt}. "),
+                ],
+                response_format=response_schema,
+            )
 
         try:
             json_dict = json.loads(response.message.content)
@@ -317,8 +930,13 @@ class AuthorChecker:
                 - "auteur": The corrected author name if applicable.
                 - "certitude": An integer between 0 and 100 indicating the confidence.
                 - "analyse": A textual analysis of the Google search query.
+            An empty dictionary if the search failed (transient error) or the analysis is unreadable.
         """
-        result_google = google_search(author)
+        with get_rate_limiter("google"):
+            result_google = google_search(author)
+        if result_google is None:
+            # erreur de recherche : pas d'analyse de "None", ni de verdict à mettre en cache
+            return {}
 
         prompt_incertitude_auteur = f"""
         Voici le resultat d'une requete google concernant un probable auteur inconnu de mon llm : {author}
@@ -365,19 +983,20 @@ class AuthorChecker:
             },
         }
 
-        response = self.llm_structured_output.chat(
-            messages=[
-                ChatMessage(
-                    role="system",
-                    content="Tu es un assistant utile qui analyse des requetes Google pour y deceler si un auteur de livre s'y cache.",
-                ),
-                ChatMessage(
-                    role="user",
-                    content=prompt_incertitude_auteur,
-                ),
-            ],
-            response_format=response_schema,
-        )
+        with get_rate_limiter("azure"):
+            response = self.llm_structured_output.chat(
+                messages=[
+                    ChatMessage(
+                        role="system",
+                        content="Tu es un assistant utile qui analyse des requetes Google pour y deceler si un auteur de livre s'y cache.",
+                    ),
+                    ChatMessage(
+                        role="user",
+                        content=prompt_incertitude_auteur,
+                    ),
+                ],
+                response_format=response_schema,
+            )
         try:
             json_dict = json.loads(response.message.content)
         except json.JSONDecodeError as e:
@@ -387,18 +1006,22 @@ class AuthorChecker:
         return json_dict
 
     def _check_author_source(
-        self, author: str, authors_list: List[str]
+        self, author: str, authors_list: Union[List[str], AuthorFuzzMatcher]
     ) -> Optional[str]:
         """Determines the best matching author from a provided list using fuzzy matching.
 
         Args:
             author (str): The author name to match.
-            authors_list (List[str]): A list of author names to check against.
+            authors_list (Union[List[str], AuthorFuzzMatcher]): A list of author names to check against,
+                or an already prepared matcher (reused as is).
 
         Returns:
             Optional[str]: The best matching author name if the match score is above the threshold, otherwise None.
         """
-        matcher = AuthorFuzzMatcher(authors_list)
+        if isinstance(authors_list, AuthorFuzzMatcher):
+            matcher = authors_list
+        else:
+            matcher = AuthorFuzzMatcher(authors_list)
         best_match, score = matcher.find_best_match(author)
         if score >= score_fuzz_threshold:
             return best_match
@@ -416,6 +1039,13 @@ class AuthorChecker:
           3. LLM suggested names
           4. Web search analysis
 
+        A name already known in MongoDB (same normalized name) is returned before step 1,
+        so the title and description are only sent to the LLM when step 1 is needed.
+
+        Results of steps 3 and 4, including unresolved names, are stored in the persistent
+        resolution cache (see AuthorResolutionCache), read right after that exact lookup and
+        before any LLM or web call. A failed Google search is not cached.
+
         Args:
             author (str): The author name to verify.
             return_details (bool, optional): If True, returns a detailed dictionary with source and analysis. Defaults to False.
@@ -427,6 +1057,33 @@ class AuthorChecker:
         """
         details = {"author_original": author, "author_corrected": None, "source": None}
 
+        # nom déjà connu en base (correspondance exacte du nom normalisé) : aucun appel llm
+        author_index = get_author_index()
+        match = author_index.get(author)
+        if match:
+            details["author_corrected"] = match
+            details["source"] = "mongodb:auteurs"
+            if verbose:
+                print(f"Trouvé avec mongodb:auteurs: {match}")
+            return details if return_details else match
+
+        # résolutions llm / web search déjà faites, négatives comprises : lues avant
+        # l'extraction llm du titre et de la description (étape 1)
+        resolution_cache = get_author_resolution_cache()
+        cached = resolution_cache.get(author)
+        if cached:
+            details.update(
+                {
+                    "author_corrected": cached.get("author_corrected"),
+                    "score": cached.get("score"),
+                    "analyse": cached.get("analyse", ""),
+                    "source": f"cache:{cached.get('source')}",
+                }
+            )
+            if verbose:
+                print(f"Trouvé dans le cache ({cached.get('verdict')}): {cached}")
+            return details if return_details else details["author_corrected"]
+
         # 1. Vérification dans rss:metadata (titre, description)
         match = self._check_author_source(author, self.authors_titre_description)
         if match:
@@ -436,9 +1093,8 @@ class AuthorChecker:
                 print(f"Trouvé avec rss:metadata: {match}")
             return details if return_details else match
 
-        # 2. Vérification dans la base de données (mongodb:auteurs)
-        list_db_auteurs = [auteur.nom for auteur in Auteur.get_entries()]
-        match = self._check_author_source(author, list_db_auteurs)
+        # 2. Vérification dans la base de données (mongodb:auteurs), via l'index en mémoire
+        match = self._check_author_source(author, author_index.matcher())
         if match:
             details["author_corrected"] = match
             details["source"] = "mongodb:auteurs"
@@ -448,10 +1104,14 @@ class AuthorChecker:
 
         # 3. Vérification via llm
         list_llm_auteurs = self._get_authors_from_llm(author)
-        match = self._check_author_source(author, list_llm_auteurs)
+        match, score = AuthorFuzzMatcher(list_llm_auteurs).find_best_match(
+            author, min_score=score_fuzz_threshold
+        )
         if match:
             details["author_corrected"] = match
+            details["score"] = score
             details["source"] = "llm"
+            resolution_cache.put(details)
             if verbose:
                 print(f"Trouvé avec llm: {match}")
             return details if return_details else match
@@ -469,6 +1129,7 @@ class AuthorChecker:
             }
         )
         if score >= score_fuzz_threshold:
+            resolution_cache.put(details)
             if verbose:
                 print(f"Trouvé avec web search: {match}")
             return details if return_details else match
@@ -478,4 +1139,50 @@ class AuthorChecker:
                     f"Score insuffisant {score} avec web search: {web_result_dict.get('analyse', '')}"
                 )
             details["author_corrected"] = None
+            # recherche en erreur ou réponse illisible (web_result_dict vide) : rien n'est mis en cache
+            if web_result_dict:
+                resolution_cache.put(details)
             return details if return_details else None
+
+    def check_authors(
+        self,
+        authors: List[str],
+        return_details: bool = False,
+        verbose: bool = False,
+        max_workers: int = AUTHOR_CHECK_WORKERS,
+    ) -> List[Union[str, Dict[str, Union[str, int]], None]]:
+        """Verifies several author names concurrently, see check_author.
+
+        Names are checked in a thread pool of at most `max_workers` threads; LLM and Google calls
+        are throttled per provider (see PROVIDER_RATE_LIMITS). Duplicate names are checked once.
+
+        Args:
+            authors (List[str]): The author names to verify.
+            return_details (bool, optional): If True, returns detailed dictionaries. Defaults to False.
+            verbose (bool, optional): If True, prints debug messages. Defaults to False.
+            max_workers (int, optional): Maximum number of concurrent checks. Defaults to AUTHOR_CHECK_WORKERS.
+
+        Returns:
+            List[Union[str, Dict[str, Union[str, int]], None]]: One check_author result per name, in input order.
+        """
+        unique_authors = list(dict.fromkeys(authors))
+        if not unique_authors:
+            return []
+        workers = max(1, min(max_workers, len(unique_authors)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = dict(
+                zip(
+                    unique_authors,
+                    pool.map(
+                        lambda author: self.check_author(
+                            author, return_details=return_details, verbose=verbose
+                        ),
+                        unique_authors,
+                    ),
+                )
+            )
+        # une copie par occurrence : les doublons ne partagent pas le même dictionnaire
+        return [
+            dict(results[author]) if return_details else results[author]
+            for author in authors
+        ]
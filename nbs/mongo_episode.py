@@ -2,18 +2,55 @@
 
 # %% auto #0
 __all__ = [
+    "WHISPER_MODEL_ID",
+    "WHISPER_SAMPLING_RATE",
+    "WHISPER_CPP_MODES",
+    "WHISPER_SERVER_PORT",
     "DATE_FORMAT",
     "LOG_DATE_FORMAT",
+    "TRANSCRIPTIONS_COLLECTION",
+    "TRANSCRIPTIONS_STORAGE_ENGINE",
     "RSS_DUREE_MINI_MINUTES",
     "RSS_DATE_FORMAT",
     "AUDIO_TYPES",
+    "ZERO_SHOT_MODEL_ID",
+    "RSS_TYPE_LABELS",
+    "RSS_TYPE_KEYWORDS",
+    "RSS_LEXICAL_MIN_SCORE",
+    "RSS_LEXICAL_MIN_MARGIN",
+    "EPISODE_TYPE_TIERS",
     "WEB_DATE_FORMAT",
+    "MISSING_TRANSCRIPTION_QUERY",
+    "TRANSCRIPTION_QUERY",
+    "VISIBLE_QUERY",
+    "get_whisper_model",
+    "get_whisper_pipeline",
+    "unload_whisper_models",
+    "load_audio",
+    "detect_speech_regions",
+    "SpeechTrim",
+    "trim_silences",
+    "load_speech",
     "WhisperCppError",
+    "WhisperCppServer",
+    "get_whisper_cpp_server",
+    "stop_whisper_cpp_server",
     "prevent_sleep",
     "extract_whisper_cpp",
     "extract_whisper",
+    "iter_audio_chunks",
+    "merge_chunk_transcripts",
+    "transcribe_long_audio",
     "extract_whisper_long",
+    "get_transcriptions_collection",
+    "load_transcriptions",
+    "store_transcription",
     "Episode",
+    "get_zero_shot_classifier",
+    "classify_episode_type_lexical",
+    "classify_episode_types_with_tier",
+    "classify_episode_types",
+    "get_episode_type_stats",
     "RSS_episode",
     "WEB_episode",
     "Episodes",
@@ -22,13 +59,16 @@ __all__ = [
 # %% py mongo helper episodes.ipynb #b2391a04
 import torch
 from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
-from pydub import AudioSegment
 import tempfile
 import os
+import numpy as np
 import soundfile as sf
 import subprocess
 import shutil
 import urllib.request
+import atexit
+import io
+import requests
 from pathlib import Path
 
 # from datasets import load_dataset
@@ -42,7 +82,348 @@ except ImportError:
     DBUS_AVAILABLE = False
 
 from functools import wraps
-from typing import Callable, Any, Optional, Tuple
+from typing import Callable, Any, Dict, Iterator, List, Optional, Tuple, Union
+import bisect
+import gc
+import time
+import math
+import re
+import threading
+
+from config import get_settings, get_WHISPER_VARS
+
+WHISPER_MODEL_ID: str = "openai/whisper-large-v3-turbo"
+WHISPER_SAMPLING_RATE: int = 16000
+
+_whisper_models: Dict[Tuple[str, str, str], Tuple[Any, Any]] = {}
+_whisper_pipelines: Dict[Tuple[str, str, str], Any] = {}
+_whisper_lock = threading.Lock()
+
+
+def _get_whisper_device(
+    device: Optional[str] = None, dtype: Optional[Any] = None
+) -> Tuple[str, Any]:
+    """Retourne le device et le dtype à utiliser (GPU en float16 si disponible, sinon CPU en float32)."""
+    if device is None:
+        device = "cuda:0" if torch.cuda.is_available() else "cpu"
+    if dtype is None:
+        dtype = torch.float16 if device.startswith("cuda") else torch.float32
+    return device, dtype
+
+
+def get_whisper_model(
+    model_id: str = WHISPER_MODEL_ID,
+    device: Optional[str] = None,
+    dtype: Optional[Any] = None,
+) -> Tuple[Any, Any]:
+    """
+    Retourne le modèle Whisper et son processor, chargés une seule fois par processus.
+
+    Le couple (modèle, processor) est mis en cache par (model_id, dtype, device) et reste
+    en mémoire entre deux transcriptions jusqu'à l'appel de unload_whisper_models.
+
+    Args:
+        model_id (str): Identifiant Hugging Face du modèle. Défaut: WHISPER_MODEL_ID.
+        device (Optional[str]): "cuda:0" ou "cpu". Par défaut, le GPU s'il est disponible.
+        dtype (Optional[Any]): dtype torch. Par défaut float16 sur GPU, float32 sur CPU.
+
+    Returns:
+        Tuple[Any, Any]: Le modèle (déjà déplacé sur le device) et le processor.
+    """
+    device, dtype = _get_whisper_device(device, dtype)
+    key = (model_id, str(dtype), device)
+    with _whisper_lock:
+        if key not in _whisper_models:
+            model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                model_id, dtype=dtype, low_cpu_mem_usage=True, use_safetensors=True
+            )
+            model.to(device)
+            processor = AutoProcessor.from_pretrained(model_id)
+            _whisper_models[key] = (model, processor)
+        return _whisper_models[key]
+
+
+def get_whisper_pipeline(
+    model_id: str = WHISPER_MODEL_ID,
+    device: Optional[str] = None,
+    dtype: Optional[Any] = None,
+) -> Any:
+    """
+    Retourne la pipeline "automatic-speech-recognition" construite sur le modèle en cache.
+
+    Args:
+        model_id (str): Identifiant Hugging Face du modèle. Défaut: WHISPER_MODEL_ID.
+        device (Optional[str]): "cuda:0" ou "cpu". Par défaut, le GPU s'il est disponible.
+        dtype (Optional[Any]): dtype torch. Par défaut float16 sur GPU, float32 sur CPU.
+
+    Returns:
+        Any: La pipeline Hugging Face, mise en cache avec le modèle.
+    """
+    device, dtype = _get_whisper_device(device, dtype)
+    key = (model_id, str(dtype), device)
+    model, processor = get_whisper_model(model_id, device, dtype)
+    with _whisper_lock:
+        if key not in _whisper_pipelines:
+            _whisper_pipelines[key] = pipeline(
+                "automatic-speech-recognition",
+                model=model,
+                tokenizer=processor.tokenizer,
+                feature_extractor=processor.feature_extractor,
+                dtype=dtype,
+                device=device,
+            )
+        return _whisper_pipelines[key]
+
+
+def unload_whisper_models() -> None:
+    """Décharge tous les modèles et pipelines Whisper en cache pour libérer la mémoire."""
+    with _whisper_lock:
+        _whisper_pipelines.clear()
+        _whisper_models.clear()
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def load_audio(
+    audio_filename: str, sampling_rate: int = WHISPER_SAMPLING_RATE, vad: bool = False
+) -> np.ndarray:
+    """Décode un fichier audio en un signal mono float32 rééchantillonné.
+
+    Le décodage se fait en un seul passage ffmpeg, directement en mémoire (sans fichier WAV
+    intermédiaire). La fonction est sans état et peut donc être exécutée dans un pool de processus.
+
+    Args:
+        audio_filename (str): Chemin du fichier audio (mp3, m4a, wav...).
+        sampling_rate (int, optional): Fréquence d'échantillonnage cible. Défaut 16000 (attendu par Whisper).
+        vad (bool, optional): Si True, ne garde que les zones de parole (voir trim_silences).
+            La correspondance des temps est alors perdue : utiliser load_speech pour la garder.
+            Défaut False.
+
+    Returns:
+        np.ndarray: Signal mono float32 (lecture seule) à la fréquence demandée.
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg est requis pour décoder les fichiers audio.")
+    command = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(audio_filename),
+        "-f",
+        "f32le",
+        "-acodec",
+        "pcm_f32le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sampling_rate),
+        "-",
+    ]
+    completed = subprocess.run(command, capture_output=True, check=False)
+    if completed.returncode != 0:
+        stderr = completed.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg n'a pas pu décoder '{audio_filename}': {stderr}")
+    audio = np.frombuffer(completed.stdout, dtype=np.float32)
+    if vad:
+        return trim_silences(audio, sampling_rate=sampling_rate).audio
+    return audio
+
+
+def detect_speech_regions(
+    audio: np.ndarray,
+    sampling_rate: int = WHISPER_SAMPLING_RATE,
+    frame_ms: int = 30,
+    threshold_db: float = -40.0,
+    min_silence_s: float = 0.5,
+    min_speech_s: float = 0.25,
+    padding_s: float = 0.2,
+) -> List[Tuple[int, int]]:
+    """Détecte les zones de parole d'un signal à partir de l'énergie de trames courtes.
+
+    Une trame est considérée comme active si son niveau RMS dépasse `threshold_db` (dBFS).
+    Les silences plus courts que `min_silence_s` sont conservés (pauses de parole), les zones
+    actives plus courtes que `min_speech_s` sont ignorées (clics), puis chaque zone est
+    élargie de `padding_s` pour ne pas couper le début ou la fin des mots.
+
+    Args:
+        audio (np.ndarray): Signal mono float32.
+        sampling_rate (int, optional): Fréquence d'échantillonnage. Défaut 16000.
+        frame_ms (int, optional): Durée d'une trame en millisecondes. Défaut 30.
+        threshold_db (float, optional): Seuil d'activité en dBFS. Défaut -40.
+        min_silence_s (float, optional): Durée minimale d'un silence retiré. Défaut 0.5.
+        min_speech_s (float, optional): Durée minimale d'une zone de parole. Défaut 0.25.
+        padding_s (float, optional): Marge ajoutée autour de chaque zone. Défaut 0.2.
+
+    Returns:
+        List[Tuple[int, int]]: Zones (début, fin) en échantillons, triées et disjointes.
+    """
+    frame_len = max(1, int(sampling_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame_len
+    if n_frames == 0:
+        return [(0, len(audio))] if len(audio) else []
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    active = 20 * np.log10(rms + 1e-10) > threshold_db
+
+    regions: List[Tuple[int, int]] = []
+    max_gap = int(min_silence_s * sampling_rate)
+    for frame in np.flatnonzero(active):
+        start, end = frame * frame_len, (frame + 1) * frame_len
+        if regions and start - regions[-1][1] < max_gap:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    if regions and regions[-1][1] == n_frames * frame_len:
+        # la dernière trame incomplète suit la zone qui touche la fin du signal
+        regions[-1] = (regions[-1][0], len(audio))
+
+    padding = int(padding_s * sampling_rate)
+    min_speech = int(min_speech_s * sampling_rate)
+    padded: List[Tuple[int, int]] = []
+    for start, end in regions:
+        if end - start < min_speech:
+            continue
+        start, end = max(0, start - padding), min(len(audio), end + padding)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end)
+        else:
+            padded.append((start, end))
+    return padded
+
+
+class SpeechTrim:
+    """
+    Signal réduit à ses zones de parole, avec la correspondance des temps vers le fichier original.
+
+    Attributes:
+        audio (np.ndarray): Concaténation des zones de parole.
+        regions (List[Tuple[int, int]]): Zones conservées (début, fin) en échantillons du signal original.
+        sampling_rate (int): Fréquence d'échantillonnage.
+        original_length (int): Nombre d'échantillons du signal original.
+    """
+
+    def __init__(
+        self,
+        audio: np.ndarray,
+        regions: List[Tuple[int, int]],
+        sampling_rate: int = WHISPER_SAMPLING_RATE,
+    ) -> None:
+        self.regions = regions
+        self.sampling_rate = sampling_rate
+        self.original_length = len(audio)
+        if len(regions) == 1 and regions[0] == (0, len(audio)):
+            self.audio = audio
+        else:
+            self.audio = np.concatenate(
+                [audio[start:end] for start, end in regions]
+                or [np.zeros(0, dtype=audio.dtype)]
+            )
+        # position de chaque zone dans le signal réduit
+        self._trimmed_starts: List[int] = []
+        position = 0
+        for start, end in regions:
+            self._trimmed_starts.append(position)
+            position += end - start
+
+    def __repr__(self) -> str:
+        return (
+            f"SpeechTrim({len(self.regions)} zones, "
+            f"{self.duration:.1f} s / {self.original_duration:.1f} s)"
+        )
+
+    @property
+    def duration(self) -> float:
+        """Durée du signal réduit en secondes."""
+        return len(self.audio) / self.sampling_rate
+
+    @property
+    def original_duration(self) -> float:
+        """Durée du signal original en secondes."""
+        return self.original_length / self.sampling_rate
+
+    def to_original_time(self, time_s: float, is_end: bool = False) -> float:
+        """Convertit un temps du signal réduit (ex. timestamp Whisper) en temps du fichier original.
+
+        Un temps situé exactement à la jonction de deux zones correspond au début de la zone
+        suivante, ou, avec `is_end`, à la fin de la zone précédente : la fin d'un segment ne
+        s'étend pas sur le silence retiré.
+
+        Args:
+            time_s (float): Temps en secondes dans le signal réduit.
+            is_end (bool, optional): Le temps est la fin d'un segment. Défaut False.
+
+        Returns:
+            float: Temps correspondant en secondes dans le signal original.
+        """
+        if not self.regions:
+            return time_s
+        sample = int(round(time_s * self.sampling_rate))
+        find = bisect.bisect_left if is_end else bisect.bisect_right
+        index = max(0, find(self._trimmed_starts, sample) - 1)
+        start, end = self.regions[index]
+        original = start + sample - self._trimmed_starts[index]
+        return min(original, end) / self.sampling_rate
+
+    def to_original_chunks(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Reporte les timestamps (début, fin) de segments Whisper sur le fichier original.
+
+        Les fins de segment sont converties avec `is_end` (voir to_original_time).
+
+        Args:
+            chunks (List[Dict[str, Any]]): Segments {"text", "timestamp": (début, fin)} en secondes
+                du signal réduit ; une borne None (fin du dernier segment) est conservée.
+
+        Returns:
+            List[Dict[str, Any]]: Copies des segments, timestamps en secondes du fichier original.
+        """
+        return [
+            {
+                **chunk,
+                "timestamp": tuple(
+                    None if time_s is None else self.to_original_time(time_s, is_end)
+                    for time_s, is_end in zip(chunk["timestamp"], (False, True))
+                ),
+            }
+            for chunk in chunks
+        ]
+
+
+def trim_silences(
+    audio: np.ndarray, sampling_rate: int = WHISPER_SAMPLING_RATE, **vad_kwargs: Any
+) -> SpeechTrim:
+    """Retire les silences d'un signal et conserve la correspondance des temps.
+
+    Args:
+        audio (np.ndarray): Signal mono float32.
+        sampling_rate (int, optional): Fréquence d'échantillonnage. Défaut 16000.
+        **vad_kwargs: Paramètres transmis à detect_speech_regions.
+
+    Returns:
+        SpeechTrim: Signal réduit et table de correspondance des temps.
+    """
+    regions = detect_speech_regions(audio, sampling_rate=sampling_rate, **vad_kwargs)
+    return SpeechTrim(audio, regions, sampling_rate=sampling_rate)
+
+
+def load_speech(
+    audio_filename: str, sampling_rate: int = WHISPER_SAMPLING_RATE, **vad_kwargs: Any
+) -> SpeechTrim:
+    """Décode un fichier audio et n'en garde que les zones de parole (voir load_audio et trim_silences).
+
+    Args:
+        audio_filename (str): Chemin du fichier audio.
+        sampling_rate (int, optional): Fréquence d'échantillonnage cible. Défaut 16000.
+        **vad_kwargs: Paramètres transmis à detect_speech_regions.
+
+    Returns:
+        SpeechTrim: Signal réduit, avec la correspondance des temps vers le fichier original.
+    """
+    audio = load_audio(audio_filename, sampling_rate=sampling_rate)
+    return trim_silences(audio, sampling_rate=sampling_rate, **vad_kwargs)
 
 
 class WhisperCppError(RuntimeError):
@@ -64,7 +445,7 @@ def _detect_repo_root() -> Path:
 
 def _get_whisper_cpp_script() -> Path:
     """Retourne le chemin du script whisper.cpp (avec possibilité de surcharge via variable d'environnement)."""
-    override = os.environ.get("WHISPER_CPP_SCRIPT")
+    override = get_settings().whisper_cpp_script
     if override:
         return Path(override).expanduser()
     return _detect_repo_root() / "scripts" / "whisper.cpp" / "whisper.sh"
@@ -72,7 +453,7 @@ def _get_whisper_cpp_script() -> Path:
 
 def _get_models_dir() -> Path:
     """Détermine le dossier des modèles whisper.cpp (env MODELS_DIR ou <repo>/models)."""
-    override = os.environ.get("MODELS_DIR")
+    override = get_settings().models_dir
     if override:
         return Path(override).expanduser()
     return _detect_repo_root() / "models"
@@ -80,13 +461,13 @@ def _get_models_dir() -> Path:
 
 def _get_model_filename() -> str:
     """Nom du fichier modèle (env WHISPER_MODEL_FILENAME ou ggml-large-v3.bin)."""
-    return os.environ.get("WHISPER_MODEL_FILENAME", "ggml-large-v3.bin")
+    return get_settings().whisper_model_filename or "ggml-large-v3.bin"
 
 
 def _get_model_url(model_filename: str) -> str:
     """Construit l'URL de téléchargement du modèle."""
     default_url = f"https://huggingface.co/ggerganov/whisper.cpp/resolve/main/{model_filename}?download=1"
-    return os.environ.get("WHISPER_MODEL_URL", default_url)
+    return get_settings().whisper_model_url or default_url
 
 
 def _ensure_whisper_model() -> Path:
@@ -104,9 +485,10 @@ def _ensure_whisper_model() -> Path:
         tmp_path = Path(tmp.name)
 
     try:
-        with urllib.request.urlopen(model_url) as response, open(
-            tmp_path, "wb"
-        ) as dest:
+        with (
+            urllib.request.urlopen(model_url) as response,
+            open(tmp_path, "wb") as dest,
+        ):
             shutil.copyfileobj(response, dest)
         tmp_path.replace(model_path)
     except Exception as exc:  # pragma: no cover - dépend d'Internet
@@ -119,6 +501,309 @@ def _ensure_whisper_model() -> Path:
     return model_path
 
 
+WHISPER_CPP_MODES: Tuple[str, ...] = ("docker", "native", "server")
+WHISPER_SERVER_PORT: int = 8910
+
+
+def _get_whisper_cpp_mode(mode: Optional[str] = None) -> str:
+    """Mode d'exécution de whisper.cpp (`mode`, sinon env WHISPER_CPP_MODE, défaut "docker").
+
+    - "docker" : script whisper.sh, un conteneur par fichier,
+    - "native" : binaire whisper-cli local, sans Docker,
+    - "server" : processus whisper-server résident qui garde le modèle chargé.
+
+    Un mode inconnu (ex. faute de frappe) lève WhisperCppError plutôt que de retomber sur Docker.
+    """
+    mode = (mode or get_settings().whisper_cpp_mode or "docker").lower()
+    if mode not in WHISPER_CPP_MODES:
+        raise WhisperCppError(
+            f"Mode whisper.cpp inconnu: {mode} (attendu: {', '.join(WHISPER_CPP_MODES)})"
+        )
+    return mode
+
+
+def _find_binary(override: Optional[str], names: Tuple[str, ...]) -> Optional[str]:
+    """Cherche un binaire à l'emplacement `override` (variable de configuration) puis dans le PATH."""
+    if override:
+        path = Path(override).expanduser()
+        return str(path) if path.exists() else None
+    for name in names:
+        found = shutil.which(name)
+        if found:
+            return found
+    return None
+
+
+def _audio_to_wav_bytes(audio_filename: str, vad: bool = False) -> bytes:
+    """Décode un fichier audio en WAV 16 kHz mono PCM 16 bits, en mémoire."""
+    buffer = io.BytesIO()
+    sf.write(
+        buffer,
+        load_audio(audio_filename, vad=vad),
+        WHISPER_SAMPLING_RATE,
+        format="WAV",
+        subtype="PCM_16",
+    )
+    return buffer.getvalue()
+
+
+class WhisperCppServer:
+    """
+    Processus whisper.cpp résident (whisper-server) qui garde le modèle ggml chargé entre les épisodes.
+
+    Les transcriptions sont envoyées par HTTP sur la boucle locale (endpoint /inference) : le coût
+    par épisode se réduit à l'inférence, sans démarrage de conteneur ni rechargement du modèle.
+    Le serveur est lancé avec le binaire natif whisper-server s'il est disponible (env
+    WHISPER_SERVER_BINARY ou PATH), sinon dans un conteneur Docker persistant. Si `url` (ou env
+    WHISPER_SERVER_URL) est fourni, un serveur déjà démarré est utilisé tel quel.
+    Le serveur étant partagé, threads et cœurs sont fixés une fois pour toutes au lancement.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        port: Optional[int] = None,
+        binary: Optional[str] = None,
+        threads: Optional[int] = None,
+        cpuset: Optional[str] = None,
+        startup_timeout_s: int = 300,
+    ) -> None:
+        """
+        Args:
+            url (Optional[str], optional): URL d'un serveur externe. Défaut env WHISPER_SERVER_URL.
+            port (Optional[int], optional): Port local du serveur lancé. Défaut env WHISPER_SERVER_PORT ou 8910.
+            binary (Optional[str], optional): Chemin du binaire whisper-server. Défaut recherche automatique.
+            threads (Optional[int], optional): Nombre de threads d'inférence. Défaut env WHISPER_THREADS.
+            cpuset (Optional[str], optional): Cœurs réservés au serveur (ex. "0-3"). Défaut env WHISPER_CPUSET.
+            startup_timeout_s (int, optional): Délai maximal de chargement du modèle. Défaut 300.
+        """
+        settings = get_settings()
+        self.external_url = url or settings.whisper_server_url
+        self.port = port or int(settings.whisper_server_port or WHISPER_SERVER_PORT)
+        self.url = (self.external_url or f"http://127.0.0.1:{self.port}").rstrip("/")
+        self.binary = binary or _find_binary(
+            settings.whisper_server_binary, ("whisper-server",)
+        )
+        self.threads = threads or settings.whisper_threads or None
+        self.cpuset = cpuset or settings.whisper_cpuset or None
+        self.entrypoint = (
+            settings.whisper_server_entrypoint or "/app/build/bin/whisper-server"
+        )
+        self.docker_image = (
+            settings.whisper_docker_image or "ghcr.io/ggml-org/whisper.cpp:main-cuda"
+        )
+        self.startup_timeout_s = startup_timeout_s
+        self.process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        backend = (
+            "externe" if self.external_url else ("natif" if self.binary else "docker")
+        )
+        return f"WhisperCppServer({self.url}, {backend})"
+
+    def _command(self, model_path: Path) -> List[str]:
+        """Construit la commande de lancement (binaire natif ou conteneur Docker)."""
+        options = ["--host", "127.0.0.1", "--port", str(self.port), "-l", "fr"]
+        if self.threads:
+            options += ["-t", str(self.threads)]
+        if self.binary:
+            command = [self.binary, "-m", str(model_path)] + options
+            if self.cpuset and shutil.which("taskset"):
+                command = ["taskset", "-c", self.cpuset] + command
+            return command
+        if shutil.which("docker") is None:
+            raise WhisperCppError(
+                "Ni whisper-server ni Docker ne sont disponibles sur cette machine."
+            )
+        options[1] = (
+            "0.0.0.0"  # écoute dans le conteneur, port publié sur la boucle locale
+        )
+        command = [
+            "docker",
+            "run",
+            "--rm",
+            "-p",
+            f"127.0.0.1:{self.port}:{self.port}",
+            "-v",
+            f"{model_path.parent}:/models",
+            "--entrypoint",
+            self.entrypoint,
+            self.docker_image,
+            "-m",
+            f"/models/{model_path.name}",
+        ] + options
+        if self.cpuset:
+            command[3:3] = ["--cpuset-cpus", self.cpuset]
+        return command
+
+    def is_alive(self) -> bool:
+        """Indique si le serveur répond."""
+        try:
+            requests.get(self.url, timeout=2)
+            return True
+        except requests.RequestException:
+            return False
+
+    def start(self) -> None:
+        """Démarre le serveur s'il ne tourne pas déjà et attend que le modèle soit chargé."""
+        with self._lock:
+            if self.process is not None and self.process.poll() is None:
+                return
+            if self.is_alive():
+                return
+            if self.external_url:
+                raise WhisperCppError(
+                    f"Le serveur whisper.cpp {self.url} ne répond pas."
+                )
+            command = self._command(_ensure_whisper_model())
+            self.process = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            deadline = time.monotonic() + self.startup_timeout_s
+            while not self.is_alive():
+                if self.process.poll() is not None:
+                    self.process = None
+                    raise WhisperCppError(
+                        f"whisper-server s'est arrêté au démarrage ({' '.join(command)})."
+                    )
+                if time.monotonic() > deadline:
+                    self._terminate()
+                    raise WhisperCppError(
+                        "whisper-server n'a pas démarré dans le délai autorisé."
+                    )
+                time.sleep(0.5)
+
+    def _terminate(self) -> None:
+        """Arrête le processus lancé par cette instance."""
+        if self.process is None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self.process = None
+
+    def stop(self) -> None:
+        """Arrête le serveur lancé par cette instance (un serveur externe n'est pas touché)."""
+        with self._lock:
+            self._terminate()
+
+    def transcribe(
+        self, audio_filename: str, vad: bool = False, timeout_s: Optional[int] = None
+    ) -> str:
+        """Transcrit un fichier audio avec le serveur résident.
+
+        Args:
+            audio_filename (str): Chemin du fichier audio.
+            vad (bool, optional): N'envoie que les zones de parole (voir trim_silences). Défaut False.
+            timeout_s (Optional[int], optional): Délai maximal de la requête. Défaut aucun.
+
+        Returns:
+            str: Texte transcrit.
+        """
+        self.start()
+        wav = _audio_to_wav_bytes(audio_filename, vad=vad)
+        try:
+            response = requests.post(
+                f"{self.url}/inference",
+                files={"file": ("audio.wav", wav, "audio/wav")},
+                data={"response_format": "json", "language": "fr"},
+                timeout=timeout_s,
+            )
+            response.raise_for_status()
+            return response.json()["text"].strip()
+        except requests.Timeout as exc:
+            raise WhisperCppError("whisper.cpp a dépassé le délai autorisé") from exc
+        except (requests.RequestException, KeyError, ValueError) as exc:
+            raise WhisperCppError(f"whisper-server a échoué: {exc}") from exc
+
+
+_whisper_cpp_server: Optional[WhisperCppServer] = None
+_whisper_cpp_server_lock = threading.Lock()
+
+
+def get_whisper_cpp_server() -> WhisperCppServer:
+    """Retourne le serveur whisper.cpp partagé par le processus (créé à la première demande)."""
+    global _whisper_cpp_server
+    with _whisper_cpp_server_lock:
+        if _whisper_cpp_server is None:
+            _whisper_cpp_server = WhisperCppServer()
+        return _whisper_cpp_server
+
+
+@atexit.register
+def stop_whisper_cpp_server() -> None:
+    """Arrête le serveur whisper.cpp partagé, s'il a été lancé par ce processus."""
+    global _whisper_cpp_server
+    with _whisper_cpp_server_lock:
+        if _whisper_cpp_server is not None:
+            _whisper_cpp_server.stop()
+            _whisper_cpp_server = None
+
+
+def _run_whisper_cli(
+    audio_path: Path,
+    model_path: Path,
+    env: Dict[str, str],
+    vad: bool,
+    timeout_s: Optional[int],
+) -> str:
+    """Transcrit un fichier avec le binaire whisper-cli local (sans Docker).
+
+    L'audio est décodé en WAV 16 kHz dans un fichier temporaire voisin ; la transcription est
+    écrite dans <audio>.txt comme avec le script Docker.
+    """
+    binary = _find_binary(
+        get_settings().whisper_cpp_binary, ("whisper-cli", "whisper-cpp")
+    )
+    if binary is None:
+        raise WhisperCppError(
+            "Binaire whisper-cli introuvable. Définissez WHISPER_CPP_BINARY si nécessaire."
+        )
+    with tempfile.NamedTemporaryFile(
+        dir=audio_path.parent, prefix=".whisper_tmp_", suffix=".wav", delete=False
+    ) as tmp:
+        tmp.write(_audio_to_wav_bytes(str(audio_path), vad=vad))
+        wav_path = Path(tmp.name)
+    command = [
+        binary,
+        "-m",
+        str(model_path),
+        "-f",
+        str(wav_path),
+        "-l",
+        "fr",
+        "-otxt",
+        "-of",
+        str(audio_path.with_suffix("")),
+    ]
+    if env.get("WHISPER_THREADS"):
+        command += ["-t", env["WHISPER_THREADS"]]
+    if env.get("WHISPER_CPUSET") and shutil.which("taskset"):
+        command = ["taskset", "-c", env["WHISPER_CPUSET"]] + command
+    try:
+        subprocess.run(
+            command,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout_s,
+            env=env,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise WhisperCppError("whisper.cpp a dépassé le délai autorisé") from exc
+    except subprocess.CalledProcessError as exc:
+        raise WhisperCppError(
+            f"whisper-cli a échoué (code {exc.returncode}). {(exc.stderr or '').strip()}"
+        ) from exc
+    finally:
+        wav_path.unlink(missing_ok=True)
+    with open(audio_path.with_suffix(".txt"), "r") as file:
+        return file.read()
+
+
 def prevent_sleep(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator that prevents the system from sleeping during a long-running process.
@@ -198,15 +883,50 @@ def _ensure_user_writable(path: Path) -> None:
 
 
 def extract_whisper_cpp(
-    mp3_filename: str, *, timeout_s: Optional[int] = None
+    mp3_filename: str,
+    *,
+    timeout_s: Optional[int] = None,
+    extra_env: Optional[Dict[str, str]] = None,
+    vad: Optional[bool] = None,
+    mode: Optional[str] = None,
 ) -> Tuple[str, Optional[str]]:
-    """Exécute whisper.cpp via Docker et retourne la transcription ainsi que le fichier log."""
+    """Exécute whisper.cpp et retourne la transcription ainsi que le fichier log.
+
+    `mode` (défaut env WHISPER_CPP_MODE, voir _get_whisper_cpp_mode) choisit entre le script
+    Docker, le binaire whisper-cli natif et le serveur résident (get_whisper_cpp_server) ; dans
+    les deux derniers cas il n'y a pas de fichier log. Quel que soit le mode, la transcription
+    est aussi écrite dans <audio>.txt. Un mode inconnu lève WhisperCppError.
+    `extra_env` permet de surcharger les variables du script (ex. WHISPER_THREADS, WHISPER_CPUSET)
+    pour un appel donné, sans toucher à l'environnement du processus. Il est ignoré en mode
+    serveur : le serveur résident est partagé, ses threads et cœurs sont ceux de l'environnement
+    au lancement (voir WhisperCppServer).
+    Si `vad` est vrai, seules les zones de parole (trim_silences) sont écrites dans un WAV 16 kHz
+    temporaire placé à côté de l'audio, puis transcrites ; ce WAV est supprimé même en cas
+    d'échec. whisper.cpp ne rend ici que du texte, sans timestamps : il n'y a donc pas de temps
+    à reporter sur le fichier original (voir SpeechTrim.to_original_chunks pour les autres moteurs).
+    """
+    mode = _get_whisper_cpp_mode(mode)
+    if vad is None:
+        vad = get_WHISPER_VARS()[1]
     audio_path = Path(mp3_filename).expanduser()
     if not audio_path.exists():
         raise FileNotFoundError(f"Fichier audio introuvable: {audio_path}")
 
+    if mode == "server":
+        transcript_text = get_whisper_cpp_server().transcribe(
+            str(audio_path), vad=vad, timeout_s=timeout_s
+        )
+        with open(audio_path.with_suffix(".txt"), "w") as file:
+            file.write(transcript_text)
+        return transcript_text, None
+
     model_path = _ensure_whisper_model()
 
+    if mode == "native":
+        env = os.environ.copy()
+        env.update(extra_env or {})
+        return _run_whisper_cli(audio_path, model_path, env, vad, timeout_s), None
+
     script_path = _get_whisper_cpp_script()
     if not script_path.exists():
         raise WhisperCppError(
@@ -219,13 +939,26 @@ def extract_whisper_cpp(
     if shutil.which("docker") is None:
         raise WhisperCppError("Docker n'est pas disponible sur cette machine.")
 
-    command = ["bash", str(script_path), str(audio_path)]
+    input_path = audio_path
+    if vad:
+        # le WAV doit rester sous AUDIO_ROOT, monté dans le conteneur
+        input_path = audio_path.with_name(f"{audio_path.stem}.speech.wav")
+
+    command = ["bash", str(script_path), str(input_path)]
 
     env = os.environ.copy()
+    env.update(extra_env or {})
     env.setdefault("MODELS_DIR", str(model_path.parent))
     env.setdefault("WHISPER_MODEL_FILENAME", model_path.name)
 
     try:
+        if input_path != audio_path:
+            sf.write(
+                str(input_path),
+                load_audio(str(audio_path), vad=True),
+                WHISPER_SAMPLING_RATE,
+                subtype="PCM_16",
+            )
         completed = subprocess.run(
             command,
             check=True,
@@ -245,6 +978,9 @@ def extract_whisper_cpp(
         raise WhisperCppError(
             f"whisper.cpp a échoué (code {exc.returncode}). {combined_output}"
         ) from exc
+    finally:
+        if input_path != audio_path and input_path.exists():
+            input_path.unlink()
 
     log_path: Optional[str] = None
     for line in completed.stdout.splitlines():
@@ -252,13 +988,18 @@ def extract_whisper_cpp(
             log_path = line.split("=", 1)[1].strip()
             break
 
-    transcript_path = audio_path.with_suffix(".txt")
+    transcript_path = input_path.with_suffix(".txt")
     if not transcript_path.exists():
         raise WhisperCppError(
             f"La transcription attendue '{transcript_path}' n'a pas été générée."
         )
 
     _ensure_user_writable(transcript_path)
+    if input_path != audio_path:
+        # même fichier cache que sans VAD : <audio>.txt
+        cache_path = audio_path.with_suffix(".txt")
+        os.replace(transcript_path, cache_path)
+        transcript_path = cache_path
 
     with open(transcript_path, "r") as file:
         transcript_text = file.read()
@@ -267,43 +1008,31 @@ def extract_whisper_cpp(
 
 
 # @prevent_sleep
-def extract_whisper(mp3_filename: str) -> str:
+def extract_whisper(
+    mp3_filename: str, vad: Optional[bool] = None, return_chunks: bool = False
+) -> Union[str, Tuple[str, List[Dict[str, Any]]]]:
     """
     Extract transcription text from an audio file using a Whisper model.
 
-    Loads a Whisper model and its processor from Hugging Face, sets up an automatic
-    speech recognition pipeline, and processes the provided MP3 file to return
-    the transcription text.
+    Uses the automatic speech recognition pipeline built on the cached Whisper model
+    (loaded from Hugging Face on first use, see get_whisper_pipeline) and processes
+    the provided MP3 file to return the transcription text.
 
     Args:
         mp3_filename (str): Path to the MP3 audio file.
+        vad (Optional[bool], optional): Only transcribe speech regions (see load_speech).
+            Defaults to WHISPER_VAD (see config.get_WHISPER_VARS), read at call time.
+        return_chunks (bool, optional): Also return the timestamped chunks of the pipeline.
+            With `vad`, their timestamps are mapped back to the original file. Defaults to False.
 
     Returns:
-        str: Transcribed text extracted from the audio.
+        Union[str, Tuple[str, List[Dict[str, Any]]]]: Transcribed text extracted from the audio,
+            or (text, chunks) when `return_chunks` is set.
 
     Example:
         >>> transcription = extract_whisper("path/to/audio.mp3")
     """
-    device: str = "cuda:0" if torch.cuda.is_available() else "cpu"
-    torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-
-    model_id: str = "openai/whisper-large-v3-turbo"
-
-    model = AutoModelForSpeechSeq2Seq.from_pretrained(
-        model_id, dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
-    )
-    model.to(device)
-
-    processor = AutoProcessor.from_pretrained(model_id)
-
-    pipe = pipeline(
-        "automatic-speech-recognition",
-        model=model,
-        tokenizer=processor.tokenizer,
-        feature_extractor=processor.feature_extractor,
-        dtype=torch_dtype,
-        device=device,
-    )
+    pipe = get_whisper_pipeline()
 
     # Load a sample dataset (this sample is loaded for demonstration purposes and is not used in transcription).
     # dataset = load_dataset(
@@ -311,92 +1040,275 @@ def extract_whisper(mp3_filename: str) -> str:
     # )
     # sample = dataset[0]["audio"]
 
+    if vad is None:
+        vad = get_WHISPER_VARS()[1]
+    audio_input: Any = mp3_filename
+    trim: Optional[SpeechTrim] = None
+    if vad:
+        trim = load_speech(mp3_filename)
+        audio_input = {"raw": trim.audio, "sampling_rate": WHISPER_SAMPLING_RATE}
+
     result = pipe(
-        mp3_filename,
+        audio_input,
         return_timestamps=True,
     )
 
-    return result["text"]
+    if not return_chunks:
+        return result["text"]
+    chunks = result.get("chunks", [])
+    if trim is not None:
+        chunks = trim.to_original_chunks(chunks)
+    return result["text"], chunks
 
 
-# @prevent_sleep
-def extract_whisper_long(
-    audio_filename: str, chunk_s: int = 30, overlap_s: int = 1
+def iter_audio_chunks(
+    audio: np.ndarray,
+    sampling_rate: int = WHISPER_SAMPLING_RATE,
+    chunk_s: float = 30,
+    overlap_s: float = 1,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Découpe un signal en fenêtres chevauchantes, sans copie.
+
+    Args:
+        audio (np.ndarray): Signal mono (typiquement retourné par load_audio).
+        sampling_rate (int, optional): Fréquence d'échantillonnage du signal. Défaut 16000.
+        chunk_s (float, optional): Durée d'une fenêtre en secondes. Défaut 30.
+        overlap_s (float, optional): Recouvrement entre deux fenêtres en secondes. Défaut 1.
+
+    Yields:
+        Tuple[int, np.ndarray]: Indice du premier échantillon de la fenêtre et vue NumPy sur le signal.
+    """
+    chunk_len = int(chunk_s * sampling_rate)
+    step = int((chunk_s - overlap_s) * sampling_rate)
+    if chunk_len <= 0 or step <= 0:
+        raise ValueError(
+            f"Découpage invalide: chunk_s={chunk_s}, overlap_s={overlap_s} (chunk_s doit dépasser overlap_s)"
+        )
+    n_samples = len(audio)
+    for start in range(0, max(1, n_samples), step):
+        yield start, audio[start : start + chunk_len]
+        if start + chunk_len >= n_samples:
+            break
+
+
+def _normalize_word(word: str) -> str:
+    """Normalise un mot pour la comparaison (casse et ponctuation ignorées)."""
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def _words_match(a: str, b: str) -> bool:
+    """Indique si deux mots normalisés concordent : identiques, ou l'un coupé au bord d'une fenêtre.
+
+    Un mot coupé (au moins 3 lettres) concorde avec le mot complet dont il est le début.
+    """
+    if not a or not b:
+        return False
+    return a == b or (min(len(a), len(b)) >= 3 and (a.startswith(b) or b.startswith(a)))
+
+
+def _find_overlap(left: List[str], right: List[str], min_overlap: int = 2) -> int:
+    """Trouve la longueur du recouvrement entre la fin de `left` et le début de `right`.
+
+    Chaque longueur possible est notée par la proportion de mots (normalisés) concordants,
+    à la manière de l'assemblage des fenêtres du pipeline Hugging Face ; à score égal la plus
+    longue l'emporte. Un alignement doit compter au moins `min_overlap` mots concordants : un
+    seul mot commun (ex. "de" répété de part et d'autre de la coupure) n'est pas un recouvrement.
+    Retourne 0 si aucun alignement ne concorde.
+    """
+    left_norm = [_normalize_word(word) for word in left]
+    right_norm = [_normalize_word(word) for word in right]
+    best_length, best_score = 0, 0.0
+    for length in range(1, min(len(left_norm), len(right_norm)) + 1):
+        matches = sum(
+            1
+            for a, b in zip(left_norm[-length:], right_norm[:length])
+            if _words_match(a, b)
+        )
+        if matches < min_overlap or matches / length < 0.5:
+            continue
+        score = matches / length + length * 1e-4
+        if score > best_score:
+            best_length, best_score = length, score
+    return best_length
+
+
+def merge_chunk_transcripts(
+    texts: List[str],
+    chunk_s: float = 30,
+    overlap_s: float = 1,
+    margin: int = 2,
+    min_overlap: int = 2,
 ) -> str:
     """
-    Splits long audio into overlapping chunks, preprocesses each chunk with the processor
-    (using return_attention_mask) and runs model.generate for each chunk, then returns concatenated text.
+    Assemble les transcriptions de fenêtres chevauchantes en dédupliquant le recouvrement.
+
+    La zone de recherche est bornée par les temps : pour chaque fenêtre, on estime le nombre
+    de mots prononcés pendant les `overlap_s` secondes partagées à partir de son débit
+    (mots / chunk_s), plus une marge. Les mots de cette zone sont alignés avec la fin du texte
+    déjà assemblé ; la moitié gauche du recouvrement est prise dans la fenêtre précédente et la
+    moitié droite dans la suivante, car les mots coupés se trouvent aux bords des fenêtres.
+    Un recouvrement d'un seul mot n'est pas retenu (voir _find_overlap) : un mot réellement
+    répété de part et d'autre de la coupure est conservé.
 
-    Important: ensure audio chunks are sampled at the feature extractor's expected rate (16kHz).
-    This implementation exports each chunk to WAV at 16000 Hz to avoid the sampling-rate ValueError.
+    Args:
+        texts (List[str]): Transcriptions des fenêtres, dans l'ordre.
+        chunk_s (float, optional): Durée d'une fenêtre en secondes. Défaut 30.
+        overlap_s (float, optional): Recouvrement entre deux fenêtres en secondes. Défaut 1.
+        margin (int, optional): Nombre de mots ajoutés à la zone de recherche. Défaut 2.
+        min_overlap (int, optional): Nombre minimal de mots concordants d'un recouvrement. Défaut 2.
+
+    Returns:
+        str: Transcription assemblée.
     """
-    device = "cuda:0" if torch.cuda.is_available() else "cpu"
-    torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-    model_id = "openai/whisper-large-v3-turbo"
+    merged: List[str] = []
+    for text in texts:
+        words = text.split()
+        if not words:
+            continue
+        if not merged or overlap_s <= 0:
+            merged.extend(words)
+            continue
+        window = math.ceil(overlap_s * len(words) / chunk_s) + margin
+        length = _find_overlap(merged[-window:], words[:window], min_overlap)
+        if length:
+            keep_left = length // 2
+            del merged[len(merged) - length + keep_left :]
+            words = words[keep_left:]
+        merged.extend(words)
+    return " ".join(merged)
+
+
+def transcribe_long_audio(
+    audio: np.ndarray,
+    chunk_s: int = 30,
+    overlap_s: int = 1,
+    batch_size: Optional[int] = None,
+    trim: Optional[SpeechTrim] = None,
+    return_chunks: bool = False,
+) -> Union[str, Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Transcribes a 16 kHz mono signal by overlapping chunks with the cached Whisper model.
 
-    model = AutoModelForSpeechSeq2Seq.from_pretrained(
-        model_id, dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
-    )
-    model.to(device)
-    processor = AutoProcessor.from_pretrained(model_id)
+    Chunks are zero-copy views (iter_audio_chunks); features of `batch_size` consecutive chunks
+    are stacked and decoded by a single model.generate call. batch_decode returns texts in input
+    order, so the chunk order is preserved; the texts are then stitched by merge_chunk_transcripts,
+    which drops the words transcribed twice in the overlap.
+
+    Args:
+        audio (np.ndarray): Mono signal sampled at WHISPER_SAMPLING_RATE (see load_audio).
+        chunk_s (int, optional): Chunk length in seconds. Defaults to 30.
+        overlap_s (int, optional): Overlap between consecutive chunks in seconds. Defaults to 1.
+        batch_size (Optional[int], optional): Number of chunks decoded together.
+            Defaults to WHISPER_BATCH_SIZE (see config.get_WHISPER_VARS), read at call time.
+        trim (SpeechTrim, optional): When `audio` is trim.audio, chunk timestamps are mapped
+            back to the original file with trim.to_original_chunks. Defaults to None.
+        return_chunks (bool, optional): Also return one {"text", "timestamp": (start, end)}
+            entry per chunk, in seconds. Defaults to False.
+
+    Returns:
+        Union[str, Tuple[str, List[Dict[str, Any]]]]: Concatenated transcription,
+            or (text, chunks) when `return_chunks` is set.
+    """
+    device, torch_dtype = _get_whisper_device()
+    model, processor = get_whisper_model(WHISPER_MODEL_ID, device, torch_dtype)
 
     generate_kwargs = {"language": "fr"}
 
-    seg = AudioSegment.from_file(audio_filename)
-    dur_ms = len(seg)
-    step_ms = (chunk_s - overlap_s) * 1000
-    chunk_ms = chunk_s * 1000
+    sampling_rate = processor.feature_extractor.sampling_rate
+    if sampling_rate != WHISPER_SAMPLING_RATE:
+        raise RuntimeError(
+            f"Unexpected sampling rate {sampling_rate}, expected {WHISPER_SAMPLING_RATE}"
+        )
+    starts, chunks = [], []
+    for start, speech in iter_audio_chunks(audio, sampling_rate, chunk_s, overlap_s):
+        starts.append(start)
+        chunks.append(speech)
+    if batch_size is None:
+        batch_size = get_WHISPER_VARS()[0]
+    batch_size = max(1, batch_size)
     texts = []
 
-    for start in range(0, max(1, dur_ms), int(step_ms)):
-        end = start + chunk_ms
-        piece = seg[start:end]
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
-            # Export the chunk as WAV forced to 16 kHz to match WhisperFeatureExtractor expectations
-            # requires ffmpeg (used by pydub) available in the container.
-            piece.export(tmp_path, format="wav", parameters=["-ar", "16000"])
-        try:
-            # read chunk as numpy array (float) + sr
-            speech, sr = sf.read(tmp_path)
-            if sr != processor.feature_extractor.sampling_rate:
-                raise RuntimeError(
-                    f"Unexpected sampling rate {sr}, expected {processor.feature_extractor.sampling_rate}"
-                )
+    for batch_start in range(0, len(chunks), batch_size):
+        batch = chunks[batch_start : batch_start + batch_size]
+        # processor -> return_tensors="pt" and return_attention_mask to follow deprecation guidance
+        # (every chunk is padded to 30 s by the feature extractor, so features stack together)
+        inputs = processor(
+            batch,
+            sampling_rate=sampling_rate,
+            return_tensors="pt",
+            return_attention_mask=True,
+        )
+        # support both possible keys
+        feat = inputs.get("input_features", inputs.get("input_values"))
+        if feat is None:
+            raise RuntimeError("Processor did not return input features")
+        feat = feat.to(device).to(dtype=torch_dtype)
+
+        # run generate on model
+        generated = model.generate(feat, **generate_kwargs)
+        decoded = processor.tokenizer.batch_decode(generated, skip_special_tokens=True)
+        texts.extend(text.strip() for text in decoded)
+
+    merged = merge_chunk_transcripts(texts, chunk_s=chunk_s, overlap_s=overlap_s)
+    if not return_chunks:
+        return merged
+    segments = [
+        {
+            "text": text,
+            "timestamp": (start / sampling_rate, (start + len(speech)) / sampling_rate),
+        }
+        for text, start, speech in zip(texts, starts, chunks)
+    ]
+    if trim is not None:
+        segments = trim.to_original_chunks(segments)
+    return merged, segments
 
-            # processor -> return_tensors="pt" and return_attention_mask to follow deprecation guidance
-            inputs = processor(
-                speech,
-                sampling_rate=sr,
-                return_tensors="pt",
-                return_attention_mask=True,
-            )
-            # support both possible keys
-            feat = inputs.get("input_features", inputs.get("input_values"))
-            if feat is None:
-                raise RuntimeError("Processor did not return input features")
-            feat = feat.to(device).to(dtype=torch_dtype)
-
-            # run generate on model
-            generated = model.generate(feat, **generate_kwargs)
-            decoded = processor.tokenizer.batch_decode(
-                generated, skip_special_tokens=True
-            )
-            texts.append(decoded[0].strip() if decoded else "")
-        finally:
-            os.remove(tmp_path)
-        if end >= dur_ms:
-            break
 
-    return " ".join(t for t in texts if t)
+# @prevent_sleep
+def extract_whisper_long(
+    audio_filename: str,
+    chunk_s: int = 30,
+    overlap_s: int = 1,
+    batch_size: Optional[int] = None,
+    vad: Optional[bool] = None,
+    return_chunks: bool = False,
+) -> Union[str, Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Splits long audio into overlapping chunks, preprocesses them with the processor
+    (using return_attention_mask) and runs model.generate on batches of chunks, then returns concatenated text.
+
+    The whole file is decoded once (load_audio) to mono float32 at 16 kHz, then transcribed
+    by transcribe_long_audio; no temporary file or subprocess is involved in the chunk loop.
+    With `vad`, silences are removed before chunking (see load_speech); with `return_chunks`,
+    the chunk timestamps returned alongside the text are expressed in the original file.
+    `batch_size` and `vad` default to WHISPER_BATCH_SIZE and WHISPER_VAD (see config.get_WHISPER_VARS).
+    """
+    if vad is None:
+        vad = get_WHISPER_VARS()[1]
+    trim: Optional[SpeechTrim] = None
+    if vad:
+        trim = load_speech(audio_filename, sampling_rate=WHISPER_SAMPLING_RATE)
+        audio = trim.audio
+    else:
+        audio = load_audio(
+            audio_filename, sampling_rate=WHISPER_SAMPLING_RATE, vad=False
+        )
+    return transcribe_long_audio(
+        audio,
+        chunk_s=chunk_s,
+        overlap_s=overlap_s,
+        batch_size=batch_size,
+        trim=trim,
+        return_chunks=return_chunks,
+    )
 
 
 # %% py mongo helper episodes.ipynb #9e06b30c
 from bson import ObjectId
-from mongo import get_collection, get_DB_VARS, mongolog
+from mongo import get_collection, get_DB_VARS, mongolog, mongolog_many
 from datetime import datetime
 import requests
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from llm import get_azure_llm
 from llama_index.core.llms import ChatMessage
 import json
@@ -406,6 +1318,64 @@ from config import get_audio_path, AUDIO_PATH
 DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%S"
 LOG_DATE_FORMAT: str = "%d %b %Y %H:%M"
 
+# les transcriptions (plusieurs dizaines de Ko chacune) sont stockées à part, un document
+# {episode_oid, text} par épisode : les documents de la collection episodes restent petits
+# et les listes d'épisodes ne rapatrient pas le texte
+TRANSCRIPTIONS_COLLECTION: str = "transcriptions"
+# compression des blocs WiredTiger de la collection des transcriptions (côté serveur)
+TRANSCRIPTIONS_STORAGE_ENGINE: Dict[str, Any] = {
+    "wiredTiger": {"configString": "block_compressor=zstd"}
+}
+
+
+def get_transcriptions_collection():
+    """Retourne la collection des transcriptions de la base configurée."""
+    DB_HOST, DB_NAME, _ = get_DB_VARS()
+    return get_collection(
+        target_db=DB_HOST,
+        client_name=DB_NAME,
+        collection_name=TRANSCRIPTIONS_COLLECTION,
+    )
+
+
+def load_transcriptions(oids: Iterable[ObjectId]) -> Dict[ObjectId, str]:
+    """Lit en une seule requête les transcriptions d'un ensemble d'épisodes.
+
+    Args:
+        oids (Iterable[ObjectId]): Les identifiants des épisodes.
+
+    Returns:
+        Dict[ObjectId, str]: La transcription par identifiant d'épisode (les épisodes sans transcription sont absents).
+    """
+    oids = [oid for oid in oids if oid is not None]
+    if not oids:
+        return {}
+    cursor = get_transcriptions_collection().find(
+        {"episode_oid": {"$in": oids}}, {"episode_oid": 1, "text": 1, "_id": 0}
+    )
+    return {doc["episode_oid"]: doc["text"] for doc in cursor}
+
+
+def store_transcription(oid: ObjectId, transcription: Optional[str]) -> None:
+    """Écrit (ou supprime si elle est vide) la transcription d'un épisode dans la collection des transcriptions.
+
+    Args:
+        oid (ObjectId): L'identifiant de l'épisode.
+        transcription (Optional[str]): Le texte de la transcription.
+
+    Raises:
+        ValueError: Si `oid` est None (épisode absent de la base) : aucun document orphelin n'est écrit.
+    """
+    if oid is None:
+        raise ValueError("Transcription sans épisode en base (oid None)")
+    collection = get_transcriptions_collection()
+    if transcription:
+        collection.update_one(
+            {"episode_oid": oid}, {"$set": {"text": transcription}}, upsert=True
+        )
+    else:
+        collection.delete_one({"episode_oid": oid})
+
 
 class Episode:
     def __init__(
@@ -428,26 +1398,89 @@ class Episode:
         self.date: datetime = Episode.get_date_from_string(date)
         self.titre: str = titre
 
-        if self.exists():
-            episode = self.collection.find_one({"titre": self.titre, "date": self.date})
-            self.description: Optional[str] = episode.get("description")
-            self.url_telechargement: Optional[str] = episode.get("url")
-            self.audio_rel_filename: Optional[str] = episode.get("audio_rel_filename")
-            self.transcription: Optional[str] = episode.get("transcription")
-            self.type: Optional[str] = episode.get("type")
-            self.duree: int = episode.get("duree", -1)
-            self.masked: bool = episode.get("masked", False)
-        else:
-            self.description = None
-            self.url_telechargement = None
-            self.audio_rel_filename = None
-            self.transcription = None
-            self.type = None
-            self.duree = -1  # en secondes
-            self.masked = False
+        episode = self.collection.find_one({"titre": self.titre, "date": self.date})
+        self._load_document(episode if episode is not None else {})
+
+    def _load_document(self, document: Dict[str, Any]) -> None:
+        """Renseigne les attributs de l'épisode à partir d'un document Mongo.
+
+        Args:
+            document (Dict[str, Any]): Le document de la collection (vide pour un nouvel épisode).
+        """
+        self.description: Optional[str] = document.get("description")
+        self.url_telechargement: Optional[str] = document.get("url")
+        self.audio_rel_filename: Optional[str] = document.get("audio_rel_filename")
+        self._oid: Optional[ObjectId] = document.get("_id")
+        # un document non migré porte encore sa transcription ; sinon elle n'est lue
+        # qu'au premier accès à self.transcription, sauf si has_transcription vaut False
+        # (un document sans ce drapeau, antérieur à migrate_flags, est lu) ou sans _id
+        self._transcription: Optional[str] = document.get("transcription")
+        self._has_transcription_flag: Optional[bool] = document.get("has_transcription")
+        self._transcription_loaded: bool = (
+            "transcription" in document
+            or self._has_transcription_flag is False
+            or document.get("_id") is None
+        )
+        self.type: Optional[str] = document.get("type")
+        self.duree: int = document.get("duree", -1)  # en secondes
+        self.masked: bool = document.get("masked", False)
+
+    @property
+    def transcription(self) -> Optional[str]:
+        """La transcription de l'épisode, lue dans TRANSCRIPTIONS_COLLECTION au premier accès."""
+        if not self._transcription_loaded:
+            oid = self._oid or self.get_oid()
+            self._transcription = load_transcriptions([oid]).get(oid)
+            self._transcription_loaded = True
+        return self._transcription
+
+    @transcription.setter
+    def transcription(self, transcription: Optional[str]) -> None:
+        self._transcription = transcription
+        self._transcription_loaded = True
+
+    @classmethod
+    def from_document(
+        cls, document: Dict[str, Any], collection_name: str = "episodes"
+    ) -> "Episode":
+        """Crée un épisode à partir d'un document Mongo déjà récupéré, sans aucune requête.
+
+        Args:
+            document (Dict[str, Any]): Le document de l'épisode (au minimum 'date' et 'titre').
+            collection_name (str, optional): Le nom de la collection. Défaut: "episodes".
+
+        Returns:
+            Episode: L'instance d'Episode correspondante.
+        """
+        DB_HOST, DB_NAME, _ = get_DB_VARS()
+        instance = cls.__new__(cls)
+        instance.collection = get_collection(
+            target_db=DB_HOST, client_name=DB_NAME, collection_name=collection_name
+        )
+        instance.date = document.get("date")
+        instance.titre = document.get("titre")
+        instance._load_document(document)
+        return instance
 
     @classmethod
-    def from_oid(cls, oid: ObjectId, collection_name: str = "episodes") -> "Episode":
+    def from_documents(
+        cls, documents: Iterable[Dict[str, Any]], collection_name: str = "episodes"
+    ) -> List["Episode"]:
+        """Crée des épisodes à partir de documents Mongo (par exemple un curseur), sans requête supplémentaire.
+
+        Args:
+            documents (Iterable[Dict[str, Any]]): Les documents des épisodes.
+            collection_name (str, optional): Le nom de la collection. Défaut: "episodes".
+
+        Returns:
+            List[Episode]: Les instances d'Episode, dans l'ordre des documents.
+        """
+        return [cls.from_document(doc, collection_name) for doc in documents]
+
+    @classmethod
+    def from_oid(
+        cls, oid: ObjectId, collection_name: str = "episodes"
+    ) -> Optional["Episode"]:
         """Crée un épisode à partir d'un ObjectId dans la base de données.
 
         Args:
@@ -455,16 +1488,16 @@ class Episode:
             collection_name (str, optional): Le nom de la collection. Défaut: "episodes".
 
         Returns:
-            Episode: L'instance d'Episode correspondante.
+            Optional[Episode]: L'instance d'Episode correspondante, ou None si l'ObjectId est inconnu.
         """
         DB_HOST, DB_NAME, _ = get_DB_VARS()
         collection = get_collection(
             target_db=DB_HOST, client_name=DB_NAME, collection_name=collection_name
         )
         document = collection.find_one({"_id": oid})
-        date_doc_str = cls.get_string_from_date(document.get("date"), DATE_FORMAT)
-        instance = cls(date=date_doc_str, titre=document.get("titre"))
-        return instance
+        if document is None:
+            return None
+        return cls.from_document(document, collection_name)
 
     @classmethod
     def from_date(
@@ -487,9 +1520,7 @@ class Episode:
         end_date = datetime(date.year, date.month, date.day, 23, 59, 59)
         document = collection.find_one({"date": {"$gte": start_date, "$lte": end_date}})
         if document:
-            date_doc_str = cls.get_string_from_date(document.get("date"), DATE_FORMAT)
-            instance = cls(date=date_doc_str, titre=document.get("titre"))
-            return instance
+            return cls.from_document(document, collection_name)
         else:
             return None
 
@@ -504,32 +1535,83 @@ class Episode:
             is not None
         )
 
-    def keep(self) -> int:
+    @staticmethod
+    def find_existing(
+        keys: Iterable[Tuple[str, datetime]], collection_name: str = "episodes"
+    ) -> Set[Tuple[str, datetime]]:
+        """Vérifie en une seule requête quels couples (titre, date) existent déjà en base.
+
+        Args:
+            keys (Iterable[Tuple[str, datetime]]): Les couples (titre, date) à vérifier.
+            collection_name (str, optional): Le nom de la collection. Défaut: "episodes".
+
+        Returns:
+            Set[Tuple[str, datetime]]: Les couples déjà présents dans la collection.
+        """
+        keys = set(keys)
+        if not keys:
+            return set()
+        DB_HOST, DB_NAME, _ = get_DB_VARS()
+        collection = get_collection(
+            target_db=DB_HOST, client_name=DB_NAME, collection_name=collection_name
+        )
+        cursor = collection.find(
+            {
+                "titre": {"$in": list({titre for titre, _ in keys})},
+                "date": {"$in": list({date for _, date in keys})},
+            },
+            {"titre": 1, "date": 1, "_id": 0},
+        )
+        return {(doc["titre"], doc["date"]) for doc in cursor} & keys
+
+    def to_document(self) -> Dict[str, Any]:
+        """Retourne le document Mongo à insérer pour cet épisode.
+
+        Returns:
+            Dict[str, Any]: Le document avec les champs stockés dans la collection.
+        """
+        return {
+            "titre": self.titre,
+            "date": self.date,
+            "description": self.description,
+            "url": self.url_telechargement,
+            "audio_rel_filename": self.audio_rel_filename,
+            "has_transcription": bool(self.transcription),
+            "type": self.type,
+            "duree": self.duree,
+            "masked": bool(self.masked),
+        }
+
+    def should_keep(self) -> bool:
+        """Indique si l'épisode doit être conservé en base (toujours vrai, redéfini par RSS_episode).
+
+        Returns:
+            bool: True si l'épisode peut être inséré.
+        """
+        return True
+
+    def keep(self, exists: Optional[bool] = None) -> int:
         """Télécharge le fichier audio si nécessaire et conserve l'épisode dans la base de données.
 
+        Args:
+            exists (Optional[bool], optional): Existence de l'épisode en base si elle est déjà connue
+                (par exemple via find_existing). Si None, elle est vérifiée avec exists().
+
         Returns:
             int: 1 si une nouvelle entrée est créée en base, 0 sinon.
         """
         message_log = f"{Episode.get_string_from_date(self.date, format=LOG_DATE_FORMAT)} - {self.titre}"
-        if not self.exists():
+        if exists is None:
+            exists = self.exists()
+        if not exists:
             print(
                 f"Episode du {Episode.get_string_from_date(self.date, format=LOG_DATE_FORMAT)} nouveau: Duree: {self.duree}, Type: {self.type}"
             )
             mongolog("insert", self.collection.name, message_log)
             self.download_audio(verbose=True)
-            self.collection.insert_one(
-                {
-                    "titre": self.titre,
-                    "date": self.date,
-                    "description": self.description,
-                    "url": self.url_telechargement,
-                    "audio_rel_filename": self.audio_rel_filename,
-                    "transcription": self.transcription,
-                    "type": self.type,
-                    "duree": self.duree,
-                    "masked": self.masked,
-                }
-            )
+            self._oid = self.collection.insert_one(self.to_document()).inserted_id
+            if self.transcription:
+                store_transcription(self._oid, self.transcription)
             return 1
         else:
             print(
@@ -554,7 +1636,10 @@ class Episode:
     def remove(self) -> None:
         """Supprime l'épisode de la base de données."""
         message_log = f"{Episode.get_string_from_date(self.date, format=LOG_DATE_FORMAT)} - {self.titre}"
+        oid = self._oid or self.get_oid()
         self.collection.delete_one({"titre": self.titre, "date": self.date})
+        if oid is not None:
+            store_transcription(oid, None)
         mongolog("delete", self.collection.name, message_log)
 
     def get_oid(self) -> Optional[ObjectId]:
@@ -640,6 +1725,14 @@ class Episode:
         """
         return self.__str__()
 
+    def resolve_audio_url(self) -> Optional[str]:
+        """Retourne l'URL de téléchargement de l'audio (connue dès la création, redéfini par WEB_episode).
+
+        Returns:
+            Optional[str]: L'URL du fichier audio, ou None si elle est inconnue.
+        """
+        return self.url_telechargement
+
     def download_audio(self, verbose: bool = False) -> None:
         """Télécharge le fichier audio à partir de l'URL de téléchargement et le sauvegarde localement.
 
@@ -668,8 +1761,17 @@ class Episode:
             if verbose:
                 print(f"Le fichier {full_filename} existe déjà. Ignoré.")
 
-    def set_transcription(self, verbose: bool = False, keep_cache: bool = True) -> None:
-        """Extrait l'audio en privilégiant whisper.cpp puis en basculant sur Hugging Face si nécessaire."""
+    def set_transcription(
+        self,
+        verbose: bool = False,
+        keep_cache: bool = True,
+        vad: Optional[bool] = None,
+    ) -> None:
+        """Extrait l'audio en privilégiant whisper.cpp puis en basculant sur Hugging Face si nécessaire.
+
+        Avec `vad`, seules les zones de parole sont transcrites (jingles et silences retirés) ;
+        par défaut WHISPER_VAD (voir config.get_WHISPER_VARS).
+        """
         if self.transcription is not None:
             if verbose:
                 print("Transcription existe deja")
@@ -680,24 +1782,22 @@ class Episode:
             if verbose:
                 print("Impossible de transcrire: fichier audio non disponible")
             return
-        mp3_fullfilename = get_audio_path(AUDIO_PATH, year="") + self.audio_rel_filename
+        mp3_fullfilename = self.get_audio_fullfilename()
         cache_transcription_filename = f"{os.path.splitext(mp3_fullfilename)[0]}.txt"
         if os.path.exists(cache_transcription_filename):
             if verbose:
                 print(f"Transcription cachee trouvee: {cache_transcription_filename}")
             with open(cache_transcription_filename, "r") as file:
-                self.transcription = file.read()
-            self.collection.update_one(
-                {"_id": self.get_oid()},
-                {"$set": {"transcription": self.transcription}},
-            )
+                self.save_transcription(file.read(), keep_cache=False)
             return
 
         transcription_text: Optional[str] = None
         log_path: Optional[str] = None
 
         try:
-            transcription_text, log_path = extract_whisper_cpp(mp3_fullfilename)
+            transcription_text, log_path = extract_whisper_cpp(
+                mp3_fullfilename, vad=vad
+            )
             if verbose:
                 message = "Transcription whisper.cpp terminée."
                 if log_path:
@@ -712,22 +1812,80 @@ class Episode:
         if transcription_text is None:
             if verbose:
                 print("Transcription via extract_whisper en cours...")
-            transcription_text = extract_whisper(mp3_fullfilename)
+            transcription_text = extract_whisper(mp3_fullfilename, vad=vad)
+
+        self.save_transcription(transcription_text, keep_cache=keep_cache)
+
+    def get_audio_fullfilename(self) -> Optional[str]:
+        """Retourne le chemin complet du fichier audio local de l'épisode.
+
+        Returns:
+            Optional[str]: Chemin du fichier audio, ou None si l'audio n'a pas encore été téléchargé.
+        """
+        if self.audio_rel_filename is None:
+            return None
+        return get_audio_path(AUDIO_PATH, year="") + self.audio_rel_filename
 
-        self.transcription = transcription_text
-        if keep_cache:
-            with open(cache_transcription_filename, "w") as f:
+    def save_transcription(self, transcription: str, keep_cache: bool = True) -> None:
+        """Enregistre la transcription de l'épisode en base (collection TRANSCRIPTIONS_COLLECTION).
+
+        Args:
+            transcription (str): Texte de la transcription.
+            keep_cache (bool, optional): Si True, écrit aussi le fichier cache .txt à côté de l'audio. Défaut True.
+        """
+        self.transcription = transcription
+        mp3_fullfilename = self.get_audio_fullfilename()
+        if keep_cache and mp3_fullfilename is not None:
+            with open(f"{os.path.splitext(mp3_fullfilename)[0]}.txt", "w") as f:
                 f.write(self.transcription)
+        oid = self._oid or self.get_oid()
+        if oid is None:
+            # épisode pas encore en base : keep() écrira la transcription à l'insertion
+            return
+        store_transcription(oid, self.transcription)
+        self.collection.update_one(
+            {"_id": oid},
+            {
+                "$set": {"has_transcription": bool(self.transcription)},
+                "$unset": {"transcription": ""},
+            },
+        )
+
+    def delete_transcription(self) -> None:
+        """Supprime la transcription de l'épisode en base (le fichier cache .txt n'est pas touché)."""
+        self.transcription = None
+        oid = self._oid or self.get_oid()
+        if oid is None:
+            return
+        store_transcription(oid, None)
+        self.collection.update_one(
+            {"_id": oid},
+            {"$set": {"has_transcription": False}, "$unset": {"transcription": ""}},
+        )
+
+    def set_masked(self, masked: bool) -> None:
+        """Masque ou démasque l'épisode en base (champ booléen masked, toujours renseigné).
+
+        Args:
+            masked (bool): True pour masquer l'épisode des listes et des compteurs.
+        """
+        self.masked = bool(masked)
         self.collection.update_one(
-            {"_id": self.get_oid()}, {"$set": {"transcription": self.transcription}}
+            {"_id": self.get_oid()}, {"$set": {"masked": self.masked}}
         )
 
-    def to_dict(self) -> Dict[str, Union[str, datetime, int, None, bool]]:
+    def to_dict(
+        self, include_transcription: bool = True
+    ) -> Dict[str, Union[str, datetime, int, None, bool]]:
         """Convertit l'épisode en dictionnaire.
 
+        Args:
+            include_transcription (bool, optional): Si False, la transcription n'est pas lue en base
+                et 'transcription' vaut None ('has_transcription' reste renseigné). Défaut True.
+
         Returns:
             Dict[str, Union[str, datetime, int, None, bool]]: Dictionnaire contenant les informations de l'épisode.
-                Les clés sont ['date', 'titre', 'description', 'url_telechargement', 'audio_rel_filename', 'transcription', 'type', 'duree', 'masked'].
+                Les clés sont ['date', 'titre', 'description', 'url_telechargement', 'audio_rel_filename', 'transcription', 'has_transcription', 'type', 'duree', 'masked'].
         """
         return {
             "date": self.date,
@@ -735,12 +1893,26 @@ class Episode:
             "description": self.description,
             "url_telechargement": self.url_telechargement,
             "audio_rel_filename": self.audio_rel_filename,
-            "transcription": self.transcription,
+            "transcription": self.transcription if include_transcription else None,
+            "has_transcription": self.has_transcription(),
             "type": self.type,
             "duree": self.duree,
             "masked": self.masked,
         }
 
+    def has_transcription(self) -> bool:
+        """Indique si l'épisode a une transcription, sans la lire si elle n'est pas encore chargée.
+
+        Returns:
+            bool: True si une transcription est disponible.
+        """
+        if self._transcription_loaded:
+            return bool(self._transcription)
+        if self._has_transcription_flag is not None:
+            return self._has_transcription_flag
+        # document sans drapeau (antérieur à migrate_flags) : la transcription est lue
+        return bool(self.transcription)
+
     def get_all_auteurs(self) -> List[str]:
         """Extrait la liste de tous les auteurs mentionnés dans la transcription.
 
@@ -803,8 +1975,13 @@ Voici cette transcription : {self.transcription} ",
 # %% py mongo helper episodes.ipynb #bb02afd7
 from feedparser.util import FeedParserDict
 from transformers import pipeline
+import hashlib
 import locale
+import re
+import threading
+from collections import Counter
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 RSS_DUREE_MINI_MINUTES: int = 15
 RSS_DATE_FORMAT: str = (
@@ -813,6 +1990,182 @@ RSS_DATE_FORMAT: str = (
 
 AUDIO_TYPES = {"audio/mpeg", "audio/x-m4a", "audio/mp4", "audio/aac"}
 
+ZERO_SHOT_MODEL_ID: str = "facebook/bart-large-mnli"
+RSS_TYPE_LABELS: List[str] = ["livres", "films", "pièces de théâtre"]
+
+# mots-clés du classement lexical, testés sur le titre + la description en minuscules
+RSS_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "livres": [
+        r"\blivres?\b",
+        r"\broman(s|cières?|ciers?)?\b",
+        r"\bessais?\b",
+        r"\bécrivaine?s?\b",
+        r"\brécits?\b",
+        r"\bpoésie\b",
+        r"\bbandes? dessinées?\b",
+        r"\blittéra(ire|ture)s?\b",
+        r"\bédition(s)?\b",
+    ],
+    "films": [
+        r"\bfilms?\b",
+        r"\bcinéma\b",
+        r"\bréalisat(eur|rice)s?\b",
+        r"\bsalles? obscures?\b",
+        r"\bdocumentaires?\b",
+        r"\bséries?\b",
+    ],
+    "pièces de théâtre": [
+        r"\bthéâtres?\b",
+        r"\bpièces?\b",
+        r"\bmises? en scène\b",
+        r"\bspectacles?\b",
+        r"\bcomédiens?\b",
+        r"\bdramaturges?\b",
+    ],
+}
+# le classement lexical ne tranche que si le meilleur label a au moins RSS_LEXICAL_MIN_SCORE
+# occurrences et RSS_LEXICAL_MIN_MARGIN de plus que le suivant, sinon BART décide
+RSS_LEXICAL_MIN_SCORE: int = 2
+RSS_LEXICAL_MIN_MARGIN: int = 2
+EPISODE_TYPE_TIERS: Tuple[str, str] = ("lexical", "zero-shot")
+
+_type_patterns: Dict[str, List[re.Pattern]] = {
+    label: [re.compile(keyword) for keyword in keywords]
+    for label, keywords in RSS_TYPE_KEYWORDS.items()
+}
+_zero_shot_classifiers: Dict[str, Any] = {}
+_episode_types: Dict[str, Tuple[str, str]] = {}
+_episode_type_tiers: Counter = Counter()
+_zero_shot_lock = threading.Lock()
+
+
+def get_zero_shot_classifier(model_id: str = ZERO_SHOT_MODEL_ID) -> Any:
+    """
+    Retourne la pipeline "zero-shot-classification", chargée une seule fois par processus.
+
+    Args:
+        model_id (str): Identifiant Hugging Face du modèle. Défaut: ZERO_SHOT_MODEL_ID.
+
+    Returns:
+        Any: La pipeline Hugging Face, mise en cache par model_id.
+    """
+    with _zero_shot_lock:
+        if model_id not in _zero_shot_classifiers:
+            _zero_shot_classifiers[model_id] = pipeline(
+                "zero-shot-classification", model=model_id
+            )
+        return _zero_shot_classifiers[model_id]
+
+
+def _episode_type_key(description: str) -> str:
+    """Clé de mémoïsation d'une classification : hash du titre et de la description."""
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def classify_episode_type_lexical(description: str) -> Optional[str]:
+    """
+    Classe une description par comptage des mots-clés de RSS_TYPE_KEYWORDS.
+
+    Args:
+        description (str): Le texte à classer (titre + description de l'épisode).
+
+    Returns:
+        Optional[str]: Le label retenu, ou None si le score est ambigu
+            (moins de RSS_LEXICAL_MIN_SCORE occurrences ou écart insuffisant avec le suivant).
+    """
+    text = description.lower()
+    scores = sorted(
+        (
+            (sum(len(pattern.findall(text)) for pattern in patterns), label)
+            for label, patterns in _type_patterns.items()
+        ),
+        reverse=True,
+    )
+    (best, label), (second, _) = scores[0], scores[1]
+    if best >= RSS_LEXICAL_MIN_SCORE and best - second >= RSS_LEXICAL_MIN_MARGIN:
+        return label
+    return None
+
+
+def classify_episode_types_with_tier(
+    descriptions: Iterable[str], batch_size: int = 8
+) -> List[Tuple[str, str]]:
+    """
+    Classe un lot de descriptions d'épisodes parmi RSS_TYPE_LABELS, en indiquant qui a décidé.
+
+    Les descriptions déjà classées sont lues dans le cache mémoire (clé = hash du texte).
+    Les autres passent d'abord par classify_episode_type_lexical ; seules celles restées
+    ambiguës sont envoyées en un seul appel à la pipeline zero-shot, par lots de batch_size.
+
+    Args:
+        descriptions (Iterable[str]): Les textes à classer (titre + description de l'épisode).
+        batch_size (int): Taille des lots passés au modèle. Défaut: 8.
+
+    Returns:
+        List[Tuple[str, str]]: Pour chaque description, dans l'ordre d'entrée, le label retenu
+            et le niveau qui l'a choisi ("lexical" ou "zero-shot").
+    """
+    descriptions = list(descriptions)
+    keys = [_episode_type_key(description) for description in descriptions]
+    with _zero_shot_lock:
+        missing = {
+            key: description
+            for key, description in zip(keys, descriptions)
+            if key not in _episode_types
+        }
+    decisions: Dict[str, Tuple[str, str]] = {}
+    ambiguous: Dict[str, str] = {}
+    for key, description in missing.items():
+        label = classify_episode_type_lexical(description)
+        if label is None:
+            ambiguous[key] = description
+        else:
+            decisions[key] = (label, "lexical")
+    if ambiguous:
+        classifier = get_zero_shot_classifier()
+        texts = list(ambiguous.values())
+        if len(texts) == 1:
+            results = [classifier(texts[0], RSS_TYPE_LABELS)]
+        else:
+            results = classifier(texts, RSS_TYPE_LABELS, batch_size=batch_size)
+        for key, result in zip(ambiguous, results):
+            decisions[key] = (result["labels"][0], "zero-shot")
+    with _zero_shot_lock:
+        _episode_types.update(decisions)
+        _episode_type_tiers.update(tier for _, tier in decisions.values())
+        return [_episode_types[key] for key in keys]
+
+
+def classify_episode_types(
+    descriptions: Iterable[str], batch_size: int = 8
+) -> List[str]:
+    """
+    Classe un lot de descriptions d'épisodes parmi RSS_TYPE_LABELS.
+
+    Args:
+        descriptions (Iterable[str]): Les textes à classer (titre + description de l'épisode).
+        batch_size (int): Taille des lots passés au modèle. Défaut: 8.
+
+    Returns:
+        List[str]: Le label retenu pour chaque description, dans l'ordre d'entrée.
+    """
+    return [
+        label for label, _ in classify_episode_types_with_tier(descriptions, batch_size)
+    ]
+
+
+def get_episode_type_stats() -> Dict[str, int]:
+    """
+    Retourne le nombre de classifications décidées par chaque niveau depuis le début du processus.
+
+    Les résultats servis par le cache ne sont pas recomptés.
+
+    Returns:
+        Dict[str, int]: Nombre de décisions par niveau ("lexical", "zero-shot").
+    """
+    with _zero_shot_lock:
+        return {tier: _episode_type_tiers[tier] for tier in EPISODE_TYPE_TIERS}
+
 
 class RSS_episode(Episode):
     def __init__(self, date: str, titre: str) -> None:
@@ -824,14 +2177,19 @@ class RSS_episode(Episode):
             titre (str): The title of the episode.
         """
         super().__init__(date, titre)
+        self.type_source: Optional[str] = None
 
     @classmethod
-    def from_feed_entry(cls, feed_entry: FeedParserDict) -> "RSS_episode":
+    def from_feed_entry(
+        cls, feed_entry: FeedParserDict, classify: bool = True
+    ) -> "RSS_episode":
         """
         Create an RSS_episode instance from an RSS feed entry.
 
         Args:
             feed_entry (FeedParserDict): The entry from the RSS feed.
+            classify (bool): Whether to set the episode type right away. Defaults to True.
+                from_feed_entries passes False to classify all entries in one batch.
 
         Returns:
             RSS_episode: The created RSS_episode instance.
@@ -839,10 +2197,11 @@ class RSS_episode(Episode):
         locale.setlocale(locale.LC_TIME, "en_US.UTF-8")
         date_rss: datetime = datetime.strptime(feed_entry.published, RSS_DATE_FORMAT)
         date_rss_str: str = cls.get_string_from_date(date_rss, DATE_FORMAT)
-        inst = cls(
-            date=date_rss_str,
-            titre=feed_entry.title,
+        # pas de requête par entrée : l'existence en base est vérifiée en lot (Episode.find_existing)
+        inst = cls.from_document(
+            {"date": cls.get_date_from_string(date_rss_str), "titre": feed_entry.title}
         )
+        inst.type_source = None
         inst.description = feed_entry.summary
 
         for link in feed_entry.links:
@@ -850,11 +2209,41 @@ class RSS_episode(Episode):
                 inst.url_telechargement = link.href
                 break
 
-        inst.type = cls.set_titre(inst.titre + " " + inst.description)
+        if classify:
+            inst.type, inst.type_source = classify_episode_types_with_tier(
+                [inst.titre + " " + inst.description]
+            )[0]
         inst.duree = cls.get_duree_in_seconds(feed_entry.itunes_duration)  # in seconds
 
         return inst
 
+    @classmethod
+    def from_feed_entries(
+        cls, feed_entries: Iterable[FeedParserDict]
+    ) -> List["RSS_episode"]:
+        """
+        Create RSS_episode instances from several RSS feed entries.
+
+        The episode types are computed in one batch (see classify_episode_types_with_tier):
+        the lexical tier first, then a single zero-shot call for the ambiguous entries.
+
+        Args:
+            feed_entries (Iterable[FeedParserDict]): The entries from the RSS feed.
+
+        Returns:
+            List[RSS_episode]: The created instances, in the order of the entries.
+        """
+        episodes = [
+            cls.from_feed_entry(feed_entry, classify=False)
+            for feed_entry in feed_entries
+        ]
+        decisions = classify_episode_types_with_tier(
+            [episode.titre + " " + episode.description for episode in episodes]
+        )
+        for episode, (episode_type, type_source) in zip(episodes, decisions):
+            episode.type, episode.type_source = episode_type, type_source
+        return episodes
+
     @staticmethod
     def get_duree_in_seconds(duree: str) -> int:
         """
@@ -880,7 +2269,26 @@ class RSS_episode(Episode):
         else:
             return int(duree_parts[0])
 
-    def keep(self) -> int:
+    def should_keep(self) -> bool:
+        """
+        Tell whether the episode is worth saving.
+
+        Returns:
+            bool: True if the duration is greater than RSS_DUREE_MINI_MINUTES * 60 seconds
+                and the type is equal to "livres".
+        """
+        return (self.duree > RSS_DUREE_MINI_MINUTES * 60) and (self.type == "livres")
+
+    def to_document(self) -> Dict[str, Any]:
+        """
+        Return the Mongo document to insert, with the classifier tier that decided the type.
+
+        Returns:
+            Dict[str, Any]: Episode.to_document plus 'type_source' ("lexical", "zero-shot" or None).
+        """
+        return {**super().to_document(), "type_source": self.type_source}
+
+    def keep(self, exists: Optional[bool] = None) -> int:
         """
         Save the episode to the database if conditions are met.
 
@@ -888,35 +2296,36 @@ class RSS_episode(Episode):
             - The duration is greater than RSS_DUREE_MINI_MINUTES * 60 seconds.
             - The type is equal to "livres".
 
+        Args:
+            exists (Optional[bool]): Whether the episode is already stored, if known. Defaults to None (queried).
+
         Returns:
             int: 1 if an entry is created in the database, 0 otherwise.
         """
-        if (self.duree > RSS_DUREE_MINI_MINUTES * 60) and (self.type == "livres"):
-            return super().keep()
+        if self.should_keep():
+            return super().keep(exists=exists)
         else:
             print(
-                f"Episode du {Episode.get_string_from_date(self.date, format=LOG_DATE_FORMAT)} ignored: Duree: {self.duree}, Type: {self.type}"
+                f"Episode du {Episode.get_string_from_date(self.date, format=LOG_DATE_FORMAT)} ignored: Duree: {self.duree}, Type: {self.type} ({self.type_source})"
             )
             return 0
 
     @staticmethod
     def set_titre(description: str) -> str:
         """
-        Classify the episode by using a zero-shot classification model from HuggingFace based on the provided description.
+        Classify the episode from the provided description.
+
+        A keyword scorer decides first; the zero-shot classification model from HuggingFace is only used
+        when the lexical score is ambiguous. The classifier is loaded once per process and results are
+        memoized by a hash of the description.
 
         Args:
             description (str): The description combining the title and summary.
 
         Returns:
-            str: The label with the highest score among ["livres", "films", "pièces de théâtre"].
+            str: The label with the highest score among RSS_TYPE_LABELS.
         """
-        classifier = pipeline(
-            "zero-shot-classification", model="facebook/bart-large-mnli"
-        )
-        labels = ["livres", "films", "pièces de théâtre"]
-
-        result = classifier(description, labels)
-        return result["labels"][0]
+        return classify_episode_types([description])[0]
 
 
 # %% py mongo helper episodes.ipynb #921c54af
@@ -944,6 +2353,15 @@ class WEB_episode(Episode):
         """
         super().__init__(date, titre)
 
+    def _load_document(self, document: Dict[str, Any]) -> None:
+        """Renseigne les attributs à partir d'un document Mongo ; la page web de l'épisode est inconnue.
+
+        Args:
+            document (Dict[str, Any]): Le document de la collection (vide pour un nouvel épisode).
+        """
+        super()._load_document(document)
+        self.url_page: Optional[str] = None
+
     @staticmethod
     def parse_web_date(
         web_date: str, web_date_format: str = WEB_DATE_FORMAT
@@ -1025,30 +2443,46 @@ class WEB_episode(Episode):
         print("Balise <script> contenant 'contentUrl' non trouvée")
         return None
 
+    def resolve_audio_url(self) -> Optional[str]:
+        """Récupère l'URL audio depuis la page de l'épisode (get_audio_url) si elle n'est pas encore connue.
+
+        Returns:
+            Optional[str]: L'URL du fichier audio, ou None si elle est introuvable.
+        """
+        if self.url_telechargement is None and self.url_page:
+            self.url_telechargement = self.get_audio_url(self.url_page)
+        return self.url_telechargement
+
     @classmethod
-    def from_webpage_entry(cls, dict_web_episode: Dict[str, Any]) -> "WEB_episode":
+    def from_webpage_entry(
+        cls, dict_web_episode: Dict[str, Any], resolve_audio: bool = True
+    ) -> "WEB_episode":
         """Crée une instance de WEB_episode à partir d'un dictionnaire représentant une entrée de page web.
 
         Le dictionnaire doit contenir les clés : 'title', 'url', 'description', 'date', 'duration'.
-        La variable DATE_FORMAT et la méthode get_string_from_date doivent être définies ailleurs dans le code.
+        Aucune requête Mongo n'est faite : l'existence en base est vérifiée en lot (Episode.find_existing).
 
         Args:
             dict_web_episode (Dict[str, Any]): Dictionnaire contenant les informations de l'épisode.
+            resolve_audio (bool, optional): Si True (défaut), récupère tout de suite l'URL audio depuis
+                la page de l'épisode. Episodes.bulk_keep la récupère sinon pour les seuls nouveaux épisodes.
 
         Returns:
             WEB_episode: Une instance de WEB_episode initialisée avec les données fournies.
         """
         date_web: Optional[datetime] = cls.parse_web_date(dict_web_episode["date"])
-        date_web_str: str = cls.get_string_from_date(
-            date_web, DATE_FORMAT
-        )  # DATE_FORMAT doit être défini en amont
-        inst: WEB_episode = cls(
-            date=date_web_str,
-            titre=dict_web_episode["title"],
+        date_web_str: str = cls.get_string_from_date(date_web, DATE_FORMAT)
+        inst = cls.from_document(
+            {
+                "date": cls.get_date_from_string(date_web_str),
+                "titre": dict_web_episode["title"],
+            }
         )
         inst.description = dict_web_episode["description"]
         inst.type = "livres"
-        inst.url_telechargement = cls.get_audio_url(dict_web_episode["url"])
+        inst.url_page = dict_web_episode["url"]
+        if resolve_audio:
+            inst.resolve_audio_url()
         inst.duree = cls.get_duree_in_seconds(dict_web_episode["duration"])
         return inst
 
@@ -1069,8 +2503,22 @@ class WEB_episode(Episode):
 
 
 # %% py mongo helper episodes.ipynb #f88988a7
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from typing import Any, Iterator
 
+# les requêtes portent sur des champs compacts (has_transcription, masked) tenus à jour par
+# les écritures (to_document, save_transcription, set_masked) et couverts par les index de
+# mongo_indexes : la migration Episodes.migrate_flags les renseigne sur les documents anciens
+MISSING_TRANSCRIPTION_QUERY: Dict[str, Any] = {"has_transcription": False}
+TRANSCRIPTION_QUERY: Dict[str, Any] = {"has_transcription": True}
+VISIBLE_QUERY: Dict[str, Any] = {"masked": False}
+
+_LEGACY_MISSING_TRANSCRIPTION_QUERY: Dict[str, Any] = {
+    "$or": [{"transcription": ""}, {"transcription": None}]
+}
+
 
 class Episodes:
     """Classe pour rechercher et gérer la qualité des données des épisodes.
@@ -1110,37 +2558,209 @@ class Episodes:
         Si limit est spécifié, seuls les limit premiers résultats sont conservés.
         Args:
             request (Any): Requête MongoDB à exécuter. Exemples:
-                {"$or": [{"transcription": ""}, {"transcription": None}]}.
+                {"has_transcription": False} (MISSING_TRANSCRIPTION_QUERY).
                 Par défaut, une requête vide qui retourne tous les épisodes.
             include_masked (bool): Si False (par défaut), exclut les épisodes avec masked=True.
                 Si True, inclut tous les épisodes y compris les masqués.
         """
-        # Construire la requête finale en combinant request et le filtre masked
-        if not include_masked:
-            # Ajouter le filtre pour exclure les épisodes masqués
-            masked_filter = {
-                "$or": [{"masked": {"$ne": True}}, {"masked": {"$exists": False}}]
+        results = self._find(request, {"_id": 1}, limit, include_masked)
+        self.oid_episodes = [document["_id"] for document in results]
+
+    def get_episodes(
+        self, request: Any = "", limit: int = -1, include_masked: bool = False
+    ) -> List["Episode"]:
+        """
+        Retourne les épisodes complets correspondant à une requête, triés par date décroissante,
+        à partir d'un seul curseur (aucune requête supplémentaire par épisode).
+        Met également à jour self.oid_episodes.
+
+        Args:
+            request (Any): Requête MongoDB à exécuter (voir get_entries).
+            limit (int): Si différent de -1, nombre maximum d'épisodes retournés.
+            include_masked (bool): Si True, inclut les épisodes masqués.
+
+        Returns:
+            List[Episode]: Les épisodes hydratés.
+        """
+        documents = list(self._find(request, None, limit, include_masked))
+        self.oid_episodes = [document["_id"] for document in documents]
+        return Episode.from_documents(documents, self.collection.name)
+
+    def iter_episodes(
+        self,
+        request: Any = "",
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        limit: int = -1,
+        include_masked: bool = False,
+        oldest_first: bool = False,
+    ) -> Iterator["Episode"]:
+        """
+        Itère sur les épisodes hydratés correspondant à une requête, triés par date décroissante
+        (croissante avec `oldest_first`), en les lisant au fil de l'eau depuis un seul curseur serveur.
+
+        Contrairement à get_entries, self.oid_episodes n'est pas modifié.
+
+        Args:
+            request (Any): Requête MongoDB à exécuter (voir get_entries).
+            projection (Optional[Dict[str, Any]]): Projection MongoDB, par exemple {"transcription": 0}
+                pour ne pas rapatrier les transcriptions. Une projection d'inclusion garde toujours
+                '_id', 'date', 'titre', 'has_transcription' et 'masked', afin que l'épisode partiel soit
+                identifié et que sa transcription et son masquage restent connus. Les attributs des
+                autres champs exclus valent leur valeur par défaut (None, -1) : ces épisodes partiels
+                ne doivent pas servir à réécrire ces champs en base.
+            batch_size (int): Nombre de documents rapatriés par aller-retour serveur. Le curseur expire
+                après 10 minutes d'inactivité : réduire batch_size si le traitement de chaque épisode est long.
+            limit (int): Si différent de -1, nombre maximum d'épisodes retournés.
+            include_masked (bool): Si True, inclut les épisodes masqués.
+            oldest_first (bool): Si True, trie par date croissante : avec `limit`, ce sont alors
+                les épisodes les plus anciens qui sont retournés.
+
+        Yields:
+            Episode: Les épisodes, un par un.
+        """
+        if projection and any(projection.values()):
+            # sans ces champs, l'épisode hydraté n'aurait ni _oid ni has_transcription
+            projection = {
+                **projection,
+                "_id": 1,
+                "date": 1,
+                "titre": 1,
+                "has_transcription": 1,
+                "masked": 1,
             }
+        cursor = self._find(
+            request, projection, limit, include_masked, oldest_first=oldest_first
+        ).batch_size(batch_size)
+        for document in cursor:
+            yield Episode.from_document(document, self.collection.name)
+
+    def bulk_keep(
+        self,
+        episodes: Iterable["Episode"],
+        download: bool = True,
+        download_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Conserve un lot d'épisodes en base en quelques requêtes, au lieu de plusieurs par épisode (keep).
+
+        L'existence est vérifiée en une seule requête $in (Episode.find_existing) ; seuls les nouveaux
+        épisodes résolvent leur URL audio (resolve_audio_url, une requête HTTP pour WEB_episode) et
+        téléchargent leur audio, en parallèle. Les documents sont écrits par un seul insert_many non
+        ordonné et les entrées de log en une seule écriture (mongolog_many).
+
+        Args:
+            episodes (Iterable[Episode]): Les épisodes à conserver (filtrés par Episode.should_keep).
+            download (bool): Si True (défaut), télécharge l'audio des nouveaux épisodes avant l'insertion.
+            download_workers (int): Nombre de résolutions d'URL et téléchargements simultanés. Défaut 4.
 
+        Returns:
+            List[Dict[str, Any]]: Un rapport par épisode, dans l'ordre d'entrée, avec 'titre', 'date',
+                'status' ("inserted", "exists", "ignored" ou "failed") et 'error' (message d'erreur ou None).
+        """
+        episodes = list(episodes)
+        report = [
+            {
+                "titre": episode.titre,
+                "date": episode.date,
+                "status": None,
+                "error": None,
+            }
+            for episode in episodes
+        ]
+        seen = Episode.find_existing(
+            ((episode.titre, episode.date) for episode in episodes),
+            self.collection.name,
+        )
+        candidates: List[int] = []
+        for i, episode in enumerate(episodes):
+            key = (episode.titre, episode.date)
+            if not episode.should_keep():
+                report[i]["status"] = "ignored"
+            elif key in seen:
+                report[i]["status"] = "exists"
+            else:
+                seen.add(key)
+                candidates.append(i)
+
+        def prepare(episode: Episode) -> None:
+            """Résout l'URL audio du nouvel épisode puis télécharge l'audio si demandé."""
+            episode.resolve_audio_url()
+            if download:
+                episode.download_audio()
+
+        if candidates:
+            if download:
+                # les répertoires par année sont créés avant les téléchargements concurrents
+                for year in {episodes[i].date.year for i in candidates}:
+                    get_audio_path(AUDIO_PATH, str(year))
+            with ThreadPoolExecutor(max_workers=download_workers) as pool:
+                futures = {pool.submit(prepare, episodes[i]): i for i in candidates}
+                for future in as_completed(futures):
+                    if future.exception() is not None:
+                        report[futures[future]]["status"] = "failed"
+                        report[futures[future]]["error"] = str(future.exception())
+            candidates = [i for i in candidates if report[i]["status"] is None]
+
+        if candidates:
+            documents = [episodes[i].to_document() for i in candidates]
+            try:
+                self.collection.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    i = candidates[write_error["index"]]
+                    report[i]["status"] = "failed"
+                    report[i]["error"] = write_error.get("errmsg")
+            # insert_many renseigne l'_id de chaque document envoyé
+            for i, document in zip(candidates, documents):
+                if report[i]["status"] is None:
+                    report[i]["status"] = "inserted"
+                    episodes[i]._oid = document.get("_id")
+                    if episodes[i].transcription and episodes[i]._oid is not None:
+                        store_transcription(episodes[i]._oid, episodes[i].transcription)
+
+        operations = {"inserted": "insert", "exists": "update"}
+        mongolog_many(
+            (
+                operations[item["status"]],
+                self.collection.name,
+                f"{Episode.get_string_from_date(item['date'], format=LOG_DATE_FORMAT)} - {item['titre']}",
+            )
+            for item in report
+            if item["status"] in operations
+        )
+        return report
+
+    def _find(
+        self,
+        request: Any,
+        projection: Optional[Dict[str, Any]],
+        limit: int,
+        include_masked: bool,
+        oldest_first: bool = False,
+    ):
+        """Construit la requête finale (filtre masked inclus) et retourne le curseur trié par date.
+
+        Le tri (décroissant, ou croissant avec `oldest_first`) est fait par Mongo, avant `limit`.
+        """
+        # Construire la requête finale en combinant request et le filtre masked
+        if not include_masked:
             if request and request != "":
                 # Combiner la requête existante avec le filtre masked
-                final_request = {"$and": [request, masked_filter]}
+                final_request = {"$and": [request, VISIBLE_QUERY]}
             else:
                 # Utiliser uniquement le filtre masked
-                final_request = masked_filter
+                final_request = VISIBLE_QUERY
         else:
             # Utiliser la requête telle quelle sans filtrer masked
             final_request = request if request != "" else {}
 
-        if limit == -1:
-            results = self.collection.find(final_request, {"_id": 1}).sort({"date": -1})
-        else:
-            results = (
-                self.collection.find(final_request, {"_id": 1})
-                .sort({"date": -1})
-                .limit(limit)
-            )
-        self.oid_episodes = [document["_id"] for document in results]
+        results = self.collection.find(final_request, projection).sort(
+            {"date": 1 if oldest_first else -1}
+        )
+        if limit != -1:
+            results = results.limit(limit)
+        return results
 
     def len_total_entries(self, include_masked: bool = False) -> int:
         """
@@ -1151,28 +2771,149 @@ class Episodes:
                 Si True, compte tous les épisodes y compris les masqués.
         """
         if not include_masked:
-            # Compter uniquement les épisodes non masqués
-            masked_filter = {
-                "$or": [{"masked": {"$ne": True}}, {"masked": {"$exists": False}}]
-            }
-            return self.collection.count_documents(masked_filter)
+            # Compter uniquement les épisodes non masqués (index masked_1_date_-1)
+            return self.collection.count_documents(VISIBLE_QUERY)
         else:
             # Compter tous les épisodes
             return self.collection.estimated_document_count()
 
+    def len_missing_transcriptions(self, include_masked: bool = False) -> int:
+        """
+        Retourne le nombre d'épisodes sans transcription, sans lire les documents
+        (index partiel sur has_transcription).
+
+        Args:
+            include_masked (bool): Si True, compte aussi les épisodes masqués.
+        """
+        request = (
+            MISSING_TRANSCRIPTION_QUERY
+            if include_masked
+            else {**MISSING_TRANSCRIPTION_QUERY, **VISIBLE_QUERY}
+        )
+        return self.collection.count_documents(request)
+
+    def get_last_date(self, include_masked: bool = False) -> Optional[datetime]:
+        """
+        Retourne la date de l'épisode le plus récent, lue dans l'index sur date.
+
+        Args:
+            include_masked (bool): Si True, tient compte des épisodes masqués.
+
+        Returns:
+            Optional[datetime]: La date la plus récente, ou None si la collection est vide.
+        """
+        request = {} if include_masked else VISIBLE_QUERY
+        cursor = (
+            self.collection.find(request, {"date": 1, "_id": 0})
+            .sort({"date": -1})
+            .limit(1)
+        )
+        for document in cursor:
+            return document["date"]
+        return None
+
+    def migrate_flags(self) -> Dict[str, int]:
+        """
+        Renseigne has_transcription et normalise masked (booléen toujours présent) sur tous les épisodes.
+
+        Migration à lancer une fois sur une base existante (scripts/manage_indexes.py migrate) ;
+        elle est idempotente et peut être relancée si des documents ont été écrits par un autre outil.
+
+        Returns:
+            Dict[str, int]: Nombre de documents modifiés par champ.
+        """
+        masked = self.collection.update_many(
+            {"masked": {"$nin": [True, False]}}, {"$set": {"masked": False}}
+        )
+        missing = self.collection.update_many(
+            {
+                "$and": [
+                    _LEGACY_MISSING_TRANSCRIPTION_QUERY,
+                    {"has_transcription": {"$ne": False}},
+                ]
+            },
+            {"$set": {"has_transcription": False}},
+        )
+        present = self.collection.update_many(
+            {
+                "transcription": {"$nin": [None, ""]},
+                "has_transcription": {"$ne": True},
+            },
+            {"$set": {"has_transcription": True}},
+        )
+        return {
+            "masked": masked.modified_count,
+            "has_transcription": missing.modified_count + present.modified_count,
+        }
+
+    def migrate_transcriptions(self, batch_size: int = 100) -> int:
+        """
+        Déplace les transcriptions encore stockées dans les documents des épisodes vers TRANSCRIPTIONS_COLLECTION.
+
+        La collection des transcriptions est créée au besoin avec la compression zstd des blocs
+        (TRANSCRIPTIONS_STORAGE_ENGINE). has_transcription est renseigné dans la même écriture que le
+        retrait du texte : l'ordre par rapport à migrate_flags (scripts/manage_indexes.py migrate) est
+        indifférent. La migration est idempotente : un épisode déplacé n'a plus de champ transcription.
+
+        Args:
+            batch_size (int): Nombre d'épisodes déplacés par aller-retour. Défaut 100.
+
+        Returns:
+            int: Nombre d'épisodes dont la transcription a été déplacée.
+        """
+        transcriptions = get_transcriptions_collection()
+        database = transcriptions.database
+        if TRANSCRIPTIONS_COLLECTION not in database.list_collection_names():
+            database.create_collection(
+                TRANSCRIPTIONS_COLLECTION, storageEngine=TRANSCRIPTIONS_STORAGE_ENGINE
+            )
+        moved = 0
+        while True:
+            # chaque lot perd son champ transcription : la requête suivante renvoie le lot suivant
+            batch = list(
+                self.collection.find(
+                    {"transcription": {"$exists": True}}, {"transcription": 1}
+                ).limit(batch_size)
+            )
+            if not batch:
+                break
+            operations = [
+                UpdateOne(
+                    {"episode_oid": doc["_id"]},
+                    {"$set": {"text": doc["transcription"]}},
+                    upsert=True,
+                )
+                for doc in batch
+                if doc["transcription"]
+            ]
+            if operations:
+                transcriptions.bulk_write(operations, ordered=False)
+            for flag in (True, False):
+                oids = [
+                    doc["_id"] for doc in batch if bool(doc["transcription"]) is flag
+                ]
+                if oids:
+                    self.collection.update_many(
+                        {"_id": {"$in": oids}},
+                        {
+                            "$set": {"has_transcription": flag},
+                            "$unset": {"transcription": ""},
+                        },
+                    )
+            moved += len(operations)
+        return moved
+
     def get_missing_transcriptions(self):
         """
         Mets dans self.oid_episodes les oids correspondant aux épisodes sans transcription.
         """
-        self.get_entries({"$or": [{"transcription": ""}, {"transcription": None}]})
+        self.get_entries(MISSING_TRANSCRIPTION_QUERY)
 
     def get_transcriptions(self):
         """
         Mets dans self.oid_episodes les oids correspondant aux épisodes qui possèdent une transcription.
         """
-        self.get_entries(
-            {"$and": [{"transcription": {"$ne": None}}, {"transcription": {"$ne": ""}}]}
-        )
+        self.get_entries(TRANSCRIPTION_QUERY)
 
     def __getitem__(self, index: int) -> "Episode":
         """Permet l'accès aux épisodes par indexation.
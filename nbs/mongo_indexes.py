@@ -0,0 +1,186 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: py mongo helper indexes.ipynb.
+
+# %% auto #0
+__all__ = ["INDEX_SPECS", "INDEX_OPTIONS", "ensure_indexes", "index_usage_report"]
+
+# %% py mongo helper indexes.ipynb #09b893c0
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo.errors import OperationFailure
+
+from config import get_DB_VARS
+from mongo import get_collection
+
+# index déclarés par collection, d'après les requêtes faites par le code :
+# - episodes : {titre, date} (Episode.exists, Episode.find_existing), tri et plages sur date,
+#   épisodes visibles (masked) et sans transcription (has_transcription) triés par date : les
+#   compteurs de la page d'accueil sont calculés sur ces index sans lire les documents
+# - avis_critiques : episode_oid (cache des résumés), {episode_id, entity_type, entity_name}, nom
+# - auteurs, livres : nom (BaseEntity.exists / keep / get_oid), unique
+# - transcriptions : episode_oid (lecture à la demande de Episode.transcription, upsert), unique
+# - transcription_jobs : episode_oid (TranscriptionWorker, upsert), unique
+# - episode_authors : episode_oid (noms du titre et de la description, AuthorChecker), unique
+# - author_resolutions : expires_at, index TTL qui purge les résolutions d'auteurs expirées
+#   (AuthorResolutionCache ; le nom normalisé est l'_id)
+# - logs : tri sur date (print_logs)
+INDEX_SPECS: Dict[str, List[Dict[str, Any]]] = {
+    "episodes": [
+        {"name": "titre_1_date_1", "keys": [("titre", 1), ("date", 1)]},
+        {"name": "date_-1", "keys": [("date", -1)]},
+        {"name": "masked_1_date_-1", "keys": [("masked", 1), ("date", -1)]},
+        {
+            "name": "has_transcription_1_masked_1_date_-1",
+            "keys": [("has_transcription", 1), ("masked", 1), ("date", -1)],
+            # seuls les épisodes sans transcription, peu nombreux, sont indexés
+            "partialFilterExpression": {"has_transcription": False},
+        },
+    ],
+    "avis_critiques": [
+        {"name": "episode_oid_1", "keys": [("episode_oid", 1)]},
+        {
+            "name": "episode_id_1_entity_type_1_entity_name_1",
+            "keys": [("episode_id", 1), ("entity_type", 1), ("entity_name", 1)],
+        },
+        {"name": "nom_1", "keys": [("nom", 1)]},
+    ],
+    "auteurs": [{"name": "nom_1", "keys": [("nom", 1)], "unique": True}],
+    "livres": [{"name": "nom_1", "keys": [("nom", 1)], "unique": True}],
+    "transcriptions": [
+        {"name": "episode_oid_1", "keys": [("episode_oid", 1)], "unique": True}
+    ],
+    "transcription_jobs": [
+        {"name": "episode_oid_1", "keys": [("episode_oid", 1)], "unique": True}
+    ],
+    "episode_authors": [
+        {"name": "episode_oid_1", "keys": [("episode_oid", 1)], "unique": True}
+    ],
+    "author_resolutions": [
+        # document supprimé dès que expires_at est dépassé
+        {"name": "expires_at_1", "keys": [("expires_at", 1)], "expireAfterSeconds": 0}
+    ],
+    "logs": [{"name": "date_-1", "keys": [("date", -1)]}],
+}
+
+# options comparées entre l'index déclaré et l'index existant
+INDEX_OPTIONS: Tuple[str, ...] = (
+    "unique",
+    "partialFilterExpression",
+    "expireAfterSeconds",
+)
+
+
+def _get_index_collection(collection_name: str):
+    """Retourne la collection `collection_name` de la base configurée."""
+    DB_HOST, DB_NAME, _ = get_DB_VARS()
+    return get_collection(
+        target_db=DB_HOST, client_name=DB_NAME, collection_name=collection_name
+    )
+
+
+def _same_index(spec: Dict[str, Any], info: Dict[str, Any]) -> bool:
+    """Indique si un index existant (index_information) correspond à la déclaration."""
+    if [tuple(key) for key in info["key"]] != [tuple(key) for key in spec["keys"]]:
+        return False
+    return all(
+        (
+            bool(info.get(option)) == bool(spec.get(option))
+            if option == "unique"
+            else info.get(option) == spec.get(option)
+        )
+        for option in INDEX_OPTIONS
+    )
+
+
+def ensure_indexes(
+    collections: Optional[Iterable[str]] = None, dry_run: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Crée les index déclarés dans INDEX_SPECS qui n'existent pas encore (opération idempotente).
+
+    Un index existant sous le même nom mais avec d'autres clés ou options n'est pas modifié :
+    il est signalé en "conflict" pour être traité à la main. La création d'un index unique
+    échoue si la collection contient déjà des doublons ; l'erreur est reportée en "failed".
+
+    Args:
+        collections (Optional[Iterable[str]]): Collections à traiter. Par défaut toutes celles de INDEX_SPECS.
+        dry_run (bool): Si True, n'écrit rien et signale les index à créer en "missing".
+
+    Returns:
+        List[Dict[str, Any]]: Un rapport par index déclaré avec 'collection', 'name',
+            'status' ("exists", "created", "missing", "conflict" ou "failed") et 'error'.
+    """
+    report = []
+    for collection_name in collections or INDEX_SPECS:
+        collection = _get_index_collection(collection_name)
+        existing = collection.index_information()
+        for spec in INDEX_SPECS[collection_name]:
+            item = {
+                "collection": collection_name,
+                "name": spec["name"],
+                "status": None,
+                "error": None,
+            }
+            if spec["name"] in existing:
+                same = _same_index(spec, existing[spec["name"]])
+                item["status"] = "exists" if same else "conflict"
+            elif dry_run:
+                item["status"] = "missing"
+            else:
+                options = {
+                    option: spec[option] for option in INDEX_OPTIONS if option in spec
+                }
+                try:
+                    collection.create_index(spec["keys"], name=spec["name"], **options)
+                    item["status"] = "created"
+                except OperationFailure as e:
+                    item["status"] = "failed"
+                    item["error"] = str(e)
+            report.append(item)
+    return report
+
+
+def index_usage_report(
+    collections: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compare les index présents en base à INDEX_SPECS et à leur utilisation ($indexStats).
+
+    Les compteurs de $indexStats sont remis à zéro à chaque redémarrage du serveur :
+    un index "unused" n'a pas servi depuis `since`.
+
+    Args:
+        collections (Optional[Iterable[str]]): Collections à analyser. Par défaut toutes celles de INDEX_SPECS.
+
+    Returns:
+        List[Dict[str, Any]]: Un rapport par index avec 'collection', 'name', 'declared' (bool),
+            'status' ("missing" si déclaré mais absent, "unused" si présent sans aucun accès, "used" sinon),
+            'ops' (nombre d'accès) et 'since' (début du comptage).
+    """
+    report = []
+    for collection_name in collections or INDEX_SPECS:
+        collection = _get_index_collection(collection_name)
+        declared = {spec["name"] for spec in INDEX_SPECS.get(collection_name, [])}
+        stats = {
+            stat["name"]: stat["accesses"]
+            for stat in collection.aggregate([{"$indexStats": {}}])
+        }
+        for name in sorted(declared | set(stats)):
+            if name == "_id_":
+                continue
+            accesses = stats.get(name)
+            if accesses is None:
+                status, ops, since = "missing", 0, None
+            else:
+                ops, since = accesses.get("ops", 0), accesses.get("since")
+                status = "used" if ops else "unused"
+            report.append(
+                {
+                    "collection": collection_name,
+                    "name": name,
+                    "declared": name in declared,
+                    "status": status,
+                    "ops": ops,
+                    "since": since,
+                }
+            )
+    return report
@@ -1,7 +1,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: py rss helper.ipynb.
 
 # %% auto #0
-__all__ = ["RSS_DATE_FORMAT", "extraire_dureesummary", "extraire_urls_rss", "Podcast"]
+__all__ = [
+    "RSS_DATE_FORMAT",
+    "RSS_FETCH_TIMEOUT_S",
+    "extraire_dureesummary",
+    "extraire_urls_rss",
+    "fetch_feed",
+    "Podcast",
+]
 
 # %% py rss helper.ipynb #b661f963
 import feedparser
@@ -61,22 +68,107 @@ def extraire_urls_rss(duree_mini_minutes: int = 15) -> List[str]:
 
 # %% py rss helper.ipynb #3e3ea032
 import feedparser
+import json
+import os
+import requests
 from mongo import get_collection, get_DB_VARS
+from config import get_RSS_cache_file
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from feedparser.util import FeedParserDict
 from mongo_episode import RSS_episode
 import pytz
 
 RSS_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"  # "Sun, 29 Dec 2024 10:59:39 +0100"
+RSS_FETCH_TIMEOUT_S = 30
+
+
+def _read_feed_cache_meta(cache_file: str) -> Dict[str, Optional[str]]:
+    """Lit les validateurs (url, etag, last_modified) enregistrés à côté du flux en cache."""
+    try:
+        with open(cache_file + ".json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fetch_feed(
+    url: str, cache_file: str, timeout_s: int = RSS_FETCH_TIMEOUT_S
+) -> Tuple[str, Optional[int]]:
+    """
+    Télécharge le flux RSS dans `cache_file` avec une requête conditionnelle.
+
+    L'ETag et le Last-Modified de la dernière réponse sont conservés dans `<cache_file>.json`
+    et renvoyés (If-None-Match / If-Modified-Since) : si le flux n'a pas changé, le serveur
+    répond 304 et la copie locale est réutilisée sans retélécharger le flux. Si le serveur est
+    injoignable, la copie locale est aussi utilisée.
+
+    Args:
+        url (str): L'URL du flux RSS.
+        cache_file (str): Le fichier local contenant la dernière version du flux.
+        timeout_s (int): Délai maximal de la requête en secondes. Par défaut RSS_FETCH_TIMEOUT_S.
+
+    Returns:
+        Tuple[str, Optional[int]]: Le chemin du flux local à analyser et le statut HTTP
+        (200 si le flux a été téléchargé, 304 s'il n'a pas changé, None si le serveur est injoignable).
+
+    Raises:
+        requests.RequestException: Si le flux ne peut pas être téléchargé et qu'aucune copie locale n'existe.
+    """
+    meta = _read_feed_cache_meta(cache_file)
+    cached = os.path.exists(cache_file) and meta.get("url") == url
+    headers = {}
+    if cached and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if cached and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout_s)
+        if cached and response.status_code == 304:
+            return cache_file, 304
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if not cached:
+            raise
+        print(
+            f"Flux RSS injoignable ({e}), utilisation de la copie locale {cache_file}"
+        )
+        return cache_file, None
+
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    # écriture atomique : une copie interrompue ne remplace pas la précédente
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(response.content)
+    os.replace(tmp_file, cache_file)
+    with open(cache_file + ".json", "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+            f,
+        )
+    return cache_file, response.status_code
 
 
 class Podcast:
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None):
         """
         Initialise la classe Podcast en analysant le flux RSS et en obtenant la collection MongoDB.
+
+        Le flux est récupéré par fetch_feed : une requête conditionnelle évite de le retélécharger
+        s'il n'a pas changé depuis la dernière instanciation.
+
+        Args:
+            cache_file (Optional[str]): Copie locale du flux. Par défaut get_RSS_cache_file().
         """
-        self.parsed_flow = feedparser.parse(get_RSS_URL())
+        self.feed_file, self.feed_status = fetch_feed(
+            get_RSS_URL(), cache_file or get_RSS_cache_file()
+        )
+        self.parsed_flow = feedparser.parse(self.feed_file)
         DB_HOST, DB_NAME, _ = get_DB_VARS()
         self.collection = get_collection(
             target_db=DB_HOST, client_name=DB_NAME, collection_name="episodes"
@@ -102,27 +194,46 @@ class Podcast:
         Liste les épisodes RSS qui sont plus récents que le plus récent épisode stocké dans la base de données
         et qui durent plus de `duree_mini_minutes` minutes.
 
+        La date la plus récente en base est lue une seule fois, puis les entrées sont parcourues
+        de la plus récente à la plus ancienne jusqu'à la première déjà connue.
+
         Args:
             duree_mini_minutes (int): La durée minimale en minutes des épisodes à lister. Par défaut à 15 minutes.
 
         Returns:
-            List[FeedParserDict]: Une liste d'entrées RSS correspondant aux critères.
+            List[FeedParserDict]: Une liste d'entrées RSS correspondant aux critères, de la plus récente à la plus ancienne.
         """
+        date_db = self.get_most_recent_episode_from_DB()
+        if date_db is None:
+            return []
         last_large_episodes = []
-        for entry in self.parsed_flow.entries:
-            date_rss = datetime.strptime(entry.published, RSS_DATE_FORMAT)
-            date_db = self.get_most_recent_episode_from_DB()
-            if date_db and date_rss > date_db:
-                if (
-                    RSS_episode.get_duree_in_seconds(entry.itunes_duration)
-                    > duree_mini_minutes * 60
-                ):
-                    last_large_episodes.append(entry)
+        for date_rss, entry in self.get_entries_by_date():
+            if date_rss <= date_db:
+                break
+            if (
+                RSS_episode.get_duree_in_seconds(entry.itunes_duration)
+                > duree_mini_minutes * 60
+            ):
+                last_large_episodes.append(entry)
         return last_large_episodes
 
+    def get_entries_by_date(self) -> List[Tuple[datetime, FeedParserDict]]:
+        """
+        Retourne les entrées du flux avec leur date de publication, de la plus récente à la plus ancienne.
+
+        Returns:
+            List[Tuple[datetime, FeedParserDict]]: Les couples (date de publication, entrée RSS).
+        """
+        entries = [
+            (datetime.strptime(entry.published, RSS_DATE_FORMAT), entry)
+            for entry in self.parsed_flow.entries
+        ]
+        return sorted(entries, key=lambda item: item[0], reverse=True)
+
     def store_last_large_episodes(self, duree_mini_minutes: int = 15) -> None:
         """
         Parcourt la liste des épisodes longs récents, instancie RSS_episode et les conserve dans la base de données.
+        L'existence des épisodes en base est vérifiée en une seule requête (Episode.find_existing).
         Affiche le nombre de mises à jour réussies dans la base de données.
 
         Args:
@@ -130,7 +241,12 @@ class Podcast:
         """
         updates = 0
         last_large_episodes = self.list_last_large_episodes(duree_mini_minutes)
-        for entry in last_large_episodes:
-            rss_entry = RSS_episode.from_feed_entry(entry)
-            updates += rss_entry.keep()
+        rss_entries = RSS_episode.from_feed_entries(last_large_episodes)
+        existing = RSS_episode.find_existing(
+            (rss_entry.titre, rss_entry.date) for rss_entry in rss_entries
+        )
+        for rss_entry in rss_entries:
+            updates += rss_entry.keep(
+                exists=(rss_entry.titre, rss_entry.date) in existing
+            )
         print(f"Updated episodes: {updates}")
@@ -0,0 +1,353 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: py transcription helper.ipynb.
+
+# %% auto #0
+__all__ = [
+    "TRANSCRIPTION_JOBS_COLLECTION",
+    "TRANSCRIPTION_ENGINES",
+    "split_core_sets",
+    "TranscriptionWorker",
+]
+
+# %% py transcription helper.ipynb #682730b5
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from queue import Queue
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from config import get_WHISPER_VARS
+from mongo import get_collection, get_DB_VARS
+from mongo_episode import (
+    MISSING_TRANSCRIPTION_QUERY,
+    Episode,
+    Episodes,
+    WhisperCppError,
+    extract_whisper_cpp,
+    get_whisper_pipeline,
+    load_audio,
+)
+
+TRANSCRIPTION_JOBS_COLLECTION: str = "transcription_jobs"
+TRANSCRIPTION_ENGINES: Tuple[str, ...] = ("hf", "whisper.cpp")
+
+
+def split_core_sets(n_sets: int, n_cores: Optional[int] = None) -> List[str]:
+    """Découpe les cœurs de la machine en `n_sets` plages contiguës au format cpuset.
+
+    Args:
+        n_sets (int): Nombre de plages (une par processus whisper.cpp).
+        n_cores (Optional[int], optional): Nombre de cœurs à répartir. Défaut os.cpu_count().
+
+    Returns:
+        List[str]: Plages au format attendu par `docker run --cpuset-cpus` (ex. ["0-3", "4-7"]).
+    """
+    n_cores = n_cores or os.cpu_count() or 1
+    size = max(1, n_cores // max(1, n_sets))
+    core_sets = []
+    for i in range(n_sets):
+        start = (i * size) % n_cores
+        end = min(start + size, n_cores) - 1
+        core_sets.append(f"{start}-{end}" if end > start else str(start))
+    return core_sets
+
+
+def _count_cores(core_set: str) -> int:
+    """Compte les cœurs d'une plage cpuset (ex. "0-3" -> 4, "5" -> 1)."""
+    start, _, end = core_set.partition("-")
+    return int(end or start) - int(start) + 1
+
+
+class TranscriptionWorker:
+    """
+    Transcrit en pipeline les épisodes sans transcription.
+
+    Trois étages se recouvrent :
+    - téléchargement des audios en avance dans un pool de threads,
+    - décodage / rééchantillonnage à 16 kHz dans un pool de processus (moteur "hf"),
+    - inférence, soit par un unique modèle Hugging Face gardé chaud dans le thread principal (moteur "hf"),
+      soit par N processus whisper.cpp, chacun épinglé sur sa plage de cœurs (moteur "whisper.cpp"),
+      avec repli sur le modèle Hugging Face en cas d'échec, comme Episode.set_transcription.
+
+    L'avancement est persisté dans la collection `transcription_jobs` (un document par épisode) :
+    un traitement interrompu reprend là où il s'était arrêté, et les épisodes en échec
+    `max_attempts` fois ne sont plus retentés.
+    """
+
+    def __init__(
+        self,
+        engine: str = "hf",
+        download_workers: int = 2,
+        decode_workers: int = 2,
+        whisper_cpp_workers: int = 1,
+        prefetch: Optional[int] = None,
+        max_attempts: int = 3,
+        keep_cache: bool = True,
+        vad: Optional[bool] = None,
+        collection_name: str = "episodes",
+        verbose: bool = False,
+    ) -> None:
+        """
+        Args:
+            engine (str, optional): "hf" (modèle Hugging Face unique) ou "whisper.cpp". Défaut "hf".
+            download_workers (int, optional): Nombre de téléchargements simultanés. Défaut 2.
+            decode_workers (int, optional): Nombre de processus de décodage (0 = décodage dans le thread
+                de téléchargement). Utilisé uniquement par le moteur "hf". Défaut 2.
+            whisper_cpp_workers (int, optional): Nombre de processus whisper.cpp simultanés. Défaut 1.
+            prefetch (Optional[int], optional): Nombre maximal d'épisodes préparés en avance
+                (borne l'espace disque et la mémoire utilisés). Défaut 2 x le nombre de consommateurs.
+            max_attempts (int, optional): Nombre d'échecs au-delà duquel un épisode est ignoré. Défaut 3.
+            keep_cache (bool, optional): Écrit le fichier cache .txt à côté de l'audio. Défaut True.
+            vad (Optional[bool], optional): Ne transcrit que les zones de parole (voir trim_silences).
+                Défaut WHISPER_VAD (voir config.get_WHISPER_VARS).
+            collection_name (str, optional): Collection des épisodes. Défaut "episodes".
+            verbose (bool, optional): Affiche l'avancement. Défaut False.
+        """
+        if engine not in TRANSCRIPTION_ENGINES:
+            raise ValueError(
+                f"Moteur de transcription inconnu: {engine} (attendu: {TRANSCRIPTION_ENGINES})"
+            )
+        self.engine = engine
+        self.download_workers = max(1, download_workers)
+        self.decode_workers = max(0, decode_workers)
+        self.whisper_cpp_workers = max(1, whisper_cpp_workers)
+        consumers = self.whisper_cpp_workers if engine == "whisper.cpp" else 1
+        self.prefetch = max(consumers, prefetch or 2 * consumers)
+        self.max_attempts = max_attempts
+        self.keep_cache = keep_cache
+        self.vad = get_WHISPER_VARS()[1] if vad is None else vad
+        self.collection_name = collection_name
+        self.verbose = verbose
+        # les replis Hugging Face des workers whisper.cpp se partagent un seul modèle
+        self._hf_lock = threading.Lock()
+        DB_HOST, DB_NAME, _ = get_DB_VARS()
+        self.jobs = get_collection(
+            target_db=DB_HOST,
+            client_name=DB_NAME,
+            collection_name=TRANSCRIPTION_JOBS_COLLECTION,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TranscriptionWorker(engine={self.engine}, download_workers={self.download_workers}, "
+            f"decode_workers={self.decode_workers}, whisper_cpp_workers={self.whisper_cpp_workers}, "
+            f"prefetch={self.prefetch})"
+        )
+
+    def get_abandoned_oids(self) -> List[ObjectId]:
+        """Retourne les oids des épisodes en échec au moins `max_attempts` fois."""
+        return [
+            job["episode_oid"]
+            for job in self.jobs.find(
+                {"status": "failed", "attempts": {"$gte": self.max_attempts}},
+                {"episode_oid": 1},
+            )
+        ]
+
+    def get_pending_episodes(
+        self, limit: int = -1, oldest_first: bool = True
+    ) -> List[Episode]:
+        """Liste les épisodes à transcrire (sans transcription et non abandonnés).
+
+        La liste est matérialisée (sans le champ transcription) car le traitement complet
+        dépasse largement le timeout d'un curseur Mongo.
+
+        Args:
+            limit (int, optional): Nombre maximal d'épisodes (-1 pour tous). Défaut -1.
+            oldest_first (bool, optional): Traite les épisodes les plus anciens d'abord ; avec `limit`,
+                ce sont les `limit` plus anciens (tri croissant fait par Mongo). Défaut True.
+
+        Returns:
+            List[Episode]: Épisodes dans l'ordre de traitement.
+        """
+        request: Dict[str, Any] = MISSING_TRANSCRIPTION_QUERY
+        abandoned = self.get_abandoned_oids()
+        if abandoned:
+            request = {"$and": [request, {"_id": {"$nin": abandoned}}]}
+        return list(
+            Episodes(self.collection_name).iter_episodes(
+                request,
+                projection={"transcription": 0},
+                limit=limit,
+                oldest_first=oldest_first,
+            )
+        )
+
+    def _mark(
+        self,
+        episode: Episode,
+        oid: Optional[ObjectId],
+        status: str,
+        error: Optional[str] = None,
+    ) -> None:
+        """Enregistre le statut de l'épisode dans la collection transcription_jobs."""
+        update: Dict[str, Any] = {
+            "$set": {
+                "status": status,
+                "engine": self.engine,
+                "titre": episode.titre,
+                "date": episode.date,
+                "error": error,
+                "updated_at": datetime.now(),
+            }
+        }
+        if status == "failed":
+            update["$inc"] = {"attempts": 1}
+        self.jobs.update_one({"episode_oid": oid}, update, upsert=True)
+
+    def _prepare(
+        self, episode: Episode, decoder: Optional[ProcessPoolExecutor]
+    ) -> Tuple[str, Any]:
+        """Télécharge l'audio puis prépare l'entrée du moteur (exécuté dans un thread).
+
+        Returns:
+            Tuple[str, Any]: ("cache", texte) si une transcription cachée existe, ("audio", signal)
+                pour le moteur "hf", ou ("file", chemin) pour le moteur "whisper.cpp".
+        """
+        episode.download_audio(verbose=self.verbose)
+        audio_filename = episode.get_audio_fullfilename()
+        if audio_filename is None or not os.path.exists(audio_filename):
+            raise FileNotFoundError(
+                f"Audio indisponible pour l'épisode {episode.titre}"
+            )
+        cache_filename = f"{os.path.splitext(audio_filename)[0]}.txt"
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "r") as file:
+                return "cache", file.read()
+        if self.engine == "whisper.cpp":
+            return "file", audio_filename
+        if decoder is None:
+            return "audio", load_audio(audio_filename, vad=self.vad)
+        return (
+            "audio",
+            decoder.submit(load_audio, audio_filename, vad=self.vad).result(),
+        )
+
+    def _transcribe_audio(self, audio: Any) -> str:
+        """Transcrit un signal 16 kHz avec le pipeline Hugging Face gardé en cache."""
+        return get_whisper_pipeline()(audio, return_timestamps=True)["text"]
+
+    def _transcribe_file(self, audio_filename: str, core_sets: "Queue[str]") -> str:
+        """Transcrit un fichier avec whisper.cpp sur une plage de cœurs réservée le temps de l'appel.
+
+        Si whisper.cpp échoue (WhisperCppError), le fichier est transcrit par le pipeline Hugging Face,
+        un repli à la fois.
+        """
+        core_set = core_sets.get()
+        try:
+            threads = str(_count_cores(core_set))
+            transcription, _ = extract_whisper_cpp(
+                audio_filename,
+                extra_env={"WHISPER_THREADS": threads, "WHISPER_CPUSET": core_set},
+                vad=self.vad,
+            )
+            return transcription
+        except WhisperCppError as exc:
+            if self.verbose:
+                print(f"whisper.cpp indisponible ({exc}). Repli sur Hugging Face.")
+        finally:
+            core_sets.put(core_set)
+        with self._hf_lock:
+            return self._transcribe_audio(load_audio(audio_filename, vad=self.vad))
+
+    def _finish(
+        self, episode: Episode, prepared: "Future[Tuple[str, Any]]", core_sets
+    ) -> bool:
+        """Termine le traitement d'un épisode : inférence, sauvegarde et suivi d'avancement."""
+        oid = episode.get_oid()
+        start_time = time.time()
+        try:
+            kind, payload = prepared.result()
+            if kind == "cache":
+                transcription = payload
+            elif kind == "audio":
+                transcription = self._transcribe_audio(payload)
+            else:
+                transcription = self._transcribe_file(payload, core_sets)
+            episode.save_transcription(
+                transcription, keep_cache=self.keep_cache and kind != "cache"
+            )
+        except Exception as exc:
+            self._mark(episode, oid, "failed", error=str(exc))
+            if self.verbose:
+                print(f"Échec de la transcription de {episode.titre}: {exc}")
+            return False
+        self._mark(episode, oid, "done")
+        if self.verbose:
+            print(
+                f"Transcription de {episode.titre} ({episode.date}) terminée "
+                f"en {time.time() - start_time:.0f} s ({kind})"
+            )
+        return True
+
+    def run(
+        self, episodes: Optional[List[Episode]] = None, limit: int = -1
+    ) -> Dict[str, int]:
+        """Transcrit les épisodes en pipeline.
+
+        Args:
+            episodes (Optional[List[Episode]], optional): Épisodes à traiter. Défaut get_pending_episodes(limit).
+            limit (int, optional): Nombre maximal d'épisodes quand `episodes` n'est pas fourni. Défaut -1.
+
+        Returns:
+            Dict[str, int]: Compteurs {"done": ..., "failed": ...}.
+        """
+        if episodes is None:
+            episodes = self.get_pending_episodes(limit=limit)
+        if self.verbose:
+            print(f"{len(episodes)} épisode(s) à transcrire avec {self}")
+        report = {"done": 0, "failed": 0}
+        if not episodes:
+            return report
+
+        core_sets: "Queue[str]" = Queue()
+        for core_set in split_core_sets(self.whisper_cpp_workers):
+            core_sets.put(core_set)
+        use_decoder = self.engine == "hf" and self.decode_workers > 0
+        decoder = ProcessPoolExecutor(self.decode_workers) if use_decoder else None
+        downloader = ThreadPoolExecutor(self.download_workers)
+        inference = (
+            ThreadPoolExecutor(self.whisper_cpp_workers)
+            if self.engine == "whisper.cpp"
+            else None
+        )
+        pending = iter(episodes)
+        window: Deque[Tuple[Episode, Future]] = deque()
+
+        def submit_next() -> None:
+            episode = next(pending, None)
+            if episode is None:
+                return
+            prepared = downloader.submit(self._prepare, episode, decoder)
+            if inference is not None:
+                window.append(
+                    (
+                        episode,
+                        inference.submit(self._finish, episode, prepared, core_sets),
+                    )
+                )
+            else:
+                window.append((episode, prepared))
+
+        try:
+            for _ in range(self.prefetch):
+                submit_next()
+            while window:
+                episode, future = window.popleft()
+                if inference is not None:
+                    success = future.result()
+                else:
+                    # moteur "hf" : un seul modèle, utilisé depuis le thread principal
+                    success = self._finish(episode, future, core_sets)
+                report["done" if success else "failed"] += 1
+                submit_next()
+        finally:
+            downloader.shutdown(wait=True, cancel_futures=True)
+            if inference is not None:
+                inference.shutdown(wait=True, cancel_futures=True)
+            if decoder is not None:
+                decoder.shutdown(wait=True, cancel_futures=True)
+        return report
@@ -73,7 +73,7 @@ def list_audio_files(
 
 # %% 09 whisper mp3.ipynb 8
 import torch
-from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+from mongo_episode import get_whisper_pipeline
 
 
 def extract_whisper(audio_filename: str) -> str:
@@ -91,31 +91,19 @@ def extract_whisper(audio_filename: str) -> str:
 
     model_id = "openai/whisper-large-v3-turbo"
 
-    model = AutoModelForSpeechSeq2Seq.from_pretrained(
-        model_id, torch_dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
-    )
-    model.to(device)
-
-    processor = AutoProcessor.from_pretrained(model_id)
+    # modèle, processeur et pipeline construits une seule fois par processus
+    # (cache partagé avec mongo_episode, par modèle, device et dtype)
+    pipe = get_whisper_pipeline(model_id, device=device, dtype=torch_dtype)
 
     generate_kwargs = {
         "language": "fr",
     }
 
-    pipe = pipeline(
-        "automatic-speech-recognition",
-        model=model,
-        tokenizer=processor.tokenizer,
-        feature_extractor=processor.feature_extractor,
-        torch_dtype=torch_dtype,
-        device=device,
+    result = pipe(
+        audio_filename,
         chunk_length_s=30,
         batch_size=16,  # batch size for inference - set based on your device
         generate_kwargs=generate_kwargs,
-    )
-
-    result = pipe(
-        audio_filename,
         return_timestamps=True,
         ignore_warning=True,
     )
@@ -124,82 +112,32 @@ def extract_whisper(audio_filename: str) -> str:
 
 
 # %% 09 whisper mp3.ipynb 11
-from pydub import AudioSegment
-import tempfile
-import os
-import soundfile as sf
-import torch
+import mongo_episode
+from typing import Optional
 
 
 def extract_whisper_long(
-    audio_filename: str, chunk_s: int = 30, overlap_s: int = 1
+    audio_filename: str,
+    chunk_s: int = 30,
+    overlap_s: int = 1,
+    batch_size: Optional[int] = None,
+    vad: Optional[bool] = None,
 ) -> str:
     """
-    Splits long audio into overlapping chunks, preprocesses each chunk with the processor
-    (using return_attention_mask) and runs model.generate for each chunk, then returns concatenated text.
+    Splits long audio into overlapping chunks, runs model.generate on batches of chunks with the
+    cached Whisper model, then returns concatenated text.
 
-    Important: ensure audio chunks are sampled at the feature extractor's expected rate (16kHz).
-    This implementation exports each chunk to WAV at 16000 Hz to avoid the sampling-rate ValueError.
+    Delegates to mongo_episode.extract_whisper_long: the file is decoded once to 16 kHz mono
+    float32 and chunks are zero-copy views, without temporary WAV files. `batch_size` and `vad`
+    default to WHISPER_BATCH_SIZE and WHISPER_VAD (see config.get_WHISPER_VARS), read at call time.
     """
-    device = "cuda:0" if torch.cuda.is_available() else "cpu"
-    torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-    model_id = "openai/whisper-large-v3-turbo"
-
-    model = AutoModelForSpeechSeq2Seq.from_pretrained(
-        model_id, torch_dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
+    return mongo_episode.extract_whisper_long(
+        audio_filename,
+        chunk_s=chunk_s,
+        overlap_s=overlap_s,
+        batch_size=batch_size,
+        vad=vad,
     )
-    model.to(device)
-    processor = AutoProcessor.from_pretrained(model_id)
-
-    generate_kwargs = {"language": "fr"}
-
-    seg = AudioSegment.from_file(audio_filename)
-    dur_ms = len(seg)
-    step_ms = (chunk_s - overlap_s) * 1000
-    chunk_ms = chunk_s * 1000
-    texts = []
-
-    for start in range(0, max(1, dur_ms), int(step_ms)):
-        end = start + chunk_ms
-        piece = seg[start:end]
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
-            # Export the chunk as WAV forced to 16 kHz to match WhisperFeatureExtractor expectations
-            # requires ffmpeg (used by pydub) available in the container.
-            piece.export(tmp_path, format="wav", parameters=["-ar", "16000"])
-        try:
-            # read chunk as numpy array (float) + sr
-            speech, sr = sf.read(tmp_path)
-            if sr != processor.feature_extractor.sampling_rate:
-                raise RuntimeError(
-                    f"Unexpected sampling rate {sr}, expected {processor.feature_extractor.sampling_rate}"
-                )
-
-            # processor -> return_tensors="pt" and return_attention_mask to follow deprecation guidance
-            inputs = processor(
-                speech,
-                sampling_rate=sr,
-                return_tensors="pt",
-                return_attention_mask=True,
-            )
-            # support both possible keys
-            feat = inputs.get("input_features", inputs.get("input_values"))
-            if feat is None:
-                raise RuntimeError("Processor did not return input features")
-            feat = feat.to(device).to(dtype=torch_dtype)
-
-            # run generate on model
-            generated = model.generate(feat, **generate_kwargs)
-            decoded = processor.tokenizer.batch_decode(
-                generated, skip_special_tokens=True
-            )
-            texts.append(decoded[0].strip() if decoded else "")
-        finally:
-            os.remove(tmp_path)
-        if end >= dur_ms:
-            break
-
-    return " ".join(t for t in texts if t)
 
 
 # %% 09 whisper mp3.ipynb 15
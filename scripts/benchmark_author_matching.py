@@ -0,0 +1,156 @@
+import sys
+import os
+import argparse
+import random
+import time
+
+# Ajouter le chemin du répertoire 'nbs' à sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../nbs")))
+
+from mongo_auteur import RAPIDFUZZ_AVAILABLE, AuthorFuzzMatcher
+from thefuzz import fuzz, process
+from rich import print as rprint
+from rich.table import Table
+
+# syllabes combinées pour produire des noms variés (prénoms et noms)
+SYLLABES = [c + v for c in "bcdfgjlmnprstvz" for v in ["a", "e", "i", "o", "ou", "an"]]
+SYLLABES += ["ber", "cha", "gau", "tier", "mont", "dra", "cle", "zio", "proust"]
+
+
+def random_word(rng):
+    """Un mot de 2 ou 3 syllabes, avec une majuscule."""
+    return "".join(rng.choice(SYLLABES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def random_authors(size, rng):
+    """`size` noms d'auteurs synthétiques distincts (prénom nom)."""
+    authors = set()
+    while len(authors) < size:
+        authors.add(f"{random_word(rng)} {random_word(rng)}")
+    return sorted(authors)
+
+
+def typo(name, rng):
+    """Une variante de `name` comme en produit la transcription : une lettre remplacée."""
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice("aeiourst") + name[position + 1 :]
+
+
+def make_queries(authors, count, rng):
+    """Moitié de variantes de noms connus, moitié de noms absents de la table."""
+    known = [typo(name, rng) for name in rng.sample(authors, count // 2)]
+    unknown = [
+        f"{random_word(rng)} {random_word(rng)}" for _ in range(count - len(known))
+    ]
+    queries = known + unknown
+    rng.shuffle(queries)
+    return queries
+
+
+def linear_match(name, authors, min_score=80):
+    """Ancien comportement : process.extractOne sur toute la liste."""
+    best_match, score = process.extractOne(name, authors, scorer=fuzz.token_set_ratio)
+    return (best_match if score >= min_score else None), score
+
+
+def benchmark(sizes, queries_count, linear_limit, seed):
+    """Mesure préparation, latence par requête et match_many pour chaque taille de table."""
+    results = []
+    for size in sizes:
+        rng = random.Random(seed)
+        authors = random_authors(size, rng)
+        queries = make_queries(authors, queries_count, rng)
+
+        start_time = time.perf_counter()
+        matcher = AuthorFuzzMatcher(authors)
+        matcher.find_best_match(queries[0])
+        build_s = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        single = [matcher.find_best_match(name) for name in queries]
+        single_ms = (time.perf_counter() - start_time) * 1000 / len(queries)
+
+        start_time = time.perf_counter()
+        many = matcher.match_many(queries)
+        many_ms = (time.perf_counter() - start_time) * 1000 / len(queries)
+
+        linear_ms, agreement = None, None
+        if size <= linear_limit:
+            start_time = time.perf_counter()
+            linear = [linear_match(name, authors)[0] for name in queries]
+            linear_ms = (time.perf_counter() - start_time) * 1000 / len(queries)
+            found = [name for name, _ in many]
+            agreement = sum(a == b for a, b in zip(found, linear)) / len(queries)
+
+        results.append(
+            {
+                "size": size,
+                "build_s": build_s,
+                "single_ms": single_ms,
+                "many_ms": many_ms,
+                "linear_ms": linear_ms,
+                "agreement": agreement,
+                "same_results": single == many,
+            }
+        )
+    return results
+
+
+def main(args):
+    results = benchmark(args.sizes, args.queries, args.linear_limit, args.seed)
+
+    table = Table(
+        title=(
+            f"AuthorFuzzMatcher sur {args.queries} requêtes "
+            f"({'rapidfuzz' if RAPIDFUZZ_AVAILABLE else 'thefuzz'})"
+        )
+    )
+    table.add_column("auteurs", justify="right")
+    table.add_column("préparation (s)", justify="right")
+    table.add_column("find_best_match (ms)", justify="right")
+    table.add_column("match_many (ms/nom)", justify="right")
+    table.add_column("linéaire (ms)", justify="right")
+    table.add_column("accord linéaire", justify="right")
+    table.add_column("résultats identiques", justify="center")
+    for result in results:
+        table.add_row(
+            str(result["size"]),
+            f"{result['build_s']:.2f}",
+            f"{result['single_ms']:.2f}",
+            f"{result['many_ms']:.3f}",
+            "-" if result["linear_ms"] is None else f"{result['linear_ms']:.1f}",
+            "-" if result["agreement"] is None else f"{result['agreement']:.0%}",
+            "oui" if result["same_results"] else "non",
+        )
+    rprint(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="benchmark_author_matching.py",
+        description=(
+            "Mesure la latence de AuthorFuzzMatcher (blocage des candidats et scoring par lots) "
+            "selon la taille de la table des auteurs, sur des noms synthétiques : "
+            "variantes de noms connus et noms absents. L'ancien parcours linéaire "
+            "(extractOne sur toute la liste) sert de référence jusqu'à --linear-limit auteurs."
+        ),
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[1000, 10000, 100000],
+        help="Tailles de table à comparer, séparées par des virgules (défaut 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "-q", "--queries", type=int, default=200, help="Nombre de noms recherchés"
+    )
+    parser.add_argument(
+        "--linear-limit",
+        type=int,
+        default=10000,
+        help="Taille maximale pour mesurer le parcours linéaire (lent)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur")
+    args = parser.parse_args()
+    main(args)
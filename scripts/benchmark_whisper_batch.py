@@ -0,0 +1,125 @@
+import sys
+import os
+import argparse
+import time
+import warnings
+
+# Ajouter le chemin du répertoire 'nbs' à sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../nbs")))
+
+from mongo_episode import (
+    WHISPER_SAMPLING_RATE,
+    load_audio,
+    transcribe_long_audio,
+    _get_whisper_device,
+)
+from rich import print as rprint
+from rich.table import Table
+
+# il faudra executer ce script avec l'interpreter python whisper
+
+
+def benchmark(audio, batch_sizes, chunk_s, overlap_s, repeat):
+    """Mesure le temps de transcription de `audio` pour chaque taille de lot."""
+    audio_duration = len(audio) / WHISPER_SAMPLING_RATE
+    # echauffement : chargement du modele (mis en cache) hors mesure
+    transcribe_long_audio(
+        audio[: chunk_s * WHISPER_SAMPLING_RATE], chunk_s=chunk_s, overlap_s=overlap_s
+    )
+
+    results = []
+    reference_text = None
+    for batch_size in batch_sizes:
+        durations = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            text = transcribe_long_audio(
+                audio, chunk_s=chunk_s, overlap_s=overlap_s, batch_size=batch_size
+            )
+            durations.append(time.perf_counter() - start_time)
+        if reference_text is None:
+            reference_text = text
+        best = min(durations)
+        results.append(
+            {
+                "batch_size": batch_size,
+                "best_s": best,
+                "realtime": audio_duration / best,
+                "same_text": text == reference_text,
+            }
+        )
+    return results
+
+
+def main(args):
+    audio = load_audio(args.audio)
+    if args.duration > 0:
+        audio = audio[: args.duration * WHISPER_SAMPLING_RATE]
+    device, torch_dtype = _get_whisper_device()
+
+    results = benchmark(
+        audio,
+        batch_sizes=args.batch_sizes,
+        chunk_s=args.chunk_s,
+        overlap_s=args.overlap_s,
+        repeat=args.repeat,
+    )
+
+    table = Table(
+        title=(
+            f"extract_whisper_long sur {os.path.basename(args.audio)} "
+            f"({len(audio) / WHISPER_SAMPLING_RATE:.0f} s, {device}, {torch_dtype})"
+        )
+    )
+    table.add_column("batch_size", justify="right")
+    table.add_column("durée (s)", justify="right")
+    table.add_column("x temps réel", justify="right")
+    table.add_column("gain vs premier", justify="right")
+    table.add_column("texte identique", justify="center")
+    for result in results:
+        table.add_row(
+            str(result["batch_size"]),
+            f"{result['best_s']:.1f}",
+            f"{result['realtime']:.1f}",
+            f"{results[0]['best_s'] / result['best_s']:.2f}",
+            "oui" if result["same_text"] else "non",
+        )
+    rprint(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="benchmark_whisper_batch.py",
+        description=(
+            "Compare les performances de extract_whisper_long selon la taille des lots de fenêtres "
+            "passés à model.generate, sur un fichier audio local fixe (tronqué à --duration secondes). "
+            "Le modèle est chargé une seule fois avant les mesures."
+        ),
+    )
+    parser.add_argument("audio", type=str, help="Fichier audio de référence")
+    parser.add_argument(
+        "-b",
+        "--batch-sizes",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[1, 2, 4, 8],
+        help="Tailles de lots à comparer, séparées par des virgules (défaut 1,2,4,8)",
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=int,
+        default=300,
+        help="Durée audio utilisée en secondes (0 pour tout le fichier)",
+    )
+    parser.add_argument("--chunk-s", type=int, default=30, help="Durée d'une fenêtre")
+    parser.add_argument(
+        "--overlap-s", type=int, default=1, help="Recouvrement entre fenêtres"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=1, help="Nombre de mesures par taille"
+    )
+    args = parser.parse_args()
+
+    # Ignorer les warnings
+    warnings.filterwarnings("ignore")
+    main(args)
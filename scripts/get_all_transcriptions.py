@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import dbus
 import time
 import warnings
@@ -10,7 +11,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../nbs"
 # il faudra executer ce script dans le repo (utilisation de la lib git)
 # et avec l'interpreter python whisper
 
-from mongo_episode import Episodes, Episode
+from transcription import TranscriptionWorker, TRANSCRIPTION_ENGINES
 
 
 def print_duree_traitement(start_time, end_time):
@@ -32,7 +33,7 @@ def print_duree_traitement(start_time, end_time):
         )
 
 
-def main():
+def main(args):
 
     # Connexion au bus D-Bus
     bus = dbus.SessionBus()
@@ -41,31 +42,97 @@ def main():
     )
     interface = dbus.Interface(proxy, "org.freedesktop.ScreenSaver")
 
-    episodes = Episodes()
-    episodes.get_missing_transcriptions()
-
-    for oid_episode in reversed(episodes):
-        episode = Episode.from_oid(oid_episode)
-        # Prévenir la mise en veille
-        cookie = interface.Inhibit("my_script", "Long running process")
-        print("Mise en veille deactivee")
-        print("On va recuperer la transcription de l'episode \n")
-        print(episode)
-        try:
-            # Votre traitement long ici
-            start_time = time.time()
-            episode.set_transcription(verbose=True)
-            end_time = time.time()
-            print_duree_traitement(start_time=start_time, end_time=end_time)
+    worker = TranscriptionWorker(
+        engine=args.engine,
+        download_workers=args.download_workers,
+        decode_workers=args.decode_workers,
+        whisper_cpp_workers=args.whisper_cpp_workers,
+        max_attempts=args.max_attempts,
+        vad=args.vad,
+        verbose=True,
+    )
+    # les episodes deja transcrits ou abandonnes (trop d'echecs) sont ignores :
+    # le script peut etre interrompu puis relance
+    missing_episodes = worker.get_pending_episodes(limit=args.limit)
 
-        finally:
-            # Réactiver la mise en veille normale
-            print("Mise en veille normale reactivee")
-            interface.UnInhibit(cookie)
-        print(episodes)
+    # Prévenir la mise en veille
+    cookie = interface.Inhibit("my_script", "Long running process")
+    print("Mise en veille deactivee")
+    try:
+        start_time = time.time()
+        report = worker.run(missing_episodes)
+        end_time = time.time()
+        print(
+            f"{report['done']} transcription(s) terminee(s), {report['failed']} echec(s)"
+        )
+        print_duree_traitement(start_time=start_time, end_time=end_time)
+    finally:
+        # Réactiver la mise en veille normale
+        print("Mise en veille normale reactivee")
+        interface.UnInhibit(cookie)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="get_all_transcriptions.py",
+        description=(
+            "Transcrit tous les épisodes sans transcription, du plus ancien au plus récent. "
+            "Les téléchargements et le décodage audio sont faits en avance, en parallèle de l'inférence. "
+            "L'avancement est enregistré dans la collection transcription_jobs."
+        ),
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=TRANSCRIPTION_ENGINES,
+        default="whisper.cpp",
+        help=(
+            "Moteur de transcription : processus whisper.cpp avec repli sur Hugging Face en cas "
+            "d'échec (défaut, comme Episode.set_transcription) ou modèle Hugging Face unique (hf)"
+        ),
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=2,
+        help="Nombre de téléchargements simultanés",
+    )
+    parser.add_argument(
+        "--decode-workers",
+        type=int,
+        default=2,
+        help="Nombre de processus de décodage audio (moteur hf)",
+    )
+    parser.add_argument(
+        "--whisper-cpp-workers",
+        type=int,
+        default=1,
+        help="Nombre de processus whisper.cpp simultanés, chacun sur sa plage de cœurs",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Nombre d'échecs au-delà duquel un épisode n'est plus retenté",
+    )
+    parser.add_argument(
+        "--vad",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Ne transcrire que les zones de parole (silences retirés avant l'inférence) ; "
+            "par défaut WHISPER_VAD, --no-vad le désactive"
+        ),
+    )
+    parser.add_argument(
+        "-l",
+        "--limit",
+        type=int,
+        default=-1,
+        help="Nombre maximal d'épisodes à traiter (-1 pour tous)",
+    )
+    args = parser.parse_args()
+
     # Ignorer les warnings
     warnings.filterwarnings("ignore")
-    main()
+    main(args)
@@ -0,0 +1,77 @@
+import sys
+import os
+import argparse
+
+# Ajouter le chemin du répertoire 'nbs' à sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../nbs")))
+
+from mongo_indexes import INDEX_SPECS, ensure_indexes, index_usage_report
+
+
+def print_create_report(report):
+    """Affiche le rapport de ensure_indexes, une ligne par index déclaré."""
+    for item in report:
+        line = f"{item['collection']:<20} {item['name']:<45} {item['status']}"
+        if item["error"]:
+            line += f" ({item['error']})"
+        print(line)
+
+
+def print_usage_report(report):
+    """Affiche le rapport de index_usage_report, une ligne par index."""
+    for item in report:
+        declared = "déclaré" if item["declared"] else "non déclaré"
+        since = f" depuis {item['since']:%Y-%m-%d %H:%M}" if item["since"] else ""
+        print(
+            f"{item['collection']:<20} {item['name']:<45} {item['status']:<8} "
+            f"{item['ops']:>8} accès{since} ({declared})"
+        )
+
+
+def main(args):
+    if args.command == "migrate":
+        # import tardif : mongo_episode charge les dépendances de transcription
+        from mongo_episode import Episodes
+
+        episodes = Episodes()
+        print(episodes.migrate_flags())
+        print(f"{episodes.migrate_transcriptions()} transcription(s) déplacée(s)")
+        args.command = "create"
+    if args.command == "report":
+        print_usage_report(index_usage_report(args.collections))
+        return 0
+    report = ensure_indexes(args.collections, dry_run=args.command == "check")
+    print_create_report(report)
+    # code de retour non nul si un index manque ou n'a pas pu être créé
+    return int(any(item["status"] not in ("exists", "created") for item in report))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="manage_indexes.py",
+        description=(
+            "Gère les index MongoDB déclarés dans nbs/mongo_indexes.py. "
+            "create : crée les index manquants (idempotent). "
+            "check : liste les index manquants ou en conflit sans rien écrire. "
+            "migrate : renseigne has_transcription et normalise masked sur les épisodes, "
+            "déplace les transcriptions dans leur collection, puis crée les index. "
+            "report : compare les index présents à leur utilisation ($indexStats)."
+        ),
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["create", "check", "migrate", "report"],
+        default="create",
+        help="Action à effectuer (défaut create)",
+    )
+    parser.add_argument(
+        "-c",
+        "--collection",
+        dest="collections",
+        action="append",
+        choices=sorted(INDEX_SPECS),
+        help="Collection à traiter (répétable, défaut toutes)",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args))
@@ -55,10 +55,10 @@ def ajoute_auteurs(episode: Episode, verbose=False):
     )
     analyse_dict = {}
 
-    for auteur in auteurs:
-        auteur_corrige_dict = ac.check_author(
-            auteur, return_details=True, verbose=verbose
-        )
+    # verification des auteurs en parallele (appels llm et google limites par fournisseur),
+    # resultats dans l'ordre de la liste
+    auteurs_corriges = ac.check_authors(auteurs, return_details=True, verbose=verbose)
+    for auteur, auteur_corrige_dict in zip(auteurs, auteurs_corriges):
         if verbose:
             print(auteur_corrige_dict)
         # check_author retourne None dans author_corrected si le process via rss:metadata, db, llm, web search n'a rien renvoye
@@ -144,9 +144,14 @@ if __name__ == "__main__":
     # on prend la date la plus recente entre date et date_cache
     date = date if date > date_cache else date_cache
     episodes = Episodes()
-    episodes.get_entries({"date": {"$gte": date}})
-    for oid_episode in episodes:
-        episode = Episode.from_oid(oid_episode)
+    # liste materialisee (sans les transcriptions) : le traitement complet (appels llm et web)
+    # depasse largement le timeout d'inactivite d'un curseur Mongo
+    a_traiter = list(
+        episodes.iter_episodes(
+            {"date": {"$gte": date}}, projection={"transcription": 0}
+        )
+    )
+    for episode in a_traiter:
         if episode.date > date:
             ajoute_auteurs(episode, verbose=args.verbose)
             # on sauvegarde la date de traitement
@@ -53,10 +53,10 @@ def ajoute_auteurs(episode: Episode, verbose=False):
     )
     analyse_dict = {}
 
-    for auteur in auteurs:
-        auteur_corrige_dict = ac.check_author(
-            auteur, return_details=True, verbose=verbose
-        )
+    # verification des auteurs en parallele (appels llm et google limites par fournisseur),
+    # resultats dans l'ordre de la liste
+    auteurs_corriges = ac.check_authors(auteurs, return_details=True, verbose=verbose)
+    for auteur, auteur_corrige_dict in zip(auteurs, auteurs_corriges):
         if verbose:
             print(auteur_corrige_dict)
         # check_author retourne None dans author_corrected si le process via rss:metadata, db, llm, web search n'a rien renvoye
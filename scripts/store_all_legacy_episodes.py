@@ -7,18 +7,27 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../nbs"
 # il faudra executer ce script dans le repo (utilisation de la lib git)
 # et avec l'interpreter python whisper
 
+from collections import Counter
+
 from mongo_episode import WEB_episode, Episodes
 from web import WebPage
 
 
 def main():
     legacy_episodes = WebPage()
-    for episode in legacy_episodes:
-        vieil_episode = WEB_episode.from_webpage_entry(episode)
-        vieil_episode.keep()
-        print(vieil_episode)
+    # aucune requête par entrée : bulk_keep vérifie l'existence en lot puis ne récupère
+    # l'URL audio (page de l'épisode) que pour les nouveaux épisodes, en parallèle
+    vieux_episodes = [
+        WEB_episode.from_webpage_entry(episode, resolve_audio=False)
+        for episode in legacy_episodes
+    ]
 
     episodes = Episodes()
+    report = episodes.bulk_keep(vieux_episodes)
+    for item in report:
+        if item["status"] == "failed":
+            print(f"{item['date']} - {item['titre']}: {item['error']}")
+    print(dict(Counter(item["status"] for item in report)))
     print(episodes.len_total_entries())
 
 
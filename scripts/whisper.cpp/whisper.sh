@@ -27,6 +27,7 @@ DOCKER_IMAGE="${WHISPER_DOCKER_IMAGE:-ghcr.io/ggml-org/whisper.cpp:main-cuda}"
 MODEL_FILENAME="${WHISPER_MODEL_FILENAME:-ggml-large-v3.bin}"
 MODEL_URL="${WHISPER_MODEL_URL:-https://huggingface.co/ggerganov/whisper.cpp/resolve/main/${MODEL_FILENAME}?download=1}"
 WHISPER_THREADS="${WHISPER_THREADS:-}"
+WHISPER_CPUSET="${WHISPER_CPUSET:-}"
 WHISPER_BINARY="${WHISPER_ENTRYPOINT:-/app/build/bin/whisper-cli}"
 
 mkdir -p "$LOG_DIR"
@@ -115,7 +116,13 @@ if [ -n "$WHISPER_THREADS" ]; then
     docker_cmd+=("--threads" "$WHISPER_THREADS")
 fi
 
+docker_opts=()
+if [ -n "$WHISPER_CPUSET" ]; then
+    docker_opts+=("--cpuset-cpus" "$WHISPER_CPUSET")
+fi
+
 docker run --rm \
+  ${docker_opts[@]+"${docker_opts[@]}"} \
   -v "${MODELS_DIR}:/models" \
   -v "${AUDIO_ROOT}:/audios" \
   --entrypoint "$WHISPER_BINARY" \
@@ -61,9 +61,24 @@ def mock_mongodb(monkeypatch):
     # Mock de pymongo.MongoClient
     monkeypatch.setattr("pymongo.MongoClient", lambda *args, **kwargs: mock_client)
 
+    # Vider le registre de clients partagés pour que chaque test voie son propre mock
+    for module_name in ("mongo", "nbs.mongo"):
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(getattr(module, "_clients", None), dict):
+            module._clients.clear()
+
     return mock_collection
 
 
+@pytest.fixture(autouse=True)
+def reset_settings():
+    """Vide la configuration partagée pour que chaque test relise son environnement"""
+    for module_name in ("config", "nbs.config"):
+        module = sys.modules.get(module_name)
+        if module is not None and hasattr(module, "reload_settings"):
+            module._settings = None
+
+
 @pytest.fixture
 def test_config():
     """Configuration de test basique"""
@@ -8,6 +8,8 @@ from nbs.config import (
     get_audio_path,
     get_DB_VARS,
     get_WEB_filename,
+    get_RSS_cache_file,
+    get_WHISPER_VARS,
     get_gemini_api_key,
     get_openai_api_key,
     get_google_projectID,
@@ -174,6 +176,33 @@ class TestConfigDatabaseWeb:
         assert db_name is None
         assert db_logs is None
 
+    def test_get_WHISPER_VARS_with_environment(self, monkeypatch):
+        """Test get_WHISPER_VARS convertit les variables d'environnement"""
+        # ARRANGE
+        monkeypatch.setenv("WHISPER_BATCH_SIZE", "8")
+        monkeypatch.setenv("WHISPER_VAD", "True")
+
+        # ACT
+        batch_size, vad = get_WHISPER_VARS()
+
+        # ASSERT
+        assert batch_size == 8
+        assert vad is True
+
+    def test_get_WHISPER_VARS_defaults(self, monkeypatch):
+        """Test get_WHISPER_VARS retourne les valeurs par défaut"""
+        # ARRANGE
+        monkeypatch.delenv("WHISPER_BATCH_SIZE", raising=False)
+        monkeypatch.delenv("WHISPER_VAD", raising=False)
+        monkeypatch.setattr("nbs.config.load_env", lambda: None)
+
+        # ACT
+        batch_size, vad = get_WHISPER_VARS()
+
+        # ASSERT
+        assert batch_size == 4
+        assert vad is False
+
     def test_get_WEB_filename_with_environment(self, monkeypatch):
         """Test get_WEB_filename with custom environment variable"""
 
@@ -219,6 +248,36 @@ class TestConfigDatabaseWeb:
         expected = "/fake/project/db/À écouter plus tard I Radio France/À écouter plus tard I Radio France.html"
         assert result == expected
 
+    def test_get_RSS_cache_file_with_environment(self, monkeypatch):
+        """Test get_RSS_cache_file with custom environment variable"""
+
+        # ARRANGE
+        def mock_getenv(key, default=None):
+            if key == "RSS_CACHE_FILE":
+                return "cache/rss_feed.xml"
+            return None
+
+        monkeypatch.setattr(os, "getenv", mock_getenv)
+        monkeypatch.setattr("nbs.config.get_git_root", lambda path: "/fake/project")
+
+        # ACT
+        result = get_RSS_cache_file()
+
+        # ASSERT
+        assert result == "/fake/project/cache/rss_feed.xml"
+
+    def test_get_RSS_cache_file_with_default(self, monkeypatch):
+        """Test get_RSS_cache_file defaults to the user cache directory"""
+
+        # ARRANGE
+        monkeypatch.setattr(os, "getenv", lambda key, default=None: None)
+
+        # ACT
+        result = get_RSS_cache_file()
+
+        # ASSERT
+        assert result.endswith(os.path.join(".cache", "lmelp", "rss_feed.xml"))
+
 
 class TestConfigApiKeys:
     """Test API key configuration functions"""
@@ -355,3 +414,85 @@ class TestConfigAudioPathExtended:
         assert isinstance(result, str)
         assert test_path in result
         assert test_year in result
+
+
+class TestConfigSettings:
+    """Tests pour la configuration partagée (get_settings / reload_settings)"""
+
+    @pytest.fixture
+    def dotenv_file(self, tmp_path, monkeypatch):
+        """Un fichier .env temporaire, cherché par find_dotenv à la place de celui du projet"""
+        import nbs.config as config
+
+        path = tmp_path / ".env"
+        path.write_text("LMELP_TEST_VALUE=premier\n")
+        calls = []
+
+        def fake_find_dotenv():
+            calls.append(1)
+            return str(path)
+
+        monkeypatch.setattr(config, "find_dotenv", fake_find_dotenv)
+        monkeypatch.setattr(config, "_dotenv_path", None)
+        monkeypatch.setattr(config, "_dotenv_keys", set())
+        monkeypatch.delenv("LMELP_TEST_VALUE", raising=False)
+        yield path, calls
+        os.environ.pop("LMELP_TEST_VALUE", None)
+
+    def test_settings_read_once(self, monkeypatch, dotenv_file):
+        """Test que le fichier .env n'est cherché qu'une fois et que les valeurs sont mises en cache"""
+        from nbs.config import get_settings, reload_settings
+
+        _, calls = dotenv_file
+        monkeypatch.setenv("DB_NAME", "premiere_base")
+
+        first = get_settings()
+        monkeypatch.setenv("DB_NAME", "autre_base")
+        second = get_settings()
+
+        assert second is first
+        assert get_DB_VARS()[1] == "premiere_base"
+        assert len(calls) == 1
+        assert reload_settings().db_name == "autre_base"
+        assert get_DB_VARS()[1] == "autre_base"
+
+    def test_settings_immutable(self):
+        """Test que la configuration partagée ne peut pas être modifiée"""
+        from dataclasses import FrozenInstanceError
+        from nbs.config import get_settings
+
+        with pytest.raises(FrozenInstanceError):
+            get_settings().db_name = "autre"
+
+    def test_reload_rereads_dotenv_without_overriding_process_env(
+        self, monkeypatch, dotenv_file
+    ):
+        """Test que reload_settings relit le .env sans écraser l'environnement du processus"""
+        from nbs.config import load_env, reload_settings
+
+        path, _ = dotenv_file
+        monkeypatch.setenv("DB_HOST", "hote_du_processus")
+        load_env()
+        assert os.environ["LMELP_TEST_VALUE"] == "premier"
+
+        path.write_text("LMELP_TEST_VALUE=second\nDB_HOST=hote_du_fichier\n")
+        settings = reload_settings()
+
+        assert os.environ["LMELP_TEST_VALUE"] == "second"
+        assert settings.db_host == "hote_du_processus"
+
+    def test_watch_dotenv_reloads_on_change(self, monkeypatch, dotenv_file):
+        """Test qu'avec CONFIG_WATCH_DOTENV, une modification du .env est prise en compte"""
+        from nbs.config import get_settings
+
+        path, calls = dotenv_file
+        monkeypatch.setenv("CONFIG_WATCH_DOTENV", "true")
+        first = get_settings()
+        assert get_settings() is first
+
+        path.write_text("LMELP_TEST_VALUE=second\n")
+        os.utime(path, (0, 0))
+
+        assert get_settings() is not first
+        assert len(calls) == 2
+        assert os.environ["LMELP_TEST_VALUE"] == "second"
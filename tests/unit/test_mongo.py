@@ -3,11 +3,18 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from bson import ObjectId
+import os
 import sys
+import threading
+
+import nbs.config as nbs_config
 
 # Mock du module config AVANT l'import de nbs.mongo
 sys.modules["config"] = MagicMock()
 sys.modules["config"].get_DB_VARS.return_value = ("localhost", "test_db", "true")
+sys.modules["config"].get_WHISPER_VARS.return_value = (4, False)
+# la configuration lue dans l'environnement reste la vraie (DB_MAX_POOL_SIZE, WHISPER_CPP_*)
+sys.modules["config"].get_settings = nbs_config.get_settings
 
 
 class TestMongoConnection:
@@ -75,6 +82,175 @@ class TestMongoConnection:
         # ASSERT
         assert result == mock_collection
 
+    def test_get_collection_reuses_client_per_host(self, monkeypatch):
+        """Test qu'un seul MongoClient est créé par hôte"""
+        # ARRANGE
+        mock_mongo_client = MagicMock()
+        monkeypatch.setattr("nbs.mongo.pymongo.MongoClient", mock_mongo_client)
+
+        # ACT
+        from nbs.mongo import get_collection
+
+        get_collection("localhost", "db1", "episodes")
+        get_collection("localhost", "db2", "auteurs")
+        get_collection("nas923", "db1", "episodes")
+
+        # ASSERT : un client pour localhost, un pour nas923
+        assert mock_mongo_client.call_count == 2
+        first_kwargs = mock_mongo_client.call_args_list[0].kwargs
+        assert first_kwargs["connect"] is False
+        assert first_kwargs["maxPoolSize"] > 0
+
+    def test_get_client_pool_size_from_env(self, monkeypatch):
+        """Test que DB_MAX_POOL_SIZE configure la taille du pool"""
+        # ARRANGE
+        mock_mongo_client = MagicMock()
+        monkeypatch.setattr("nbs.mongo.pymongo.MongoClient", mock_mongo_client)
+        monkeypatch.setenv("DB_MAX_POOL_SIZE", "5")
+
+        # ACT
+        from nbs.mongo import get_client
+
+        get_client("localhost")
+
+        # ASSERT
+        assert mock_mongo_client.call_args.kwargs["maxPoolSize"] == 5
+
+    def test_close_clients_closes_and_resets(self, monkeypatch):
+        """Test que close_clients ferme les clients et vide le registre"""
+        # ARRANGE
+        mock_mongo_client = MagicMock()
+        monkeypatch.setattr("nbs.mongo.pymongo.MongoClient", mock_mongo_client)
+
+        from nbs.mongo import close_clients, get_client
+
+        client = get_client("localhost")
+
+        # ACT
+        close_clients()
+        get_client("localhost")
+
+        # ASSERT
+        client.close.assert_called_once()
+        assert mock_mongo_client.call_count == 2
+
+    def test_get_client_new_client_after_fork(self, monkeypatch):
+        """Test qu'un processus enfant ne réutilise pas les clients du parent"""
+        # ARRANGE
+        mock_mongo_client = MagicMock()
+        monkeypatch.setattr("nbs.mongo.pymongo.MongoClient", mock_mongo_client)
+
+        import nbs.mongo as mongo_module
+
+        parent_client = mongo_module.get_client("localhost")
+
+        # ACT : simuler un changement de pid (fork)
+        monkeypatch.setattr(mongo_module, "_clients_pid", -1)
+        mongo_module.get_client("localhost")
+
+        # ASSERT : nouveau client créé, l'ancien n'est pas fermé
+        assert mock_mongo_client.call_count == 2
+        parent_client.close.assert_not_called()
+
+
+class TestMongoLogWriter:
+    """Tests pour l'écriture différée et par lots des logs"""
+
+    def test_batch_size_triggers_background_write(self):
+        """Test qu'une écriture est faite par le thread dès que batch_size entrées attendent"""
+        from nbs.mongo import MongoLogWriter
+
+        collection = MagicMock()
+        written = threading.Event()
+        collection.insert_many.side_effect = lambda *args, **kwargs: written.set()
+        writer = MongoLogWriter(batch_size=2, flush_interval_s=60)
+
+        writer.write(collection, [{"desc": "a"}])
+        writer.write(collection, [{"desc": "b"}])
+
+        assert written.wait(5)
+        collection.insert_many.assert_called_once_with(
+            [{"desc": "a"}, {"desc": "b"}], ordered=False
+        )
+        writer.close()
+
+    def test_flush_interval_triggers_background_write(self):
+        """Test qu'une entrée isolée est écrite après flush_interval_s"""
+        from nbs.mongo import MongoLogWriter
+
+        collection = MagicMock()
+        written = threading.Event()
+        collection.insert_many.side_effect = lambda *args, **kwargs: written.set()
+        writer = MongoLogWriter(batch_size=100, flush_interval_s=0.05)
+
+        writer.write(collection, [{"desc": "a"}])
+
+        assert written.wait(5)
+        writer.close()
+
+    @pytest.mark.parametrize(
+        "drop_policy, kept", [("oldest", ["b", "c"]), ("newest", ["a", "b"])]
+    )
+    def test_bounded_queue_drop_policy(self, drop_policy, kept):
+        """Test que la file bornée abandonne l'entrée choisie par drop_policy"""
+        from nbs.mongo import MongoLogWriter
+
+        collection = MagicMock()
+        writer = MongoLogWriter(
+            batch_size=100, flush_interval_s=60, maxsize=2, drop_policy=drop_policy
+        )
+
+        writer.write(collection, [{"desc": "a"}, {"desc": "b"}, {"desc": "c"}])
+        writer.close()
+
+        assert writer.dropped == 1
+        documents = collection.insert_many.call_args[0][0]
+        assert [doc["desc"] for doc in documents] == kept
+
+    def test_close_flushes_each_collection(self):
+        """Test que close écrit les entrées en attente, un insert_many par collection"""
+        from nbs.mongo import MongoLogWriter
+
+        logs, other = MagicMock(), MagicMock()
+        writer = MongoLogWriter(batch_size=100, flush_interval_s=60)
+        writer.write(logs, [{"desc": "a"}, {"desc": "b"}])
+        writer.write(other, [{"desc": "c"}])
+
+        writer.close()
+
+        assert not writer._thread.is_alive()
+        logs.insert_many.assert_called_once()
+        other.insert_many.assert_called_once_with([{"desc": "c"}], ordered=False)
+
+    def test_write_after_fork_ignores_parent_lock(self):
+        """Test qu'un enfant forké n'attend pas le verrou détenu par le thread du parent"""
+        from nbs.mongo import MongoLogWriter
+
+        collection = MagicMock()
+        writer = MongoLogWriter(batch_size=100, flush_interval_s=60)
+        # état copié au fork : verrou détenu par le thread d'écriture du parent
+        writer._condition.acquire()
+        writer._pid = -1
+
+        child = threading.Thread(
+            target=writer.write, args=(collection, [{"desc": "enfant"}])
+        )
+        child.start()
+        child.join(5)
+
+        assert not child.is_alive()
+        assert writer._pid == os.getpid()
+        writer.close()
+        documents = collection.insert_many.call_args[0][0]
+        assert [doc["desc"] for doc in documents] == ["enfant"]
+
+    def test_invalid_drop_policy(self):
+        """Test qu'une politique inconnue est refusée"""
+        from nbs.mongo import MongoLogWriter
+
+        with pytest.raises(ValueError):
+            MongoLogWriter(drop_policy="random")
+
 
 class TestMongoLogging:
     """Tests pour les fonctions de logging MongoDB"""
@@ -91,20 +267,65 @@ class TestMongoLogging:
         )
         monkeypatch.setattr("nbs.mongo.datetime", mock_datetime)
 
-        # ACT : Appeler mongolog
-        from nbs.mongo import mongolog
+        # ACT : Appeler mongolog puis forcer l'écriture différée
+        from nbs.mongo import flush_logs, mongolog
 
         mongolog("CREATE", "Episode", "Test episode creation")
+        flush_logs()
 
-        # ASSERT : Vérifier l'appel insert_one
-        mock_collection.insert_one.assert_called_once()
-        call_args = mock_collection.insert_one.call_args[0][0]
+        # ASSERT : Vérifier l'appel insert_many
+        mock_collection.insert_many.assert_called_once()
+        call_args = mock_collection.insert_many.call_args[0][0][0]
 
         assert call_args["operation"] == "CREATE"
         assert call_args["entite"] == "Episode"
         assert call_args["desc"] == "Test episode creation"
         assert call_args["date"] == "2025-07-13T12:00:00"
 
+    def test_mongolog_many_single_insert(self, monkeypatch):
+        """Test que mongolog_many écrit tous les logs en un seul insert_many"""
+        # ARRANGE : Mock de get_collection et des variables de base
+        mock_collection = MagicMock()
+        monkeypatch.setattr(
+            "nbs.mongo.get_collection", MagicMock(return_value=mock_collection)
+        )
+        monkeypatch.setattr(
+            "nbs.mongo.get_DB_VARS", MagicMock(return_value=("host", "db", "true"))
+        )
+
+        # ACT
+        from nbs.mongo import flush_logs, mongolog_many
+
+        mongolog_many(
+            [("insert", "episodes", "episode 1"), ("update", "episodes", "episode 2")]
+        )
+        mongolog_many([])
+        flush_logs()
+
+        # ASSERT
+        mock_collection.insert_many.assert_called_once()
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert [doc["operation"] for doc in documents] == ["insert", "update"]
+        assert documents[1]["desc"] == "episode 2"
+
+    def test_mongolog_does_not_write_synchronously(self, monkeypatch):
+        """Test que mongolog rend la main sans écrire en base"""
+        mock_collection = MagicMock()
+        monkeypatch.setattr(
+            "nbs.mongo.get_collection", MagicMock(return_value=mock_collection)
+        )
+        monkeypatch.setattr(
+            "nbs.mongo.get_DB_VARS", MagicMock(return_value=("host", "db", "true"))
+        )
+        from nbs.mongo import flush_logs, mongolog
+
+        mongolog("insert", "episodes", "episode 1")
+
+        mock_collection.insert_one.assert_not_called()
+        mock_collection.insert_many.assert_not_called()
+        flush_logs()
+        mock_collection.insert_many.assert_called_once()
+
     def test_print_logs_displays_logs(self, monkeypatch, capsys):
         """Test que print_logs affiche les logs correctement"""
         # ARRANGE : Mock de get_collection avec des logs simulés
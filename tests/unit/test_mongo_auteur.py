@@ -12,6 +12,8 @@ import pytest
 from unittest.mock import MagicMock, patch, call
 import sys
 import json
+import threading
+import time
 from typing import List, Dict, Optional, Tuple
 
 # Configuration des variables d'environnement pour éviter l'erreur au chargement
@@ -20,6 +22,15 @@ import os
 os.environ.setdefault("GOOGLE_CUSTOM_SEARCH_API_KEY", "test_api_key")
 os.environ.setdefault("SEARCH_ENGINE_ID", "test_cse_id")
 
+# numpy est chargé ici une fois pour toutes : rapidfuzz.process.cdist l'importe à la demande
+try:
+    import numpy
+    import rapidfuzz
+    import rapidfuzz.fuzz
+    import rapidfuzz.process
+except ImportError:
+    rapidfuzz = None
+
 
 @pytest.fixture(autouse=True)
 def mock_mongo_auteur_dependencies():
@@ -36,6 +47,8 @@ def mock_mongo_auteur_dependencies():
             "thefuzz": MagicMock(),
             "thefuzz.fuzz": MagicMock(),
             "thefuzz.process": MagicMock(),
+            # scoreur vectorisé masqué : les tests passent par thefuzz (mocké)
+            "rapidfuzz": None,
             "googleapiclient": MagicMock(),
             "googleapiclient.discovery": MagicMock(),
             "mongo_episode": MagicMock(),
@@ -90,6 +103,99 @@ class TestAuteur:
         # Le test principal d'initialisation vérifie déjà le comportement
 
 
+class TestAuthorIndex:
+    """Tests pour la normalisation des noms et l'index en mémoire des auteurs"""
+
+    @pytest.fixture
+    def mock_auteurs_collection(self):
+        """Collection auteurs mockée, branchée sur get_collection du module"""
+        collection = MagicMock()
+        collection.find.return_value = [
+            {"nom": "Jean-Marie Gustave Le Clézio"},
+            {"nom": "Victor Hugo"},
+            {"nom": None},
+        ]
+        with patch("nbs.mongo_auteur.get_collection", return_value=collection):
+            yield collection
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Jean-Marie Gustave Le Clézio", "jean marie gustave clezio"),
+            ("  VICTOR   hugo ", "victor hugo"),
+            ("Jean de La Fontaine", "jean fontaine"),
+            ("Valéry d'Estaing", "valery estaing"),
+            ("De La", "de la"),
+        ],
+    )
+    def test_normalize_author_name(self, name, expected):
+        """Test que la normalisation retire accents, casse, ponctuation et particules"""
+        from nbs.mongo_auteur import normalize_author_name
+
+        assert normalize_author_name(name) == expected
+
+    def test_index_loaded_once_with_projection(self, mock_auteurs_collection):
+        """Test que les noms sont lus une seule fois, avec une projection"""
+        from nbs.mongo_auteur import AuthorIndex
+
+        index = AuthorIndex()
+
+        assert index.get("jean marie gustave le clezio") == (
+            "Jean-Marie Gustave Le Clézio"
+        )
+        assert "victor HUGO" in index
+        assert index.get("Marcel Proust") is None
+        assert sorted(index.names()) == ["Jean-Marie Gustave Le Clézio", "Victor Hugo"]
+        mock_auteurs_collection.find.assert_called_once_with({}, {"nom": 1, "_id": 0})
+
+    def test_index_add_discard_refresh(self, mock_auteurs_collection):
+        """Test que add/discard tiennent l'index à jour et que refresh relit la base"""
+        from nbs.mongo_auteur import AuthorIndex
+
+        index = AuthorIndex()
+        index.add("Marcel Proust")  # index pas encore chargé : ignoré
+        assert len(index) == 2
+
+        index.add("Marcel Proust")
+        index.discard("Victor Hugo")
+        assert sorted(index.names()) == [
+            "Jean-Marie Gustave Le Clézio",
+            "Marcel Proust",
+        ]
+
+        index.refresh()
+        assert "Victor Hugo" in index
+        assert "Marcel Proust" not in index
+        assert mock_auteurs_collection.find.call_count == 2
+
+    def test_check_author_uses_shared_index(self, mock_auteurs_collection):
+        """Test que check_author interroge l'index partagé et pas la collection à chaque auteur"""
+        mock_llm = MagicMock()
+        mock_llm.chat.return_value.message.content = '{"Authors_TitreDescription": []}'
+
+        mock_process = MagicMock()
+        mock_process.extractOne.return_value = ("jean marie gustave clezio", 90)
+        # aucune résolution en cache (même collection mockée pour author_resolutions)
+        mock_auteurs_collection.find_one.return_value = None
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm), patch(
+            "nbs.mongo_auteur.process", mock_process
+        ):
+            from nbs.mongo_auteur import AuthorChecker
+
+            checker = AuthorChecker(MagicMock())
+            # correspondance exacte sur le nom normalisé : pas de recherche floue
+            first = checker.check_author("victor hugo", return_details=True)
+            mock_process.extractOne.assert_not_called()
+            # correspondance floue parmi les noms de l'index
+            second = checker.check_author("J.-M. G. Le Clezio")
+
+        assert first["author_corrected"] == "Victor Hugo"
+        assert first["source"] == "mongodb:auteurs"
+        assert second == "Jean-Marie Gustave Le Clézio"
+        mock_auteurs_collection.find.assert_called_once()
+
+
 class TestAuthorFuzzMatcher:
     """Tests pour la classe AuthorFuzzMatcher"""
 
@@ -129,7 +235,7 @@ class TestAuthorFuzzMatcher:
         """Test de recherche avec un bon score"""
         # Mock du module thefuzz.process
         mock_process = MagicMock()
-        mock_process.extractOne.return_value = ("Victor Hugo", 95)
+        mock_process.extractOne.return_value = ("victor hugo", 95)
 
         with patch("nbs.mongo_auteur.process", mock_process):
             from nbs.mongo_auteur import AuthorFuzzMatcher
@@ -144,7 +250,7 @@ class TestAuthorFuzzMatcher:
     def test_find_best_match_with_low_score(self):
         """Test de recherche avec un score insuffisant"""
         mock_process = MagicMock()
-        mock_process.extractOne.return_value = ("Victor Hugo", 60)
+        mock_process.extractOne.return_value = ("victor hugo", 60)
 
         with patch("nbs.mongo_auteur.process", mock_process):
             from nbs.mongo_auteur import AuthorFuzzMatcher
@@ -181,6 +287,117 @@ class TestAuthorFuzzMatcher:
         assert result_score == 0
 
 
+class TestBlockedFuzzMatching:
+    """Tests pour le blocage des candidats et le scoring par lots de AuthorFuzzMatcher"""
+
+    REFERENCES = [
+        "Victor Hugo",
+        "Marcel Proust",
+        "Simone de Beauvoir",
+        "Jean-Marie Gustave Le Clézio",
+    ]
+
+    @pytest.fixture
+    def rapidfuzz_engine(self):
+        """Rend le vrai rapidfuzz au module (masqué par la fixture autouse)"""
+        if rapidfuzz is None:
+            pytest.skip("rapidfuzz n'est pas installé")
+        with patch.dict(
+            "sys.modules",
+            {
+                "rapidfuzz": rapidfuzz,
+                "rapidfuzz.fuzz": rapidfuzz.fuzz,
+                "rapidfuzz.process": rapidfuzz.process,
+            },
+        ):
+            yield
+
+    def test_author_block_keys(self):
+        """Test des clés de blocage : préfixe et clé phonétique par mot, sans les initiales"""
+        from nbs.mongo_auteur import author_block_keys
+
+        assert author_block_keys("victor hugo") == {"p:vic", "s:fktr", "p:hug", "s:aj"}
+        assert author_block_keys("viktor hugo") & author_block_keys("victor hugo")
+        assert author_block_keys("j m g clezio") == {"p:cle", "s:kls"}
+
+    def test_blocking_prunes_candidates(self):
+        """Test que seules les références partageant une clé sont scorées"""
+        mock_process = MagicMock()
+        mock_process.extractOne.return_value = ("simone beauvoir", 86)
+
+        with patch("nbs.mongo_auteur.process", mock_process), patch(
+            "nbs.mongo_auteur.FUZZ_BLOCKING_MIN_SIZE", 0
+        ):
+            from nbs.mongo_auteur import AuthorFuzzMatcher
+
+            matcher = AuthorFuzzMatcher(self.REFERENCES)
+            results = matcher.match_many(["Simone Bovoir", "Zzz"])
+
+        assert results == [("Simone de Beauvoir", 86), (None, 0)]
+        # "Zzz" ne partage aucune clé : aucun appel au scoreur pour lui
+        mock_process.extractOne.assert_called_once()
+        # même entrée que rapidfuzz : clés normalisées, sans autre prétraitement
+        assert mock_process.extractOne.call_args[0][:2] == (
+            "simone bovoir",
+            ["simone beauvoir"],
+        )
+        assert mock_process.extractOne.call_args.kwargs["processor"] is None
+
+    @pytest.mark.parametrize("blocking_min_size", [0, 1000])
+    def test_match_many_with_rapidfuzz(self, rapidfuzz_engine, blocking_min_size):
+        """Test du scoring par lots : un résultat par nom, dans l'ordre, avec ou sans blocage"""
+        with patch("nbs.mongo_auteur.FUZZ_BLOCKING_MIN_SIZE", blocking_min_size):
+            from nbs.mongo_auteur import RAPIDFUZZ_AVAILABLE, AuthorFuzzMatcher
+
+            matcher = AuthorFuzzMatcher(self.REFERENCES)
+            results = matcher.match_many(
+                ["Viktor Hugo", "", "Simone Bovoir", "marcel proust", "Inconnu"]
+            )
+
+        assert RAPIDFUZZ_AVAILABLE
+        assert [name for name, _ in results] == [
+            "Victor Hugo",
+            None,
+            "Simone de Beauvoir",
+            "Marcel Proust",
+            None,
+        ]
+        assert results[1] == (None, 0)
+        assert results[3][1] == 100
+
+    def test_discard_swaps_in_rebuilt_index(self):
+        """Test que discard_reference_author remplace l'index sans toucher à celui en cours de lecture"""
+        from nbs.mongo_auteur import AuthorFuzzMatcher
+
+        matcher = AuthorFuzzMatcher(self.REFERENCES)
+        index = matcher._prepare()
+
+        matcher.discard_reference_author("Victor Hugo")
+
+        assert "Victor Hugo" in index[0]
+        assert matcher._index is not index
+        assert "Victor Hugo" not in matcher._index[0]
+        assert len(matcher._index[0]) == len(matcher._index[1]) == 3
+
+    def test_index_matcher_is_reused_and_kept_up_to_date(self):
+        """Test que l'index partagé garde son matcher et le met à jour"""
+        collection = MagicMock()
+        collection.find.return_value = [{"nom": "Victor Hugo"}]
+
+        with patch("nbs.mongo_auteur.get_collection", return_value=collection):
+            from nbs.mongo_auteur import AuthorIndex
+
+            index = AuthorIndex()
+            matcher = index.matcher()
+            index.add("Marcel Proust")
+            index.discard("Victor Hugo")
+
+            assert index.matcher() is matcher
+            assert matcher.reference_authors == {"Marcel Proust"}
+            index.refresh()
+            assert index.matcher() is not matcher
+
+
 class TestGoogleSearch:
     """Tests pour la fonction google_search"""
 
@@ -282,6 +499,8 @@ class TestAuthorChecker:
             # Assert
             assert checker.episode == mock_episode
             assert checker.llm_structured_output == mock_llm
+            # aucune extraction llm tant qu'aucun auteur n'est vérifié
+            mock_llm.chat.assert_not_called()
 
     def test_get_filtered_titre_description(self, mock_episode):
         """Test du filtrage des titres/descriptions"""
@@ -304,6 +523,327 @@ class TestAuthorChecker:
             assert len(filtered) <= 500
 
 
+class TestAuthorResolutionCache:
+    """Tests pour le cache persistant des résolutions llm / web search"""
+
+    @pytest.fixture
+    def mock_collections(self):
+        """Collections auteurs, author_resolutions et episode_authors mockées"""
+        collections = {
+            "auteurs": MagicMock(),
+            "author_resolutions": MagicMock(),
+            "episode_authors": MagicMock(),
+        }
+        collections["auteurs"].find.return_value = [{"nom": "Victor Hugo"}]
+        collections["author_resolutions"].find_one.return_value = None
+        collections["episode_authors"].find_one.return_value = None
+
+        def get_collection(target_db, client_name, collection_name):
+            return collections[collection_name]
+
+        with patch("nbs.mongo_auteur.get_collection", side_effect=get_collection):
+            yield collections
+
+    @staticmethod
+    def llm_responses(*contents):
+        """LLM mocké renvoyant successivement les contenus JSON donnés"""
+        mock_llm = MagicMock()
+        responses = []
+        for content in contents:
+            response = MagicMock()
+            response.message.content = content
+            responses.append(response)
+        mock_llm.chat.side_effect = responses
+        return mock_llm
+
+    def test_put_and_get(self, mock_collections):
+        """Test de l'écriture (clé normalisée, durée selon le verdict) et de la lecture"""
+        from nbs.mongo_auteur import (
+            AUTHOR_RESOLUTION_NEGATIVE_TTL,
+            AUTHOR_RESOLUTION_TTL,
+            AuthorResolutionCache,
+        )
+
+        cache = AuthorResolutionCache()
+        collection = mock_collections["author_resolutions"]
+        cache.put(
+            {
+                "author_original": "Viktor Hugo",
+                "author_corrected": "Victor Hugo",
+                "source": "llm",
+                "score": 91,
+            }
+        )
+        cache.put(
+            {
+                "author_original": "Zorglub",
+                "author_corrected": None,
+                "source": "web search",
+                "score": 10,
+                "analyse": "inconnu",
+            }
+        )
+        cache.get("  VIKTOR hugo")
+
+        (found_filter, found_update), found_kwargs = (
+            collection.update_one.call_args_list[0]
+        )
+        found = found_update["$set"]
+        assert found_filter == {"_id": "viktor hugo"}
+        assert found_kwargs == {"upsert": True}
+        assert found["verdict"] == "found"
+        assert found["expires_at"] - found["resolved_at"] == AUTHOR_RESOLUTION_TTL
+        not_found = collection.update_one.call_args_list[1][0][1]["$set"]
+        assert not_found["verdict"] == "not_found"
+        assert not_found["analyse"] == "inconnu"
+        assert (
+            not_found["expires_at"] - not_found["resolved_at"]
+            == AUTHOR_RESOLUTION_NEGATIVE_TTL
+        )
+        query = collection.find_one.call_args[0][0]
+        assert query["_id"] == "viktor hugo"
+        assert "$gt" in query["expires_at"]
+
+    def test_check_author_reads_cache_before_network(self, mock_collections):
+        """Test qu'un verdict négatif en cache évite les appels llm et web search"""
+        mock_collections["author_resolutions"].find_one.return_value = {
+            "_id": "zorglub",
+            "author_corrected": None,
+            "verdict": "not_found",
+            "source": "web search",
+            "score": 20,
+            "analyse": "inconnu",
+        }
+        mock_llm = self.llm_responses('{"Authors_TitreDescription": []}')
+        mock_process = MagicMock()
+        mock_process.extractOne.return_value = ("victor hugo", 30)
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm), patch(
+            "nbs.mongo_auteur.process", mock_process
+        ), patch("nbs.mongo_auteur.google_search") as mock_search:
+            from nbs.mongo_auteur import AuthorChecker
+
+            details = AuthorChecker(MagicMock()).check_author(
+                "Zorglub", return_details=True
+            )
+
+        assert details["author_corrected"] is None
+        assert details["source"] == "cache:web search"
+        assert details["score"] == 20
+        assert details["analyse"] == "inconnu"
+        # cache lu avant l'étape 1 : pas même l'extraction du titre et de la description
+        mock_llm.chat.assert_not_called()
+        mock_search.assert_not_called()
+
+    def test_check_author_caches_negative_web_result(self, mock_collections):
+        """Test qu'un auteur non trouvé par web search est mis en cache"""
+        mock_llm = self.llm_responses(
+            '{"Authors_TitreDescription": []}',
+            '{"Authors_LLM": []}',
+            '{"auteur": "Zorglub", "certitude": 10, "analyse": "inconnu"}',
+        )
+        mock_process = MagicMock()
+        mock_process.extractOne.return_value = ("victor hugo", 30)
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm), patch(
+            "nbs.mongo_auteur.process", mock_process
+        ), patch("nbs.mongo_auteur.google_search", return_value=[]):
+            from nbs.mongo_auteur import AuthorChecker
+
+            result = AuthorChecker(MagicMock()).check_author("Zorglub")
+
+        assert result is None
+        (query, update), _ = mock_collections["author_resolutions"].update_one.call_args
+        assert query == {"_id": "zorglub"}
+        assert update["$set"]["verdict"] == "not_found"
+        assert update["$set"]["source"] == "web search"
+        assert update["$set"]["score"] == 10
+
+    def test_check_author_does_not_cache_failed_search(self, mock_collections):
+        """Test qu'une erreur de google_search n'est ni analysée par le llm ni mise en cache"""
+        mock_llm = self.llm_responses(
+            '{"Authors_TitreDescription": []}',
+            '{"Authors_LLM": []}',
+        )
+        mock_process = MagicMock()
+        mock_process.extractOne.return_value = ("victor hugo", 30)
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm), patch(
+            "nbs.mongo_auteur.process", mock_process
+        ), patch("nbs.mongo_auteur.google_search", return_value=None):
+            from nbs.mongo_auteur import AuthorChecker
+
+            details = AuthorChecker(MagicMock()).check_author(
+                "Zorglub", return_details=True
+            )
+
+        assert details["author_corrected"] is None
+        assert details["score"] == 0
+        # étapes 1 et 3 seulement : pas d'analyse du résultat "None"
+        assert mock_llm.chat.call_count == 2
+        mock_collections["author_resolutions"].update_one.assert_not_called()
+
+
+class TestLazyTitreDescription:
+    """Tests pour l'extraction paresseuse et mémorisée des noms du titre et de la description"""
+
+    @pytest.fixture
+    def mock_collections(self):
+        """Collections auteurs et episode_authors mockées, branchées sur get_collection"""
+        collections = {"auteurs": MagicMock(), "episode_authors": MagicMock()}
+        collections["auteurs"].find.return_value = [{"nom": "Victor Hugo"}]
+        collections["episode_authors"].find_one.return_value = None
+
+        def get_collection(target_db, client_name, collection_name):
+            return collections[collection_name]
+
+        with patch("nbs.mongo_auteur.get_collection", side_effect=get_collection):
+            yield collections
+
+    @pytest.fixture
+    def mock_episode(self):
+        """Épisode mocké, déjà enregistré en base"""
+        episode = MagicMock()
+        episode.titre = "Le roman de Marcel Proust"
+        episode.description = "Avec Marcel Proust et Victor Hugo"
+        episode.get_oid.return_value = "episode_oid"
+        return episode
+
+    def test_known_author_skips_extraction(self, mock_collections, mock_episode):
+        """Test qu'un auteur déjà en base ne déclenche pas l'appel llm de l'étape 1"""
+        with patch("nbs.mongo_auteur.get_azure_llm") as mock_get_llm:
+            from nbs.mongo_auteur import AuthorChecker
+
+            checker = AuthorChecker(mock_episode)
+            details = checker.check_author("VICTOR HUGO", return_details=True)
+
+        assert details["source"] == "mongodb:auteurs"
+        mock_get_llm.assert_not_called()
+        mock_collections["episode_authors"].find_one.assert_not_called()
+
+    def test_extraction_memoized_per_episode(self, mock_collections, mock_episode):
+        """Test que l'extraction est faite une fois, mémorisée, puis relue pour l'épisode"""
+        mock_llm = MagicMock()
+        mock_llm.chat.return_value.message.content = (
+            '{"Authors_TitreDescription": ["Marcel Proust"]}'
+        )
+        episode_authors = mock_collections["episode_authors"]
+
+        with patch(
+            "nbs.mongo_auteur.get_azure_llm", return_value=mock_llm
+        ) as mock_get_llm:
+            from nbs.mongo_auteur import AuthorChecker
+
+            first = AuthorChecker(mock_episode)
+            assert first.authors_titre_description == ["Marcel Proust"]
+            assert first.authors_titre_description == ["Marcel Proust"]
+            (query, update), _ = episode_authors.update_one.call_args
+            episode_authors.find_one.return_value = {
+                "episode_oid": "episode_oid",
+                **update["$set"],
+            }
+
+            second = AuthorChecker(mock_episode)
+            assert second.authors_titre_description == ["Marcel Proust"]
+            # titre modifié : l'extraction est refaite
+            mock_episode.titre = "Nouveau titre"
+            assert AuthorChecker(mock_episode).authors_titre_description == [
+                "Marcel Proust"
+            ]
+
+        assert query == {"episode_oid": "episode_oid"}
+        assert mock_llm.chat.call_count == 2
+        # un seul client Azure pour tous les AuthorChecker
+        mock_get_llm.assert_called_once_with("gpt-4o")
+
+    def test_failed_extraction_not_memoized(self, mock_collections, mock_episode):
+        """Test qu'une réponse illisible donne une liste vide sans être mémorisée"""
+        mock_llm = MagicMock()
+        mock_llm.chat.return_value.message.content = "pas du json"
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm), patch(
+            "builtins.print"
+        ):
+            from nbs.mongo_auteur import AuthorChecker
+
+            checker = AuthorChecker(mock_episode)
+            assert checker.authors_titre_description == []
+
+        mock_collections["episode_authors"].update_one.assert_not_called()
+
+
+class TestConcurrentAuthorChecks:
+    """Tests pour la vérification concurrente des auteurs et la limitation par fournisseur"""
+
+    def test_rate_limiter_spaces_starts(self):
+        """Test que les départs sont espacés de min_interval_s"""
+        mock_time = MagicMock()
+        mock_time.monotonic.return_value = 100.0
+
+        with patch("nbs.mongo_auteur.time", mock_time):
+            from nbs.mongo_auteur import RateLimiter
+
+            limiter = RateLimiter(concurrency=3, min_interval_s=1.0)
+            for _ in range(3):
+                with limiter:
+                    pass
+
+        assert mock_time.sleep.call_args_list == [call(1.0), call(2.0)]
+
+    def test_rate_limiter_bounds_concurrency(self):
+        """Test qu'au plus `concurrency` appels sont en cours en même temps"""
+        from nbs.mongo_auteur import RateLimiter
+
+        limiter = RateLimiter(concurrency=2)
+        lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+
+        def call_provider():
+            with limiter:
+                with lock:
+                    state["active"] += 1
+                    state["max_active"] = max(state["max_active"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+
+        threads = [threading.Thread(target=call_provider) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state["max_active"] == 2
+
+    def test_check_authors_keeps_input_order(self):
+        """Test que les résultats suivent l'ordre des noms et que les doublons sont vérifiés une fois"""
+        mock_llm = MagicMock()
+        mock_llm.chat.return_value.message.content = '{"Authors_TitreDescription": []}'
+        delays = {"Victor Hugo": 0.05, "Marcel Proust": 0.0, "Zorglub": 0.02}
+
+        def check_author(author, return_details=False, verbose=False):
+            time.sleep(delays[author])
+            if author == "Zorglub":
+                return {"author_original": author, "author_corrected": None}
+            return {"author_original": author, "author_corrected": author}
+
+        with patch("nbs.mongo_auteur.get_azure_llm", return_value=mock_llm):
+            from nbs.mongo_auteur import AuthorChecker
+
+            checker = AuthorChecker(MagicMock())
+            with patch.object(
+                checker, "check_author", side_effect=check_author
+            ) as mock_check:
+                names = ["Victor Hugo", "Marcel Proust", "Zorglub", "Victor Hugo"]
+                results = checker.check_authors(names, return_details=True)
+                assert checker.check_authors([]) == []
+
+        assert [result["author_original"] for result in results] == names
+        assert results[2]["author_corrected"] is None
+        assert results[0] == results[3] and results[0] is not results[3]
+        assert mock_check.call_count == 3
+
+
 class TestModuleConstants:
     """Tests pour les constantes et variables du module"""
 
@@ -343,12 +883,31 @@ class TestModuleIntegration:
         from nbs import mongo_auteur
 
         expected_exports = [
+            "AUTHOR_NAME_PARTICLES",
             "score_fuzz_threshold",
+            "FUZZ_BLOCKING_MIN_SIZE",
+            "FUZZ_BATCH_SIZE",
             "api_key",
             "cse_id",
+            "AUTHOR_RESOLUTIONS_COLLECTION",
+            "AUTHOR_RESOLUTION_TTL",
+            "AUTHOR_RESOLUTION_NEGATIVE_TTL",
+            "AUTHOR_CHECK_WORKERS",
+            "PROVIDER_RATE_LIMITS",
+            "EPISODE_AUTHORS_COLLECTION",
+            "normalize_author_name",
+            "AuthorIndex",
+            "get_author_index",
             "Auteur",
+            "author_block_keys",
             "AuthorFuzzMatcher",
             "google_search",
+            "AuthorResolutionCache",
+            "get_author_resolution_cache",
+            "RateLimiter",
+            "get_rate_limiter",
+            "get_author_llm",
+            "get_episode_authors_collection",
             "AuthorChecker",
         ]
 
@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Tuple
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+import requests
 from bson import ObjectId
 
 os.environ.setdefault("AUDIO_PATH", "/tmp/test_audio")
@@ -110,6 +111,9 @@ def mock_mongo_episode_dependencies():
     ):
         yield
 
+    # Vider le cache des modèles whisper entre les tests
+    mongo_episode_module.unload_whisper_models()
+
 
 @pytest.fixture
 def sample_episode_data():
@@ -254,6 +258,690 @@ class TestExtractWhisper:
             assert mock_torch.cuda.is_available.called
 
 
+class TestAudioChunking:
+    """Tests pour le décodage en mémoire et le découpage de l'audio"""
+
+    def test_load_audio_decodes_ffmpeg_output_in_memory(self):
+        """load_audio lit la sortie float32 de ffmpeg sans fichier intermédiaire"""
+        import numpy as np
+
+        samples = np.arange(4, dtype=np.float32)
+        completed = MagicMock(returncode=0, stdout=samples.tobytes(), stderr=b"")
+
+        with (
+            patch("nbs.mongo_episode.shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch(
+                "nbs.mongo_episode.subprocess.run", return_value=completed
+            ) as mock_run,
+        ):
+            from nbs.mongo_episode import load_audio
+
+            audio = load_audio("/path/to/test.mp3")
+
+        np.testing.assert_array_equal(audio, samples)
+        assert audio.dtype == np.float32
+        command = mock_run.call_args[0][0]
+        assert command[-1] == "-"
+        assert command[command.index("-ar") + 1] == "16000"
+        assert command[command.index("-ac") + 1] == "1"
+
+    def test_load_audio_raises_on_ffmpeg_error(self):
+        """load_audio lève RuntimeError si ffmpeg échoue"""
+        completed = MagicMock(returncode=1, stdout=b"", stderr=b"invalid data")
+
+        with (
+            patch("nbs.mongo_episode.shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("nbs.mongo_episode.subprocess.run", return_value=completed),
+        ):
+            from nbs.mongo_episode import load_audio
+
+            with pytest.raises(RuntimeError, match="invalid data"):
+                load_audio("/path/to/test.mp3")
+
+    def test_iter_audio_chunks_returns_overlapping_views(self):
+        """iter_audio_chunks produit des fenêtres chevauchantes qui partagent la mémoire du signal"""
+        import numpy as np
+
+        from nbs.mongo_episode import iter_audio_chunks
+
+        audio = np.arange(25, dtype=np.float32)
+        chunks = list(
+            iter_audio_chunks(audio, sampling_rate=1, chunk_s=10, overlap_s=2)
+        )
+
+        assert [start for start, _ in chunks] == [0, 8, 16]
+        assert [len(chunk) for _, chunk in chunks] == [10, 10, 9]
+        assert all(np.shares_memory(chunk, audio) for _, chunk in chunks)
+        np.testing.assert_array_equal(chunks[1][1][:2], chunks[0][1][-2:])
+
+    def test_iter_audio_chunks_invalid_overlap(self):
+        """Un recouvrement supérieur ou égal à la fenêtre lève ValueError"""
+        import numpy as np
+
+        from nbs.mongo_episode import iter_audio_chunks
+
+        with pytest.raises(ValueError):
+            list(
+                iter_audio_chunks(np.zeros(10), sampling_rate=1, chunk_s=5, overlap_s=5)
+            )
+
+    def test_extract_whisper_long_decodes_once(self):
+        """extract_whisper_long décode le fichier une seule fois et transcrit chaque fenêtre"""
+        import numpy as np
+
+        model, processor = MagicMock(), MagicMock()
+        processor.feature_extractor.sampling_rate = 16000
+        processor.tokenizer.batch_decode.side_effect = [[" un "], ["deux"], ["trois"]]
+
+        with patch(
+            "nbs.mongo_episode.load_audio", return_value=np.zeros(16000 * 70)
+        ) as mock_load, patch(
+            "nbs.mongo_episode.get_whisper_model", return_value=(model, processor)
+        ):
+            from nbs.mongo_episode import extract_whisper_long
+
+            text = extract_whisper_long("/path/to/test.mp3", batch_size=1)
+
+        assert text == "un deux trois"
+        mock_load.assert_called_once_with(
+            "/path/to/test.mp3", sampling_rate=16000, vad=False
+        )
+        assert model.generate.call_count == 3
+
+    def test_extract_whisper_long_reads_vad_at_call_time(self):
+        """Sans vad explicite, WHISPER_VAD est lu à l'appel (et non figé à l'import)"""
+        trim = MagicMock()
+
+        with patch(
+            "nbs.mongo_episode.get_WHISPER_VARS", return_value=(1, True)
+        ), patch(
+            "nbs.mongo_episode.load_speech", return_value=trim
+        ) as mock_speech, patch(
+            "nbs.mongo_episode.transcribe_long_audio", return_value="bonsoir"
+        ) as mock_transcribe:
+            from nbs.mongo_episode import extract_whisper_long
+
+            assert extract_whisper_long("/path/to/test.mp3") == "bonsoir"
+
+        mock_speech.assert_called_once()
+        assert mock_transcribe.call_args.kwargs["trim"] is trim
+
+    def test_transcribe_long_audio_batches_chunks_in_order(self):
+        """transcribe_long_audio regroupe les fenêtres par lots et conserve leur ordre"""
+        import numpy as np
+
+        model, processor = MagicMock(), MagicMock()
+        processor.feature_extractor.sampling_rate = 16000
+        processor.tokenizer.batch_decode.side_effect = [
+            ["un", "deux"],
+            ["trois", "quatre"],
+            ["cinq"],
+        ]
+
+        with patch(
+            "nbs.mongo_episode.get_whisper_model", return_value=(model, processor)
+        ):
+            from nbs.mongo_episode import transcribe_long_audio
+
+            text = transcribe_long_audio(np.zeros(16000 * 130), batch_size=2)
+
+        assert text == "un deux trois quatre cinq"
+        assert model.generate.call_count == 3
+        batch_lengths = [len(c[0][0]) for c in processor.call_args_list]
+        assert batch_lengths == [2, 2, 1]
+
+
+class TestSpeechTrim:
+    """Tests pour la détection de parole et le retrait des silences"""
+
+    @staticmethod
+    def make_signal(segments):
+        """Construit un signal 16 kHz à partir de (durée, amplitude) : 0 = silence"""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        return np.concatenate(
+            [
+                (amplitude * rng.uniform(-1, 1, int(16000 * duration))).astype(
+                    np.float32
+                )
+                for duration, amplitude in segments
+            ]
+        )
+
+    def test_detect_speech_regions_splits_on_long_silences(self):
+        """Les silences longs séparent les zones de parole, avec la marge demandée"""
+        from nbs.mongo_episode import detect_speech_regions
+
+        audio = self.make_signal([(1, 0), (2, 0.5), (2, 0), (1, 0.5), (1, 0)])
+        regions = detect_speech_regions(audio, padding_s=0.1)
+
+        assert len(regions) == 2
+        (start1, end1), (start2, end2) = regions
+        assert abs(start1 / 16000 - 0.9) < 0.05
+        assert abs(end1 / 16000 - 3.1) < 0.05
+        assert abs(start2 / 16000 - 4.9) < 0.05
+        assert abs(end2 / 16000 - 6.1) < 0.05
+
+    def test_detect_speech_regions_keeps_short_pauses(self):
+        """Une pause plus courte que min_silence_s ne coupe pas la zone de parole"""
+        from nbs.mongo_episode import detect_speech_regions
+
+        audio = self.make_signal([(1, 0.5), (0.3, 0), (1, 0.5)])
+
+        assert detect_speech_regions(audio) == [(0, len(audio))]
+
+    def test_detect_speech_regions_silence_only(self):
+        """Un signal silencieux ne contient aucune zone de parole"""
+        from nbs.mongo_episode import trim_silences
+
+        trimmed = trim_silences(self.make_signal([(2, 0)]))
+
+        assert trimmed.regions == []
+        assert len(trimmed.audio) == 0
+        assert trimmed.original_duration == 2
+
+    def test_trim_silences_time_offset_map(self):
+        """Les temps du signal réduit sont ramenés aux temps du fichier original"""
+        from nbs.mongo_episode import trim_silences
+
+        audio = self.make_signal([(1, 0), (2, 0.5), (2, 0), (1, 0.5), (1, 0)])
+        trimmed = trim_silences(audio, padding_s=0)
+        (start1, end1), (start2, _) = trimmed.regions
+
+        assert len(trimmed.audio) == sum(end - start for start, end in trimmed.regions)
+        assert trimmed.to_original_time(0) == start1 / 16000
+        assert trimmed.to_original_time(0.5) == (start1 + 8000) / 16000
+        first_length = (end1 - start1) / 16000
+        assert trimmed.to_original_time(first_length + 0.25) == (
+            start2 + 4000
+        ) / 16000
+        # à la jonction : début de la zone suivante, ou fin de la zone précédente
+        assert trimmed.to_original_time(first_length) == start2 / 16000
+        assert trimmed.to_original_time(first_length, is_end=True) == end1 / 16000
+        chunks = trimmed.to_original_chunks(
+            [{"text": "un", "timestamp": (0.0, first_length)}]
+        )
+        assert chunks[0]["timestamp"] == (start1 / 16000, end1 / 16000)
+
+    def test_load_audio_with_vad_returns_speech_only(self):
+        """load_audio(vad=True) ne retourne que les zones de parole"""
+        audio = self.make_signal([(1, 0), (1, 0.5), (1, 0)])
+        completed = MagicMock(returncode=0, stdout=audio.tobytes(), stderr=b"")
+
+        with patch(
+            "nbs.mongo_episode.shutil.which", return_value="/usr/bin/ffmpeg"
+        ), patch("nbs.mongo_episode.subprocess.run", return_value=completed):
+            from nbs.mongo_episode import load_audio
+
+            speech = load_audio("/path/to/test.mp3", vad=True)
+
+        assert 16000 <= len(speech) < 16000 * 1.5
+
+
+    def test_extract_whisper_cpp_with_vad_transcribes_speech_wav(self, tmp_path):
+        """Avec vad, whisper.cpp transcrit un WAV de parole et le cache reste <audio>.txt"""
+        import numpy as np
+
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake mp3")
+        speech_path = tmp_path / "episode.speech.wav"
+
+        def fake_run(command, **kwargs):
+            assert command[-1] == str(speech_path)
+            assert speech_path.exists()
+            (tmp_path / "episode.speech.txt").write_text("parole")
+            return MagicMock(stdout="LOG_FILE=/tmp/whisper.log\n")
+
+        with patch(
+            "nbs.mongo_episode._ensure_whisper_model",
+            return_value=tmp_path / "model.bin",
+        ), patch(
+            "nbs.mongo_episode._get_whisper_cpp_script", return_value=audio_path
+        ), patch(
+            "nbs.mongo_episode.shutil.which", return_value="/usr/bin/docker"
+        ), patch(
+            "nbs.mongo_episode.load_audio", return_value=np.zeros(16000, dtype=np.float32)
+        ), patch(
+            "nbs.mongo_episode._ensure_user_writable"
+        ), patch(
+            "nbs.mongo_episode.subprocess.run", side_effect=fake_run
+        ):
+            from nbs.mongo_episode import extract_whisper_cpp
+
+            text, log_path = extract_whisper_cpp(str(audio_path), vad=True)
+
+        assert (text, log_path) == ("parole", "/tmp/whisper.log")
+        assert (tmp_path / "episode.txt").read_text() == "parole"
+        assert not speech_path.exists()
+        assert not (tmp_path / "episode.speech.txt").exists()
+
+    def test_extract_whisper_cpp_removes_speech_wav_on_failure(self, tmp_path):
+        """Le WAV de parole est supprimé si son écriture échoue avant whisper.cpp"""
+        import numpy as np
+
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake mp3")
+        speech_path = tmp_path / "episode.speech.wav"
+
+        def fake_write(path, *args, **kwargs):
+            Path(path).write_bytes(b"partiel")
+            raise OSError("disque plein")
+
+        with patch(
+            "nbs.mongo_episode._ensure_whisper_model",
+            return_value=tmp_path / "model.bin",
+        ), patch(
+            "nbs.mongo_episode._get_whisper_cpp_script", return_value=audio_path
+        ), patch(
+            "nbs.mongo_episode.shutil.which", return_value="/usr/bin/docker"
+        ), patch(
+            "nbs.mongo_episode.load_audio", return_value=np.zeros(16000, dtype=np.float32)
+        ), patch(
+            "nbs.mongo_episode.sf.write", side_effect=fake_write
+        ), patch(
+            "nbs.mongo_episode.subprocess.run"
+        ) as mock_run:
+            from nbs.mongo_episode import extract_whisper_cpp
+
+            with pytest.raises(OSError):
+                extract_whisper_cpp(str(audio_path), vad=True)
+
+        mock_run.assert_not_called()
+        assert not speech_path.exists()
+
+    def test_extract_whisper_vad_chunks_use_original_time(self):
+        """Avec vad, les timestamps du pipeline sont ramenés au fichier original"""
+        from nbs.mongo_episode import trim_silences
+
+        audio = self.make_signal([(1, 0), (2, 0.5), (2, 0), (1, 0.5), (1, 0)])
+        expected = trim_silences(audio)
+        mock_pipe = MagicMock(
+            return_value={
+                "text": "un deux",
+                "chunks": [
+                    {"text": "un", "timestamp": (0.0, 1.0)},
+                    {"text": "deux", "timestamp": (2.5, None)},
+                ],
+            }
+        )
+
+        with patch(
+            "nbs.mongo_episode.get_whisper_pipeline", return_value=mock_pipe
+        ), patch("nbs.mongo_episode.load_audio", return_value=audio):
+            from nbs.mongo_episode import extract_whisper
+
+            text, chunks = extract_whisper(
+                "/path/to/test.mp3", vad=True, return_chunks=True
+            )
+
+        assert text == "un deux"
+        assert chunks == [
+            {
+                "text": "un",
+                "timestamp": (
+                    expected.to_original_time(0.0),
+                    expected.to_original_time(1.0),
+                ),
+            },
+            {"text": "deux", "timestamp": (expected.to_original_time(2.5), None)},
+        ]
+        # la seconde zone de parole commence après le silence de 2 s
+        assert chunks[1]["timestamp"][0] > 4.5
+
+    def test_transcribe_long_audio_chunks_use_original_time(self):
+        """Les fenêtres du signal réduit sont datées dans le fichier original"""
+        from nbs.mongo_episode import trim_silences
+
+        audio = self.make_signal([(1, 0), (2, 0.5), (2, 0), (1, 0.5), (1, 0)])
+        trim = trim_silences(audio, padding_s=0)
+        model, processor = MagicMock(), MagicMock()
+        processor.feature_extractor.sampling_rate = 16000
+        processor.tokenizer.batch_decode.side_effect = [["un"], ["deux"]]
+
+        with patch(
+            "nbs.mongo_episode.get_whisper_model", return_value=(model, processor)
+        ):
+            from nbs.mongo_episode import transcribe_long_audio
+
+            text, chunks = transcribe_long_audio(
+                trim.audio,
+                chunk_s=2,
+                overlap_s=0,
+                batch_size=1,
+                trim=trim,
+                return_chunks=True,
+            )
+
+        (start1, _), (_, end2) = trim.regions
+        assert text == "un deux"
+        assert [chunk["text"] for chunk in chunks] == ["un", "deux"]
+        assert chunks[0]["timestamp"][0] == start1 / 16000
+        assert chunks[1]["timestamp"] == (trim.to_original_time(2), end2 / 16000)
+
+
+class TestWhisperCppServer:
+    """Tests pour les modes natif et serveur résident de whisper.cpp"""
+
+    def test_unknown_mode_raises(self, monkeypatch):
+        """Un WHISPER_CPP_MODE inconnu lève WhisperCppError"""
+        from nbs.mongo_episode import WhisperCppError, _get_whisper_cpp_mode
+
+        monkeypatch.setenv("WHISPER_CPP_MODE", "inconnu")
+
+        with pytest.raises(WhisperCppError):
+            _get_whisper_cpp_mode()
+
+    def test_server_reads_settings_at_construction(self):
+        """WhisperCppServer lit WHISPER_SERVER_URL et WHISPER_THREADS dans get_settings"""
+        from nbs.config import Settings
+        from nbs.mongo_episode import WhisperCppServer
+
+        settings = Settings(
+            whisper_server_url="http://nas923:8080/", whisper_threads="6"
+        )
+        with patch("nbs.mongo_episode.get_settings", return_value=settings):
+            server = WhisperCppServer()
+
+        assert server.url == "http://nas923:8080"
+        assert server.threads == "6"
+
+    def test_extract_whisper_cpp_rejects_unknown_mode(self, tmp_path):
+        """Un mode explicite inconnu lève WhisperCppError au lieu de lancer Docker"""
+        from nbs.mongo_episode import WhisperCppError, extract_whisper_cpp
+
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake mp3")
+
+        with patch("nbs.mongo_episode.subprocess.run") as mock_run:
+            with pytest.raises(WhisperCppError):
+                extract_whisper_cpp(str(audio_path), mode="nativ")
+
+        mock_run.assert_not_called()
+
+    def test_server_command_pinned_to_cpuset(self, tmp_path):
+        """Le serveur lancé est épinglé sur WHISPER_CPUSET (taskset ou --cpuset-cpus)"""
+        from nbs.mongo_episode import WhisperCppServer
+
+        model_path = tmp_path / "m.bin"
+        native = WhisperCppServer(
+            binary="/usr/local/bin/whisper-server", threads=4, cpuset="0-3"
+        )
+        docker = WhisperCppServer(cpuset="4-7")
+        docker.binary = None  # pas de whisper-server natif : conteneur Docker
+
+        with patch("nbs.mongo_episode.shutil.which", return_value="/usr/bin/taskset"):
+            native_command = native._command(model_path)
+            docker_command = docker._command(model_path)
+
+        assert native_command[:4] == [
+            "taskset",
+            "-c",
+            "0-3",
+            "/usr/local/bin/whisper-server",
+        ]
+        assert native_command[native_command.index("-t") + 1] == "4"
+        assert docker_command[0] == "docker"
+        assert docker_command[docker_command.index("--cpuset-cpus") + 1] == "4-7"
+
+    def test_server_start_launches_native_binary_once(self, tmp_path):
+        """start() lance whisper-server une seule fois et attend qu'il réponde"""
+        from nbs.mongo_episode import WhisperCppServer
+
+        process = MagicMock()
+        process.poll.return_value = None
+
+        with patch(
+            "nbs.mongo_episode.requests.get",
+            side_effect=[requests.ConnectionError(), requests.ConnectionError(), None],
+        ), patch(
+            "nbs.mongo_episode._ensure_whisper_model",
+            return_value=tmp_path / "ggml-large-v3.bin",
+        ), patch(
+            "nbs.mongo_episode.subprocess.Popen", return_value=process
+        ) as mock_popen, patch(
+            "nbs.mongo_episode.time.sleep"
+        ):
+            server = WhisperCppServer(port=9999, binary="/usr/local/bin/whisper-server")
+            server.start()
+            server.start()
+
+        mock_popen.assert_called_once()
+        command = mock_popen.call_args[0][0]
+        assert command[:3] == [
+            "/usr/local/bin/whisper-server",
+            "-m",
+            str(tmp_path / "ggml-large-v3.bin"),
+        ]
+        assert command[command.index("--port") + 1] == "9999"
+
+    def test_server_start_raises_if_process_exits(self, tmp_path):
+        """start() lève WhisperCppError si whisper-server s'arrête au démarrage"""
+        from nbs.mongo_episode import WhisperCppError, WhisperCppServer
+
+        process = MagicMock()
+        process.poll.return_value = 1
+
+        with patch(
+            "nbs.mongo_episode.requests.get", side_effect=requests.ConnectionError()
+        ), patch(
+            "nbs.mongo_episode._ensure_whisper_model", return_value=tmp_path / "m.bin"
+        ), patch(
+            "nbs.mongo_episode.subprocess.Popen", return_value=process
+        ):
+            server = WhisperCppServer(binary="/usr/local/bin/whisper-server")
+
+            with pytest.raises(WhisperCppError):
+                server.start()
+
+    def test_extract_whisper_cpp_server_mode(self, tmp_path):
+        """En mode serveur, l'audio est envoyé en WAV au serveur résident et mis en cache"""
+        from nbs.mongo_episode import extract_whisper_cpp
+
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake mp3")
+        response = MagicMock()
+        response.json.return_value = {"text": " bonsoir à tous \n"}
+
+        with patch("nbs.mongo_episode.requests.get"), patch(
+            "nbs.mongo_episode._audio_to_wav_bytes", return_value=b"RIFF"
+        ), patch(
+            "nbs.mongo_episode.requests.post", return_value=response
+        ) as mock_post, patch(
+            "nbs.mongo_episode._whisper_cpp_server", None
+        ):
+            text, log_path = extract_whisper_cpp(str(audio_path), mode="server")
+
+        assert (text, log_path) == ("bonsoir à tous", None)
+        assert (tmp_path / "episode.txt").read_text() == "bonsoir à tous"
+        assert mock_post.call_args[0][0].endswith("/inference")
+        assert mock_post.call_args[1]["files"]["file"][1] == b"RIFF"
+
+    def test_server_transcribe_wraps_request_errors(self):
+        """Une erreur HTTP devient WhisperCppError (pour basculer sur Hugging Face)"""
+        from nbs.mongo_episode import WhisperCppError, WhisperCppServer
+
+        with patch("nbs.mongo_episode.requests.get"), patch(
+            "nbs.mongo_episode._audio_to_wav_bytes", return_value=b"RIFF"
+        ), patch(
+            "nbs.mongo_episode.requests.post",
+            side_effect=requests.ConnectionError("refused"),
+        ):
+            server = WhisperCppServer(url="http://localhost:8080")
+
+            with pytest.raises(WhisperCppError):
+                server.transcribe("/path/to/test.mp3")
+
+    def test_extract_whisper_cpp_native_mode(self, tmp_path):
+        """En mode natif, whisper-cli est lancé sans Docker, épinglé sur le cpuset demandé"""
+        from nbs.mongo_episode import extract_whisper_cpp
+
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake mp3")
+
+        def fake_run(command, **kwargs):
+            assert "docker" not in command
+            (tmp_path / "episode.txt").write_text("texte natif")
+            return MagicMock()
+
+        with patch(
+            "nbs.mongo_episode._ensure_whisper_model", return_value=tmp_path / "m.bin"
+        ), patch(
+            "nbs.mongo_episode._find_binary", return_value="/usr/local/bin/whisper-cli"
+        ), patch(
+            "nbs.mongo_episode._audio_to_wav_bytes", return_value=b"RIFF"
+        ), patch(
+            "nbs.mongo_episode.shutil.which", return_value="/usr/bin/taskset"
+        ), patch(
+            "nbs.mongo_episode.subprocess.run", side_effect=fake_run
+        ) as mock_run:
+            text, log_path = extract_whisper_cpp(
+                str(audio_path),
+                mode="native",
+                extra_env={"WHISPER_THREADS": "4", "WHISPER_CPUSET": "0-3"},
+            )
+
+        assert (text, log_path) == ("texte natif", None)
+        command = mock_run.call_args[0][0]
+        assert command[:4] == ["taskset", "-c", "0-3", "/usr/local/bin/whisper-cli"]
+        assert command[command.index("-t") + 1] == "4"
+        assert command[command.index("-of") + 1] == str(tmp_path / "episode")
+        assert not list(tmp_path.glob(".whisper_tmp_*"))
+
+
+class TestMergeChunkTranscripts:
+    """Tests pour l'assemblage des transcriptions de fenêtres chevauchantes"""
+
+    def test_merge_removes_duplicated_overlap(self):
+        """Les mots transcrits dans les deux fenêtres ne sont gardés qu'une fois"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        text = merge_chunk_transcripts(["a b c d", "c d e f"], chunk_s=4, overlap_s=1)
+
+        assert text == "a b c d e f"
+
+    def test_merge_keeps_complete_word_cut_at_boundary(self):
+        """Un mot coupé en fin de fenêtre est remplacé par sa version complète"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        text = merge_chunk_transcripts(
+            ["nous parlons de la littér", "la littérature française"]
+        )
+
+        assert text == "nous parlons de la littérature française"
+
+    def test_merge_ignores_case_and_punctuation(self):
+        """La comparaison ignore la casse et la ponctuation"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        text = merge_chunk_transcripts(["Bonjour à tous.", "À tous, ce soir"])
+
+        assert text == "Bonjour à tous, ce soir"
+
+    def test_merge_without_common_words_concatenates(self):
+        """Sans recouvrement détecté, les textes sont simplement concaténés"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        assert merge_chunk_transcripts(["un deux", "trois quatre"]) == (
+            "un deux trois quatre"
+        )
+
+    def test_merge_keeps_repetitions_outside_overlap(self):
+        """Une répétition hors de la zone de recouvrement n'est pas supprimée"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        previous = "le livre " + " ".join(f"mot{i}" for i in range(60)) + " fin"
+        text = merge_chunk_transcripts([previous, "le livre de Zola"])
+
+        assert text == previous + " le livre de Zola"
+
+    def test_merge_skips_empty_chunks_and_zero_overlap(self):
+        """Les fenêtres vides sont ignorées et un recouvrement nul ne déduplique rien"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        assert merge_chunk_transcripts(["a b c", "", "  ", "b c d"]) == "a b c d"
+        assert merge_chunk_transcripts(["a b c", "b c d"], overlap_s=0) == (
+            "a b c b c d"
+        )
+
+    def test_merge_keeps_single_repeated_word(self):
+        """Un seul mot commun à la coupure (ex. "de ... de") n'est pas un recouvrement"""
+        from nbs.mongo_episode import merge_chunk_transcripts
+
+        text = merge_chunk_transcripts(["il parle de", "de Balzac ce soir"])
+
+        assert text == "il parle de de Balzac ce soir"
+        assert merge_chunk_transcripts(["de la", "de Balzac"]) == "de la de Balzac"
+
+
+class TestWhisperModelCache:
+    """Tests pour le cache des modèles whisper"""
+
+    def test_get_whisper_model_loaded_once(self):
+        """Test que le modèle n'est chargé qu'une fois pour une même configuration"""
+        with patch("nbs.mongo_episode.AutoModelForSpeechSeq2Seq") as mock_model, patch(
+            "nbs.mongo_episode.AutoProcessor"
+        ) as mock_processor:
+            from nbs.mongo_episode import get_whisper_model
+
+            first = get_whisper_model(device="cpu")
+            second = get_whisper_model(device="cpu")
+
+            # Assert
+            assert first is second
+            mock_model.from_pretrained.assert_called_once()
+            mock_processor.from_pretrained.assert_called_once()
+            mock_model.from_pretrained.return_value.to.assert_called_once_with("cpu")
+
+    def test_get_whisper_model_keyed_by_device(self):
+        """Test qu'un device différent charge un autre modèle"""
+        with patch("nbs.mongo_episode.AutoModelForSpeechSeq2Seq") as mock_model, patch(
+            "nbs.mongo_episode.AutoProcessor"
+        ):
+            from nbs.mongo_episode import get_whisper_model
+
+            get_whisper_model(device="cpu")
+            get_whisper_model(device="cuda:0")
+
+            # Assert
+            assert mock_model.from_pretrained.call_count == 2
+
+    def test_extract_whisper_reuses_pipeline(self):
+        """Test que deux transcriptions réutilisent la même pipeline"""
+        mock_pipe = MagicMock(return_value={"text": "test"})
+
+        with patch(
+            "nbs.mongo_episode.pipeline", return_value=mock_pipe
+        ) as mock_pipeline, patch(
+            "nbs.mongo_episode.AutoModelForSpeechSeq2Seq"
+        ) as mock_model, patch(
+            "nbs.mongo_episode.AutoProcessor"
+        ):
+            from nbs.mongo_episode import extract_whisper
+
+            extract_whisper("/path/to/first.mp3")
+            extract_whisper("/path/to/second.mp3")
+
+            # Assert
+            mock_pipeline.assert_called_once()
+            mock_model.from_pretrained.assert_called_once()
+            assert mock_pipe.call_count == 2
+
+    def test_unload_whisper_models(self):
+        """Test que unload_whisper_models force un rechargement"""
+        with patch("nbs.mongo_episode.AutoModelForSpeechSeq2Seq") as mock_model, patch(
+            "nbs.mongo_episode.AutoProcessor"
+        ):
+            from nbs.mongo_episode import get_whisper_model, unload_whisper_models
+
+            get_whisper_model(device="cpu")
+            unload_whisper_models()
+            get_whisper_model(device="cpu")
+
+            # Assert
+            assert mock_model.from_pretrained.call_count == 2
+
+
 @patch("nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs"))
 class TestEpisodeClass:
     """Tests pour la classe Episode"""
@@ -364,6 +1052,68 @@ class TestEpisodeClass:
                 for call in mock_collection.find_one.call_args_list
             )
 
+    def test_episode_from_document_no_query(
+        self, mock_get_db_vars, sample_episode_data
+    ):
+        """Test que from_document hydrate un épisode sans requête Mongo"""
+        mock_collection = MagicMock()
+        document = {
+            "_id": ObjectId(),
+            "date": datetime(2024, 12, 22, 9, 59, 39),
+            "titre": sample_episode_data["titre"],
+            "description": sample_episode_data["description"],
+            "url": sample_episode_data["url"],
+            "duree": sample_episode_data["duree"],
+            "transcription": "Test transcription",
+            "masked": True,
+        }
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            from nbs.mongo_episode import Episode
+
+            episode = Episode.from_document(document)
+
+            # Assert
+            assert episode.date == document["date"]
+            assert episode.titre == document["titre"]
+            assert episode.url_telechargement == document["url"]
+            assert episode.transcription == "Test transcription"
+            assert episode.type is None
+            assert episode.masked is True
+            assert episode.collection == mock_collection
+            mock_collection.find_one.assert_not_called()
+            mock_collection.find.assert_not_called()
+
+    def test_episode_from_oid_single_query(
+        self, mock_get_db_vars, sample_episode_data
+    ):
+        """Test que from_oid ne fait qu'un seul find_one"""
+        mock_collection = MagicMock()
+        mock_collection.find_one.return_value = {
+            "date": datetime(2024, 12, 22, 9, 59, 39),
+            "titre": sample_episode_data["titre"],
+        }
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            from nbs.mongo_episode import Episode
+
+            episode = Episode.from_oid(ObjectId())
+
+            # Assert
+            assert episode.titre == sample_episode_data["titre"]
+            assert mock_collection.find_one.call_count == 1
+
+    def test_episode_from_oid_not_found(self, mock_get_db_vars):
+        """Test que from_oid retourne None pour un ObjectId inconnu"""
+        mock_collection = MagicMock()
+        mock_collection.find_one.return_value = None
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            from nbs.mongo_episode import Episode
+
+            # Assert
+            assert Episode.from_oid(ObjectId()) is None
+
     def test_episode_get_oid_success(self, mock_get_db_vars, sample_episode_data):
         """Test get_oid() retourne l'ObjectId correct"""
         test_oid = ObjectId()
@@ -544,6 +1294,35 @@ class TestEpisodeSetTranscription:
 
             episode.download_audio.assert_called_once()
 
+    def test_save_transcription_writes_cache_and_db(
+        self, mock_get_db_vars, sample_episode_data, tmp_path
+    ):
+        """save_transcription() écrit le cache .txt à côté de l'audio et met à jour la base"""
+        mock_collection = MagicMock()
+        oid = ObjectId()
+        mock_collection.find_one.side_effect = [None, {"_id": oid}]
+
+        with patch(
+            "nbs.mongo_episode.get_collection", return_value=mock_collection
+        ), patch("nbs.mongo_episode.get_audio_path", return_value=f"{tmp_path}/"):
+            from nbs.mongo_episode import Episode
+
+            episode = Episode(
+                date=sample_episode_data["date"], titre=sample_episode_data["titre"]
+            )
+            episode.audio_rel_filename = "episode.mp3"
+            episode.save_transcription("texte transcrit")
+
+        assert (tmp_path / "episode.txt").read_text() == "texte transcrit"
+        # le texte va dans la collection des transcriptions, l'épisode ne garde que le drapeau
+        mock_collection.update_one.assert_any_call(
+            {"episode_oid": oid}, {"$set": {"text": "texte transcrit"}}, upsert=True
+        )
+        mock_collection.update_one.assert_called_with(
+            {"_id": oid},
+            {"$set": {"has_transcription": True}, "$unset": {"transcription": ""}},
+        )
+
 
 @patch("nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs"))
 class TestEpisodeCRUDOperations:
@@ -582,6 +1361,55 @@ class TestEpisodeCRUDOperations:
             mock_collection.insert_one.assert_called_once()
             mock_mongolog.assert_called_once()
 
+    def test_episode_keep_known_existence_skips_query(
+        self, mock_get_db_vars, sample_episode_data
+    ):
+        """Test keep(exists=True) ne refait pas de requête d'existence"""
+        mock_collection = MagicMock()
+        mock_collection.find_one.return_value = None
+
+        with patch(
+            "nbs.mongo_episode.get_collection", return_value=mock_collection
+        ), patch("nbs.mongo_episode.mongolog"), patch("builtins.print"):
+
+            from nbs.mongo_episode import Episode
+
+            episode = Episode(
+                date=sample_episode_data["date"], titre=sample_episode_data["titre"]
+            )
+            mock_collection.find_one.reset_mock()
+
+            result = episode.keep(exists=True)
+
+            # Assert
+            assert result == 0
+            mock_collection.find_one.assert_not_called()
+            mock_collection.insert_one.assert_not_called()
+
+    def test_find_existing_single_query(self, mock_get_db_vars):
+        """Test find_existing vérifie tous les couples (titre, date) en une requête"""
+        date1, date2 = datetime(2025, 1, 5, 10, 0), datetime(2025, 1, 12, 10, 0)
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = [
+            {"titre": "Episode 1", "date": date1},
+            # même titre mais autre date : ne correspond à aucun couple demandé
+            {"titre": "Episode 1", "date": date2},
+        ]
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            from nbs.mongo_episode import Episode
+
+            existing = Episode.find_existing(
+                [("Episode 1", date1), ("Episode 2", date2)]
+            )
+            empty = Episode.find_existing([])
+
+        assert existing == {("Episode 1", date1)}
+        assert empty == set()
+        mock_collection.find.assert_called_once()
+        query = mock_collection.find.call_args[0][0]
+        assert sorted(query["titre"]["$in"]) == ["Episode 1", "Episode 2"]
+
     def test_episode_remove(self, mock_get_db_vars, sample_episode_data):
         """Test remove() supprime l'épisode"""
         mock_collection = MagicMock()
@@ -791,6 +1619,509 @@ class TestMaskedField:
                 len(episodes.oid_episodes) == 3
             ), "Should return all episodes including masked ones"
 
+    def test_episodes_get_episodes_single_cursor(self):
+        """Test que get_episodes hydrate tous les épisodes depuis un seul curseur"""
+        from nbs.mongo_episode import Episode, Episodes
+
+        # Arrange
+        documents = [
+            {
+                "_id": ObjectId("507f1f77bcf86cd799439011"),
+                "date": datetime(2024, 12, 22, 9, 59, 39),
+                "titre": "Episode 2",
+            },
+            {
+                "_id": ObjectId("507f1f77bcf86cd799439012"),
+                "date": datetime(2024, 12, 15, 9, 59, 39),
+                "titre": "Episode 1",
+            },
+        ]
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter(documents)
+        mock_collection.find.return_value = mock_cursor
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            # Act
+            episodes = Episodes()
+            result = episodes.get_episodes()
+
+            # Assert
+            assert [episode.titre for episode in result] == ["Episode 2", "Episode 1"]
+            assert all(isinstance(episode, Episode) for episode in result)
+            assert episodes.oid_episodes == [doc["_id"] for doc in documents]
+            assert mock_collection.find.call_count == 1
+            mock_collection.find_one.assert_not_called()
+
+    def test_episodes_iter_episodes_streams_with_projection(self):
+        """Test que iter_episodes streame des épisodes avec projection et batch_size"""
+        from nbs.mongo_episode import Episodes
+
+        # Arrange
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.batch_size.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter(
+            [
+                {
+                    "_id": "oid2",
+                    "date": datetime(2024, 12, 22),
+                    "titre": "Episode 2",
+                    "has_transcription": False,
+                },
+                {"_id": "oid1", "date": datetime(2024, 12, 15), "titre": "Episode 1"},
+            ]
+        )
+        mock_collection.find.return_value = mock_cursor
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            episodes = Episodes()
+
+            # Act
+            iterator = episodes.iter_episodes(
+                {"type": "livres"}, projection={"description": 1}, batch_size=10
+            )
+            # rien n'est requêté avant la première itération
+            mock_collection.find.assert_not_called()
+            result = list(iterator)
+
+            # Assert
+            assert [episode.titre for episode in result] == ["Episode 2", "Episode 1"]
+            assert result[0].transcription is None
+            assert [episode._oid for episode in result] == ["oid2", "oid1"]
+            projection = mock_collection.find.call_args[0][1]
+            assert projection == {
+                "description": 1,
+                "_id": 1,
+                "date": 1,
+                "titre": 1,
+                "has_transcription": 1,
+                "masked": 1,
+            }
+            mock_cursor.batch_size.assert_called_once_with(10)
+            assert episodes.oid_episodes == []
+
+    def test_episodes_iter_episodes_exclusion_projection(self):
+        """Test qu'une projection d'exclusion est transmise telle quelle"""
+        from nbs.mongo_episode import Episodes
+
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.batch_size.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter([])
+        mock_collection.find.return_value = mock_cursor
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            list(Episodes().iter_episodes(projection={"transcription": 0}))
+
+            assert mock_collection.find.call_args[0][1] == {"transcription": 0}
+
+
+class TestEpisodeFlags:
+    """Tests pour les champs has_transcription et masked et les compteurs indexés"""
+
+    def test_to_document_includes_flags(self):
+        """Test que to_document() renseigne has_transcription et masked"""
+        from nbs.mongo_episode import Episode
+
+        episode = Episode.from_document(
+            {"date": datetime(2024, 12, 22), "titre": "Episode", "masked": None}
+        )
+
+        document = episode.to_document()
+
+        assert document["has_transcription"] is False
+        assert document["masked"] is False
+        episode.transcription = "texte"
+        assert episode.to_document()["has_transcription"] is True
+
+    def test_set_masked_updates_db(self):
+        """Test que set_masked() écrit un booléen en base"""
+        from nbs.mongo_episode import Episode
+
+        mock_collection = MagicMock()
+        oid = ObjectId()
+        mock_collection.find_one.side_effect = [None, {"_id": oid}]
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            episode = Episode(date="2024-12-22T09:59:39", titre="Test Episode")
+            episode.set_masked(1)
+
+        assert episode.masked is True
+        mock_collection.update_one.assert_called_once_with(
+            {"_id": oid}, {"$set": {"masked": True}}
+        )
+
+    def test_len_missing_transcriptions_counts_without_reading(self):
+        """Test que len_missing_transcriptions() compte sans charger les épisodes"""
+        from nbs.mongo_episode import Episodes
+
+        mock_collection = MagicMock()
+        mock_collection.count_documents.return_value = 3
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            episodes = Episodes()
+
+            assert episodes.len_missing_transcriptions() == 3
+            mock_collection.count_documents.assert_called_once_with(
+                {"has_transcription": False, "masked": False}
+            )
+            episodes.len_missing_transcriptions(include_masked=True)
+            mock_collection.count_documents.assert_called_with(
+                {"has_transcription": False}
+            )
+            mock_collection.find.assert_not_called()
+
+    def test_get_last_date(self):
+        """Test que get_last_date() lit une seule date triée et gère la base vide"""
+        from nbs.mongo_episode import Episodes
+
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter([{"date": datetime(2024, 12, 22)}])
+        mock_collection.find.return_value = mock_cursor
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            episodes = Episodes()
+
+            assert episodes.get_last_date() == datetime(2024, 12, 22)
+            mock_collection.find.assert_called_once_with(
+                {"masked": False}, {"date": 1, "_id": 0}
+            )
+            mock_cursor.sort.assert_called_once_with({"date": -1})
+            mock_cursor.limit.assert_called_once_with(1)
+
+            mock_cursor.__iter__.return_value = iter([])
+            assert episodes.get_last_date() is None
+
+    def test_migrate_flags(self):
+        """Test que migrate_flags() normalise masked et renseigne has_transcription"""
+        from nbs.mongo_episode import Episodes
+
+        mock_collection = MagicMock()
+        mock_collection.update_many.side_effect = [
+            MagicMock(modified_count=5),
+            MagicMock(modified_count=2),
+            MagicMock(modified_count=7),
+        ]
+
+        with patch("nbs.mongo_episode.get_collection", return_value=mock_collection):
+            result = Episodes().migrate_flags()
+
+        assert result == {"masked": 5, "has_transcription": 9}
+        calls = mock_collection.update_many.call_args_list
+        assert calls[0][0] == (
+            {"masked": {"$nin": [True, False]}},
+            {"$set": {"masked": False}},
+        )
+        assert calls[1][0][1] == {"$set": {"has_transcription": False}}
+        assert calls[2][0][1] == {"$set": {"has_transcription": True}}
+
+
+@pytest.fixture
+def split_collections():
+    """Une collection mockée par nom : episodes et transcriptions sont distinguées"""
+    collections = {}
+
+    def get_collection(target_db, client_name, collection_name):
+        return collections.setdefault(collection_name, MagicMock(name=collection_name))
+
+    with patch(
+        "nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs")
+    ), patch("nbs.mongo_episode.get_collection", side_effect=get_collection):
+        yield collections
+
+
+class TestLazyTranscription:
+    """Tests pour le stockage à part et la lecture à la demande des transcriptions"""
+
+    def test_transcription_loaded_on_first_access(self, split_collections):
+        """Test que la transcription n'est lue qu'au premier accès, une seule fois"""
+        from nbs.mongo_episode import Episode
+
+        oid = ObjectId()
+        transcriptions = split_collections.setdefault("transcriptions", MagicMock())
+        transcriptions.find.return_value = [{"episode_oid": oid, "text": "texte"}]
+
+        episode = Episode.from_document(
+            {
+                "_id": oid,
+                "date": datetime(2024, 12, 22),
+                "titre": "Episode",
+                "has_transcription": True,
+            }
+        )
+        transcriptions.find.assert_not_called()
+        assert episode.to_dict(include_transcription=False)["has_transcription"]
+        transcriptions.find.assert_not_called()
+
+        assert episode.transcription == "texte"
+        assert episode.transcription == "texte"
+        transcriptions.find.assert_called_once_with(
+            {"episode_oid": {"$in": [oid]}}, {"episode_oid": 1, "text": 1, "_id": 0}
+        )
+
+    def test_transcription_not_read_without_flag(self, split_collections):
+        """Test qu'un épisode sans transcription ou non migré ne fait aucune lecture"""
+        from nbs.mongo_episode import Episode
+
+        missing = Episode.from_document(
+            {"date": datetime(2024, 12, 22), "titre": "A", "has_transcription": False}
+        )
+        legacy = Episode.from_document(
+            {"date": datetime(2024, 12, 15), "titre": "B", "transcription": "ancien"}
+        )
+
+        assert missing.transcription is None
+        assert legacy.transcription == "ancien"
+        assert "transcriptions" not in split_collections
+
+    def test_keep_stores_transcription_apart(self, split_collections):
+        """Test que keep() écrit la transcription hors du document de l'épisode"""
+        from nbs.mongo_episode import Episode
+
+        oid = ObjectId()
+        episodes = split_collections.setdefault("episodes", MagicMock())
+        episodes.insert_one.return_value.inserted_id = oid
+        episode = Episode.from_document({"date": datetime(2024, 12, 22), "titre": "A"})
+        episode.download_audio = MagicMock()
+        episode.transcription = "texte"
+
+        with patch("nbs.mongo_episode.mongolog"), patch("builtins.print"):
+            episode.keep(exists=False)
+
+        document = episodes.insert_one.call_args[0][0]
+        assert "transcription" not in document
+        assert document["has_transcription"] is True
+        split_collections["transcriptions"].update_one.assert_called_once_with(
+            {"episode_oid": oid}, {"$set": {"text": "texte"}}, upsert=True
+        )
+
+    def test_delete_transcription(self, split_collections):
+        """Test que delete_transcription() supprime le texte et remet le drapeau à False"""
+        from nbs.mongo_episode import Episode
+
+        oid = ObjectId()
+        episode = Episode.from_document(
+            {
+                "_id": oid,
+                "date": datetime(2024, 12, 22),
+                "titre": "A",
+                "transcription": "t",
+            }
+        )
+
+        episode.delete_transcription()
+
+        assert episode.transcription is None
+        split_collections["transcriptions"].delete_one.assert_called_once_with(
+            {"episode_oid": oid}
+        )
+        split_collections["episodes"].update_one.assert_called_once_with(
+            {"_id": oid},
+            {"$set": {"has_transcription": False}, "$unset": {"transcription": ""}},
+        )
+
+    def test_migrate_transcriptions(self, split_collections):
+        """Test que migrate_transcriptions() déplace les transcriptions par lots"""
+        from nbs.mongo_episode import Episodes
+
+        oid1, oid2 = ObjectId(), ObjectId()
+        episodes_collection = split_collections.setdefault("episodes", MagicMock())
+        episodes_collection.find.return_value.limit.side_effect = [
+            [
+                {"_id": oid1, "transcription": "texte"},
+                {"_id": oid2, "transcription": None},
+            ],
+            [],
+        ]
+        transcriptions = split_collections.setdefault("transcriptions", MagicMock())
+        transcriptions.database.list_collection_names.return_value = []
+
+        moved = Episodes().migrate_transcriptions(batch_size=2)
+
+        assert moved == 1
+        transcriptions.database.create_collection.assert_called_once()
+        operations = transcriptions.bulk_write.call_args[0][0]
+        assert len(operations) == 1
+        # le drapeau est posé dans la même écriture que le retrait du texte
+        assert [c[0] for c in episodes_collection.update_many.call_args_list] == [
+            (
+                {"_id": {"$in": [oid1]}},
+                {"$set": {"has_transcription": True}, "$unset": {"transcription": ""}},
+            ),
+            (
+                {"_id": {"$in": [oid2]}},
+                {"$set": {"has_transcription": False}, "$unset": {"transcription": ""}},
+            ),
+        ]
+
+    def test_document_without_flag_reads_transcription(self, split_collections):
+        """Test qu'un document sans has_transcription (avant migrate_flags) lit sa transcription"""
+        from nbs.mongo_episode import Episode
+
+        oid = ObjectId()
+        transcriptions = split_collections.setdefault("transcriptions", MagicMock())
+        transcriptions.find.return_value = [{"episode_oid": oid, "text": "texte"}]
+
+        episode = Episode.from_document(
+            {"_id": oid, "date": datetime(2024, 12, 22), "titre": "A"}
+        )
+
+        assert episode.has_transcription() is True
+        assert episode.transcription == "texte"
+        transcriptions.find.assert_called_once()
+
+    def test_transcription_without_oid_writes_no_orphan(self, split_collections):
+        """Test qu'aucune transcription n'est écrite pour un épisode absent de la base"""
+        from nbs.mongo_episode import Episode, store_transcription
+
+        episodes = split_collections.setdefault("episodes", MagicMock())
+        episodes.find_one.return_value = None
+        episode = Episode.from_document({"date": datetime(2024, 12, 22), "titre": "A"})
+
+        episode.save_transcription("texte", keep_cache=False)
+
+        assert episode.transcription == "texte"
+        assert "transcriptions" not in split_collections
+        episodes.update_one.assert_not_called()
+        with pytest.raises(ValueError):
+            store_transcription(None, "texte")
+
+
+@patch("nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs"))
+class TestEpisodesBulkKeep:
+    """Tests pour Episodes.bulk_keep (ingestion groupée)"""
+
+    def _make_episode(self, titre, day, keep=True):
+        """Helper pour créer un épisode sans requête en base."""
+        from nbs.mongo_episode import Episode
+
+        episode = Episode.from_document({"titre": titre, "date": datetime(2024, 1, day)})
+        episode.download_audio = MagicMock()
+        episode.should_keep = MagicMock(return_value=keep)
+        return episode
+
+    def test_bulk_keep_report_and_single_writes(self, mock_get_db_vars):
+        """Une requête d'existence, un insert_many, un lot de logs et un rapport par épisode"""
+        mock_collection = MagicMock()
+        mock_collection.name = "episodes"
+        mock_collection.find.return_value = [
+            {"titre": "existant", "date": datetime(2024, 1, 2)}
+        ]
+
+        with patch(
+            "nbs.mongo_episode.get_collection", return_value=mock_collection
+        ), patch("nbs.mongo_episode.get_audio_path"), patch(
+            "nbs.mongo_episode.mongolog_many"
+        ) as mock_mongolog_many:
+            from nbs.mongo_episode import Episodes
+
+            nouveau = self._make_episode("nouveau", 1)
+            existant = self._make_episode("existant", 2)
+            ignore = self._make_episode("ignoré", 3, keep=False)
+            doublon = self._make_episode("nouveau", 1)
+            echec = self._make_episode("échec", 4)
+            echec.download_audio.side_effect = RuntimeError("404")
+
+            report = Episodes().bulk_keep([nouveau, existant, ignore, doublon, echec])
+
+        assert [item["status"] for item in report] == [
+            "inserted",
+            "exists",
+            "ignored",
+            "exists",
+            "failed",
+        ]
+        assert report[4]["error"] == "404"
+        mock_collection.find.assert_called_once()
+        mock_collection.insert_one.assert_not_called()
+        mock_collection.insert_many.assert_called_once()
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert [doc["titre"] for doc in documents] == ["nouveau"]
+        assert mock_collection.insert_many.call_args[1] == {"ordered": False}
+        logs = list(mock_mongolog_many.call_args[0][0])
+        assert [log[0] for log in logs] == ["insert", "update", "update"]
+
+    def test_bulk_keep_reports_write_errors(self, mock_get_db_vars):
+        """Les erreurs d'écriture de l'insert_many sont reportées par épisode"""
+        from pymongo.errors import BulkWriteError
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = []
+        mock_collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "errmsg": "duplicate key"}]}
+        )
+
+        with patch(
+            "nbs.mongo_episode.get_collection", return_value=mock_collection
+        ), patch("nbs.mongo_episode.mongolog_many"):
+            from nbs.mongo_episode import Episodes
+
+            episodes = [self._make_episode(f"episode {i}", i + 1) for i in range(3)]
+            report = Episodes().bulk_keep(episodes, download=False)
+
+        assert [item["status"] for item in report] == ["inserted", "failed", "inserted"]
+        assert report[1]["error"] == "duplicate key"
+        for episode in episodes:
+            episode.download_audio.assert_not_called()
+
+    def test_bulk_keep_resolves_web_audio_urls_for_new_episodes_only(
+        self, mock_get_db_vars
+    ):
+        """Les entrées web sont créées sans requête ; seuls les nouveaux épisodes lisent leur page"""
+        mock_collection = MagicMock()
+        mock_collection.name = "episodes"
+        mock_collection.find.return_value = [
+            {"titre": "existant", "date": datetime(2024, 1, 2)}
+        ]
+        entries = [
+            {
+                "title": title,
+                "url": f"https://rf.fr/{title}",
+                "description": "résumé",
+                "date": date,
+                "duration": "50 min",
+            }
+            for title, date in [
+                ("nouveau", "01 janv. 2024"),
+                ("existant", "02 janv. 2024"),
+            ]
+        ]
+
+        with patch(
+            "nbs.mongo_episode.get_collection", return_value=mock_collection
+        ), patch("nbs.mongo_episode.locale"), patch(
+            "nbs.mongo_episode.WEB_episode.parse_web_date",
+            side_effect=[datetime(2024, 1, 1), datetime(2024, 1, 2)],
+        ), patch(
+            "nbs.mongo_episode.WEB_episode.get_audio_url",
+            side_effect=lambda url: f"{url}.m4a",
+        ) as mock_get_audio_url, patch(
+            "nbs.mongo_episode.mongolog_many"
+        ):
+            from nbs.mongo_episode import Episodes, WEB_episode
+
+            episodes = [
+                WEB_episode.from_webpage_entry(entry, resolve_audio=False)
+                for entry in entries
+            ]
+            mock_collection.find_one.assert_not_called()
+            mock_get_audio_url.assert_not_called()
+
+            report = Episodes().bulk_keep(episodes, download=False)
+
+        assert [item["status"] for item in report] == ["inserted", "exists"]
+        mock_get_audio_url.assert_called_once_with("https://rf.fr/nouveau")
+        documents = mock_collection.insert_many.call_args[0][0]
+        assert documents[0]["url"] == "https://rf.fr/nouveau.m4a"
+        assert episodes[1].url_telechargement is None
+
 
 @patch("nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs"))
 class TestRSSEpisodeFromFeedEntry:
@@ -842,3 +2173,131 @@ class TestRSSEpisodeFromFeedEntry:
             result = RSS_episode.from_feed_entry(entry)
 
             assert result.url_telechargement == "https://proxycast.rf.fr/episode.m4a"
+
+
+class TestZeroShotClassification:
+    """Tests pour le classifieur zero-shot partagé et la classification par lots"""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Vide les caches du classifieur et des classifications entre les tests"""
+        import nbs.mongo_episode as mongo_episode_module
+
+        mongo_episode_module._zero_shot_classifiers.clear()
+        mongo_episode_module._episode_types.clear()
+        mongo_episode_module._episode_type_tiers.clear()
+        yield
+        mongo_episode_module._zero_shot_classifiers.clear()
+        mongo_episode_module._episode_types.clear()
+        mongo_episode_module._episode_type_tiers.clear()
+
+    def test_set_titre_loads_classifier_once_and_memoizes(self):
+        """set_titre charge le classifieur une seule fois et mémoïse par texte"""
+        mock_classifier = MagicMock(return_value={"labels": ["livres", "films"]})
+
+        with patch(
+            "nbs.mongo_episode.pipeline", return_value=mock_classifier
+        ) as mock_pipeline:
+            from nbs.mongo_episode import RSS_episode
+
+            assert RSS_episode.set_titre("Le masque livres") == "livres"
+            assert RSS_episode.set_titre("Le masque livres") == "livres"
+            assert RSS_episode.set_titre("Le masque cinéma") == "livres"
+
+        mock_pipeline.assert_called_once_with(
+            "zero-shot-classification", model="facebook/bart-large-mnli"
+        )
+        assert mock_classifier.call_count == 2
+
+    def test_classify_episode_types_single_batched_call(self):
+        """Les textes non encore classés partent en un seul appel, dans l'ordre"""
+        mock_classifier = MagicMock(
+            side_effect=lambda texts, labels, **kwargs: [
+                {"labels": ["films" if "film" in text else "livres"]} for text in texts
+            ]
+        )
+
+        with patch("nbs.mongo_episode.pipeline", return_value=mock_classifier):
+            from nbs.mongo_episode import classify_episode_types
+
+            types = classify_episode_types(["un film", "des livres", "un film"])
+            again = classify_episode_types(["des livres", "un film"])
+
+        assert types == ["films", "livres", "films"]
+        assert again == ["livres", "films"]
+        mock_classifier.assert_called_once()
+        assert mock_classifier.call_args[0][0] == ["un film", "des livres"]
+
+    @patch(
+        "nbs.mongo_episode.get_DB_VARS", return_value=("localhost", "test_db", "logs")
+    )
+    def test_from_feed_entries_classifies_in_batch(self, mock_get_db_vars):
+        """from_feed_entries crée les épisodes puis les classe en un seul lot"""
+        entries = []
+        for title in ["Livres 1", "Films 2"]:
+            entry = MagicMock()
+            entry.published = "Sun, 29 Mar 2026 10:12:30 +0200"
+            entry.title = title
+            entry.summary = "résumé"
+            entry.links = [MagicMock(type="audio/mpeg", href=f"https://rf.fr/{title}")]
+            entry.itunes_duration = "00:46:46"
+            entries.append(entry)
+
+        with patch("nbs.mongo_episode.get_collection"), patch(
+            "nbs.mongo_episode.locale"
+        ), patch(
+            "nbs.mongo_episode.classify_episode_types_with_tier",
+            return_value=[("livres", "lexical"), ("films", "zero-shot")],
+        ) as mock_classify:
+            from nbs.mongo_episode import RSS_episode
+
+            episodes = RSS_episode.from_feed_entries(entries)
+
+        mock_classify.assert_called_once_with(["Livres 1 résumé", "Films 2 résumé"])
+        assert [episode.type for episode in episodes] == ["livres", "films"]
+        assert [episode.type_source for episode in episodes] == [
+            "lexical",
+            "zero-shot",
+        ]
+        assert [episode.duree for episode in episodes] == [2806, 2806]
+        assert episodes[0].to_document()["type_source"] == "lexical"
+
+    def test_classify_episode_type_lexical(self):
+        """Le classement lexical tranche sur des mots-clés nets et s'abstient sinon"""
+        from nbs.mongo_episode import classify_episode_type_lexical
+
+        assert (
+            classify_episode_type_lexical(
+                "Les nouveaux romans de la rentrée : deux livres et un essai"
+            )
+            == "livres"
+        )
+        assert (
+            classify_episode_type_lexical(
+                "Au théâtre : une pièce et sa mise en scène"
+            )
+            == "pièces de théâtre"
+        )
+        # ambigu : un seul mot-clé, ou deux labels à égalité
+        assert classify_episode_type_lexical("Un film") is None
+        assert classify_episode_type_lexical("Livres et films, livres et films") is None
+
+    def test_lexical_tier_skips_zero_shot(self):
+        """Seules les descriptions ambiguës passent par BART, et chaque niveau est compté"""
+        mock_classifier = MagicMock(return_value={"labels": ["films", "livres"]})
+
+        with patch("nbs.mongo_episode.pipeline", return_value=mock_classifier):
+            from nbs.mongo_episode import (
+                classify_episode_types_with_tier,
+                get_episode_type_stats,
+            )
+
+            decisions = classify_episode_types_with_tier(
+                ["Trois romans et deux essais", "Le masque du dimanche"]
+            )
+
+        assert decisions == [("livres", "lexical"), ("films", "zero-shot")]
+        mock_classifier.assert_called_once_with(
+            "Le masque du dimanche", ["livres", "films", "pièces de théâtre"]
+        )
+        assert get_episode_type_stats() == {"lexical": 1, "zero-shot": 1}
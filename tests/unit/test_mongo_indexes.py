@@ -0,0 +1,142 @@
+"""
+Tests pour le module nbs.mongo_indexes.
+
+Ce module teste la gestion des index MongoDB :
+- Création idempotente des index déclarés (ensure_indexes)
+- Détection des conflits et des échecs (doublons sur un index unique)
+- Rapport d'utilisation des index ($indexStats)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+nbs_path = Path(__file__).parent.parent.parent / "nbs"
+if str(nbs_path) not in sys.path:
+    sys.path.insert(0, str(nbs_path))
+
+from nbs.mongo_indexes import INDEX_SPECS, ensure_indexes, index_usage_report
+
+
+@pytest.fixture
+def mock_collections():
+    """Une collection mockée par nom, sans index autre que _id_"""
+    collections = {}
+
+    def get_collection(target_db, client_name, collection_name):
+        if collection_name not in collections:
+            collection = MagicMock()
+            collection.index_information.return_value = {
+                "_id_": {"key": [("_id", 1)], "v": 2}
+            }
+            collection.aggregate.return_value = []
+            collections[collection_name] = collection
+        return collections[collection_name]
+
+    with patch(
+        "nbs.mongo_indexes.get_DB_VARS", return_value=("localhost", "test_db", "false")
+    ), patch("nbs.mongo_indexes.get_collection", side_effect=get_collection):
+        yield collections
+
+
+class TestEnsureIndexes:
+    """Tests pour la création des index déclarés"""
+
+    def test_ensure_indexes_creates_declared_indexes(self, mock_collections):
+        """Tous les index déclarés sont créés avec leur nom et leurs options"""
+        report = ensure_indexes()
+
+        assert len(report) == sum(len(specs) for specs in INDEX_SPECS.values())
+        assert {item["status"] for item in report} == {"created"}
+        mock_collections["auteurs"].create_index.assert_called_once_with(
+            [("nom", 1)], name="nom_1", unique=True
+        )
+        mock_collections["episodes"].create_index.assert_any_call(
+            [("titre", 1), ("date", 1)], name="titre_1_date_1"
+        )
+        mock_collections["episodes"].create_index.assert_any_call(
+            [("has_transcription", 1), ("masked", 1), ("date", -1)],
+            name="has_transcription_1_masked_1_date_-1",
+            partialFilterExpression={"has_transcription": False},
+        )
+        mock_collections["author_resolutions"].create_index.assert_called_once_with(
+            [("expires_at", 1)], name="expires_at_1", expireAfterSeconds=0
+        )
+
+    def test_ensure_indexes_is_idempotent(self, mock_collections):
+        """Un index identique déjà présent n'est pas recréé"""
+        auteurs = mock_collections.setdefault("auteurs", MagicMock())
+        auteurs.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "nom_1": {"key": [("nom", 1)], "unique": True},
+        }
+
+        report = ensure_indexes(["auteurs"])
+
+        assert report == [
+            {
+                "collection": "auteurs",
+                "name": "nom_1",
+                "status": "exists",
+                "error": None,
+            }
+        ]
+        auteurs.create_index.assert_not_called()
+
+    def test_ensure_indexes_reports_conflict(self, mock_collections):
+        """Un index de même nom sans l'option unique est signalé sans être modifié"""
+        livres = mock_collections.setdefault("livres", MagicMock())
+        livres.index_information.return_value = {"nom_1": {"key": [("nom", 1)]}}
+
+        report = ensure_indexes(["livres"])
+
+        assert report[0]["status"] == "conflict"
+        livres.create_index.assert_not_called()
+
+    def test_ensure_indexes_reports_duplicates(self, mock_collections):
+        """Des doublons empêchent la création d'un index unique : l'échec est reporté"""
+        livres = mock_collections.setdefault("livres", MagicMock())
+        livres.index_information.return_value = {}
+        livres.create_index.side_effect = OperationFailure(
+            "E11000 duplicate key error", code=11000
+        )
+
+        report = ensure_indexes(["livres"])
+
+        assert report[0]["status"] == "failed"
+        assert "duplicate key" in report[0]["error"]
+
+    def test_ensure_indexes_dry_run(self, mock_collections):
+        """En dry_run, les index absents sont signalés sans être créés"""
+        report = ensure_indexes(["episodes"], dry_run=True)
+
+        assert {item["status"] for item in report} == {"missing"}
+        assert len(report) == len(INDEX_SPECS["episodes"])
+        mock_collections["episodes"].create_index.assert_not_called()
+
+
+class TestIndexUsageReport:
+    """Tests pour le rapport d'utilisation des index"""
+
+    def test_index_usage_report(self, mock_collections):
+        """Les index déclarés absents, inutilisés et utilisés sont distingués"""
+        since = datetime(2025, 1, 1)
+        episodes = mock_collections.setdefault("episodes", MagicMock())
+        episodes.aggregate.return_value = [
+            {"name": "_id_", "accesses": {"ops": 12, "since": since}},
+            {"name": "titre_1_date_1", "accesses": {"ops": 40, "since": since}},
+            {"name": "ancien_index", "accesses": {"ops": 0, "since": since}},
+        ]
+
+        report = index_usage_report(["episodes"])
+
+        statuses = {item["name"]: (item["status"], item["declared"]) for item in report}
+        assert statuses["titre_1_date_1"] == ("used", True)
+        assert statuses["date_-1"] == ("missing", True)
+        assert statuses["ancien_index"] == ("unused", False)
+        assert "_id_" not in statuses
+        episodes.aggregate.assert_called_once_with([{"$indexStats": {}}])
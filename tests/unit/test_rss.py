@@ -6,7 +6,10 @@ Testing complet des fonctions RSS et classe Podcast avec mocking HTTP/DB
 import pytest
 from unittest.mock import patch, MagicMock, call
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
 import pytz
+import requests
 import sys
 import os
 
@@ -32,6 +35,15 @@ def mock_external_imports():
         yield
 
 
+@pytest.fixture
+def mock_fetch_feed():
+    """Évite tout accès réseau : fetch_feed renvoie une copie locale fictive du flux"""
+    with patch(
+        "rss.fetch_feed", return_value=("/tmp/rss_feed.xml", 304)
+    ) as mock_fetch:
+        yield mock_fetch
+
+
 # Configuration du path pour importer nos modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../nbs"))
 
@@ -278,6 +290,7 @@ class TestExtraireUrlsRss:
         assert "https://proxycast.radiofrance.fr/episode.m4a" in result
 
 
+@pytest.mark.usefixtures("mock_fetch_feed")
 class TestPodcastInit:
     """Tests pour l'initialisation de la classe Podcast"""
 
@@ -306,7 +319,8 @@ class TestPodcastInit:
         assert podcast.parsed_flow is not None
         assert podcast.collection == mock_collection
         mock_get_url.assert_called_once()
-        mock_parse.assert_called_once_with("https://test.rss.url")
+        mock_parse.assert_called_once_with("/tmp/rss_feed.xml")
+        assert podcast.feed_status == 304
         mock_get_db_vars.assert_called_once()
         mock_get_collection.assert_called_once_with(
             target_db="localhost", client_name="testdb", collection_name="episodes"
@@ -334,6 +348,7 @@ class TestPodcastInit:
             Podcast()
 
 
+@pytest.mark.usefixtures("mock_fetch_feed")
 class TestPodcastGetMostRecentEpisode:
     """Tests pour get_most_recent_episode_from_DB"""
 
@@ -413,6 +428,7 @@ class TestPodcastGetMostRecentEpisode:
             assert result is None
 
 
+@pytest.mark.usefixtures("mock_fetch_feed")
 class TestPodcastListLastLargeEpisodes:
     """Tests pour list_last_large_episodes"""
 
@@ -482,6 +498,43 @@ class TestPodcastListLastLargeEpisodes:
             assert entry3 in result
             assert entry2 not in result  # Trop court
 
+    def test_list_last_large_episodes_stops_at_known_entry(self):
+        """list_last_large_episodes lit la base une fois et s'arrête à la première entrée connue"""
+        # Import du module après le mocking
+        from rss import Podcast
+
+        with patch("rss.get_collection") as mock_get_collection, patch(
+            "rss.get_DB_VARS"
+        ) as mock_get_db_vars, patch("rss.feedparser.parse") as mock_parse, patch(
+            "rss.get_RSS_URL"
+        ), patch(
+            "rss.RSS_episode"
+        ) as mock_rss_episode:
+
+            # Arrange : flux dans le désordre, une entrée plus ancienne que la base
+            mock_get_db_vars.return_value = ("localhost", "testdb", None)
+            mock_get_collection.return_value = MagicMock()
+            old = MagicMock(published="Sat, 18 Jan 2025 15:00:00 +0100")
+            newest = MagicMock(published="Wed, 22 Jan 2025 17:00:00 +0100")
+            new = MagicMock(published="Mon, 20 Jan 2025 15:00:00 +0100")
+            mock_parse.return_value = MagicMock(entries=[new, old, newest])
+            mock_rss_episode.get_duree_in_seconds.return_value = 3600
+
+            podcast = Podcast()
+
+            with patch.object(
+                podcast, "get_most_recent_episode_from_DB"
+            ) as mock_get_recent:
+                mock_get_recent.return_value = datetime(
+                    2025, 1, 19, 12, 0, 0, tzinfo=pytz.timezone("Europe/Paris")
+                )
+                result = podcast.list_last_large_episodes()
+
+            # Assert
+            assert result == [newest, new]
+            mock_get_recent.assert_called_once()
+            assert mock_rss_episode.get_duree_in_seconds.call_count == 2
+
     def test_list_last_large_episodes_no_db_date(self):
         """Test list_last_large_episodes quand pas de date en DB"""
         # Import du module après le mocking
@@ -512,6 +565,7 @@ class TestPodcastListLastLargeEpisodes:
             assert result == []  # Aucun épisode car pas de référence temporelle
 
 
+@pytest.mark.usefixtures("mock_fetch_feed")
 class TestPodcastStoreLastLargeEpisodes:
     """Tests pour store_last_large_episodes"""
 
@@ -547,7 +601,7 @@ class TestPodcastStoreLastLargeEpisodes:
             mock_rss_instance2 = MagicMock()
             mock_rss_instance2.keep.return_value = 1  # Success
 
-            mock_rss_episode.from_feed_entry.side_effect = [
+            mock_rss_episode.from_feed_entries.return_value = [
                 mock_rss_instance1,
                 mock_rss_instance2,
             ]
@@ -561,11 +615,10 @@ class TestPodcastStoreLastLargeEpisodes:
 
             # Assert
             mock_list.assert_called_once_with(20)
-            assert mock_rss_episode.from_feed_entry.call_count == 2
-            mock_rss_episode.from_feed_entry.assert_any_call(mock_entry1)
-            mock_rss_episode.from_feed_entry.assert_any_call(mock_entry2)
-            mock_rss_instance1.keep.assert_called_once()
-            mock_rss_instance2.keep.assert_called_once()
+            mock_rss_episode.from_feed_entries.assert_called_once_with(episodes_list)
+            mock_rss_episode.find_existing.assert_called_once()
+            mock_rss_instance1.keep.assert_called_once_with(exists=False)
+            mock_rss_instance2.keep.assert_called_once_with(exists=False)
             mock_print.assert_called_once_with("Updated episodes: 2")
 
     def test_store_last_large_episodes_no_updates(self):
@@ -624,8 +677,10 @@ class TestRSSConstantsAndImports:
         # Assert
         expected_exports = [
             "RSS_DATE_FORMAT",
+            "RSS_FETCH_TIMEOUT_S",
             "extraire_dureesummary",
             "extraire_urls_rss",
+            "fetch_feed",
             "Podcast",
         ]
         assert rss.__all__ == expected_exports
@@ -633,3 +688,102 @@ class TestRSSConstantsAndImports:
         # Verify all exported items exist
         for export in expected_exports:
             assert hasattr(rss, export), f"Missing export: {export}"
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    """Serveur RSS de substitution : répond 304 si l'ETag envoyé est le bon"""
+
+    etag = '"v1"'
+    body = b"<rss><channel><title>Le masque</title></channel></rss>"
+    requests_headers = []
+
+    def do_GET(self):
+        self.requests_headers.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", "Sun, 29 Dec 2024 10:59:39 GMT")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    """Lance le serveur RSS de substitution sur un port libre"""
+    _FeedHandler.requests_headers = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/rss.xml", server
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetchFeed:
+    """Tests pour fetch_feed (requête conditionnelle et copie locale du flux)"""
+
+    def test_fetch_feed_conditional_get(self, feed_server, tmp_path):
+        """Le premier appel télécharge le flux, le second renvoie l'ETag et obtient 304"""
+        from rss import fetch_feed
+
+        url, _ = feed_server
+        cache_file = str(tmp_path / "rss_feed.xml")
+
+        first = fetch_feed(url, cache_file)
+        second = fetch_feed(url, cache_file)
+
+        assert first == (cache_file, 200)
+        assert second == (cache_file, 304)
+        with open(cache_file, "rb") as f:
+            assert f.read() == _FeedHandler.body
+        assert "If-None-Match" not in _FeedHandler.requests_headers[0]
+        assert _FeedHandler.requests_headers[1]["If-None-Match"] == '"v1"'
+        assert (
+            _FeedHandler.requests_headers[1]["If-Modified-Since"]
+            == "Sun, 29 Dec 2024 10:59:39 GMT"
+        )
+
+    def test_fetch_feed_other_url_ignores_cache(self, feed_server, tmp_path):
+        """Les validateurs d'une autre URL ne sont pas envoyés"""
+        from rss import fetch_feed
+
+        url, _ = feed_server
+        cache_file = str(tmp_path / "rss_feed.xml")
+        fetch_feed(url, cache_file)
+
+        result = fetch_feed(url + "?autre", cache_file)
+
+        assert result == (cache_file, 200)
+        assert "If-None-Match" not in _FeedHandler.requests_headers[1]
+
+    def test_fetch_feed_offline_uses_cache(self, feed_server, tmp_path):
+        """Si le serveur est injoignable, la copie locale est utilisée"""
+        from rss import fetch_feed
+
+        url, server = feed_server
+        cache_file = str(tmp_path / "rss_feed.xml")
+        fetch_feed(url, cache_file)
+        server.shutdown()
+        server.server_close()
+
+        with patch("builtins.print"):
+            result = fetch_feed(url, cache_file, timeout_s=1)
+
+        assert result == (cache_file, None)
+
+    def test_fetch_feed_offline_without_cache_raises(self, tmp_path):
+        """Sans copie locale, l'erreur réseau est propagée"""
+        from rss import fetch_feed
+
+        with patch(
+            "rss.requests.get", side_effect=requests.ConnectionError("hors ligne")
+        ):
+            with pytest.raises(requests.ConnectionError):
+                fetch_feed("http://127.0.0.1:1/rss.xml", str(tmp_path / "rss.xml"))
@@ -0,0 +1,262 @@
+"""
+Tests pour le module nbs.transcription.
+
+Ce module teste le worker de transcription en pipeline :
+- Découpage des cœurs en plages cpuset (split_core_sets)
+- Sélection des épisodes à transcrire (reprise, épisodes abandonnés)
+- Exécution du pipeline avec les moteurs "hf" et "whisper.cpp"
+- Suivi d'avancement dans la collection transcription_jobs
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from bson import ObjectId
+
+os.environ.setdefault("AUDIO_PATH", "/tmp/test_audio")
+
+nbs_path = Path(__file__).parent.parent.parent / "nbs"
+if str(nbs_path) not in sys.path:
+    sys.path.insert(0, str(nbs_path))
+
+# Mock des dépendances ML AVANT l'import du module (indisponibles dans GitHub Actions)
+mock_torch = MagicMock()
+mock_torch.cuda.is_available.return_value = False
+sys.modules.setdefault("torch", mock_torch)
+sys.modules.setdefault("transformers", MagicMock())
+sys.modules.setdefault("dbus", MagicMock())
+sys.modules.setdefault("llama_index", MagicMock())
+sys.modules.setdefault("llama_index.core", MagicMock())
+sys.modules.setdefault("llama_index.core.llms", MagicMock())
+sys.modules.setdefault("llama_index.llms", MagicMock())
+sys.modules.setdefault("llama_index.llms.azure_openai", MagicMock())
+sys.modules.setdefault("llama_index.llms.vertex", MagicMock())
+sys.modules.setdefault("google", MagicMock())
+sys.modules.setdefault("google.generativeai", MagicMock())
+sys.modules.setdefault("google.oauth2", MagicMock())
+sys.modules.setdefault("google.oauth2.service_account", MagicMock())
+
+from nbs.transcription import (
+    TRANSCRIPTION_JOBS_COLLECTION,
+    TranscriptionWorker,
+    _count_cores,
+    split_core_sets,
+)
+
+
+@pytest.fixture
+def mock_jobs():
+    """Collection transcription_jobs mockée, injectée dans le worker"""
+    jobs = MagicMock()
+    jobs.find.return_value = []
+    with patch(
+        "nbs.transcription.get_DB_VARS", return_value=("localhost", "test_db", "false")
+    ), patch("nbs.transcription.get_collection", return_value=jobs) as mock_get:
+        yield jobs, mock_get
+
+
+def make_episode(tmp_path, name: str, cached: str = None) -> MagicMock:
+    """Crée un faux épisode dont l'audio existe dans tmp_path"""
+    audio = tmp_path / f"{name}.mp3"
+    audio.write_bytes(b"fake mp3")
+    if cached is not None:
+        (tmp_path / f"{name}.txt").write_text(cached)
+    episode = MagicMock()
+    episode.titre = name
+    episode.date = datetime(2024, 1, 1)
+    episode.get_oid.return_value = ObjectId()
+    episode.get_audio_fullfilename.return_value = str(audio)
+    return episode
+
+
+class TestSplitCoreSets:
+    """Tests pour le découpage des cœurs en plages cpuset"""
+
+    def test_split_core_sets_contiguous_ranges(self):
+        """Les cœurs sont répartis en plages contiguës de même taille"""
+        assert split_core_sets(2, n_cores=8) == ["0-3", "4-7"]
+        assert split_core_sets(3, n_cores=8) == ["0-1", "2-3", "4-5"]
+
+    def test_split_core_sets_more_sets_than_cores(self):
+        """Avec plus de plages que de cœurs, les cœurs sont partagés"""
+        assert split_core_sets(3, n_cores=2) == ["0", "1", "0"]
+
+    def test_count_cores(self):
+        """_count_cores compte les cœurs d'une plage"""
+        assert _count_cores("0-3") == 4
+        assert _count_cores("5") == 1
+
+
+class TestTranscriptionWorkerInit:
+    """Tests pour la construction du worker"""
+
+    def test_init_uses_jobs_collection(self, mock_jobs):
+        """Le suivi d'avancement utilise la collection transcription_jobs"""
+        _, mock_get = mock_jobs
+        worker = TranscriptionWorker(engine="whisper.cpp", whisper_cpp_workers=3)
+
+        mock_get.assert_called_once_with(
+            target_db="localhost",
+            client_name="test_db",
+            collection_name=TRANSCRIPTION_JOBS_COLLECTION,
+        )
+        assert worker.prefetch == 6
+
+    def test_init_unknown_engine_raises(self, mock_jobs):
+        """Un moteur inconnu lève ValueError"""
+        with pytest.raises(ValueError):
+            TranscriptionWorker(engine="inconnu")
+
+
+class TestGetPendingEpisodes:
+    """Tests pour la sélection des épisodes à transcrire"""
+
+    def test_get_pending_episodes_skips_abandoned_oldest_first(self, mock_jobs):
+        """Les épisodes abandonnés sont exclus et les plus anciens, triés par Mongo, traités d'abord"""
+        jobs, _ = mock_jobs
+        abandoned_oid = ObjectId()
+        jobs.find.return_value = [{"episode_oid": abandoned_oid}]
+        old, recent = MagicMock(), MagicMock()
+
+        with patch("nbs.transcription.Episodes") as mock_episodes:
+            mock_episodes.return_value.iter_episodes.return_value = iter([old, recent])
+            worker = TranscriptionWorker(max_attempts=2)
+            episodes = worker.get_pending_episodes()
+
+        assert episodes == [old, recent]
+        jobs.find.assert_called_once_with(
+            {"status": "failed", "attempts": {"$gte": 2}}, {"episode_oid": 1}
+        )
+        request = mock_episodes.return_value.iter_episodes.call_args[0][0]
+        assert request["$and"][1] == {"_id": {"$nin": [abandoned_oid]}}
+        assert mock_episodes.return_value.iter_episodes.call_args[1] == {
+            "projection": {"transcription": 0},
+            "limit": -1,
+            "oldest_first": True,
+        }
+
+    def test_get_pending_episodes_limit_keeps_oldest(self, mock_jobs):
+        """Avec une limite, le tri croissant est demandé à Mongo avant la limite"""
+        with patch("nbs.transcription.Episodes") as mock_episodes:
+            mock_episodes.return_value.iter_episodes.return_value = iter([])
+            TranscriptionWorker().get_pending_episodes(limit=5)
+            TranscriptionWorker().get_pending_episodes(limit=5, oldest_first=False)
+
+        calls = mock_episodes.return_value.iter_episodes.call_args_list
+        assert [(c[1]["limit"], c[1]["oldest_first"]) for c in calls] == [
+            (5, True),
+            (5, False),
+        ]
+
+
+class TestTranscriptionWorkerRun:
+    """Tests pour l'exécution du pipeline"""
+
+    def test_run_hf_transcribes_in_order(self, mock_jobs, tmp_path):
+        """Le moteur hf décode puis transcrit chaque épisode avec le pipeline en cache"""
+        jobs, _ = mock_jobs
+        episodes = [make_episode(tmp_path, f"episode{i}") for i in range(5)]
+        pipe = MagicMock(side_effect=lambda audio, **kwargs: {"text": f"{audio[0]}"})
+
+        with patch(
+            "nbs.transcription.load_audio",
+            side_effect=lambda filename, **kwargs: np.array([Path(filename).stem]),
+        ), patch("nbs.transcription.get_whisper_pipeline", return_value=pipe):
+            worker = TranscriptionWorker(download_workers=3, decode_workers=0)
+            report = worker.run(episodes)
+
+        assert report == {"done": 5, "failed": 0}
+        for i, episode in enumerate(episodes):
+            episode.download_audio.assert_called_once()
+            episode.save_transcription.assert_called_once_with(
+                f"episode{i}", keep_cache=True
+            )
+        statuses = [c[0][1]["$set"]["status"] for c in jobs.update_one.call_args_list]
+        assert statuses == ["done"] * 5
+
+    def test_run_records_failures(self, mock_jobs, tmp_path):
+        """Un échec est compté, persisté avec son erreur et n'arrête pas le pipeline"""
+        jobs, _ = mock_jobs
+        failing = make_episode(tmp_path, "failing")
+        failing.download_audio.side_effect = RuntimeError("réseau indisponible")
+        ok = make_episode(tmp_path, "ok")
+        pipe = MagicMock(return_value={"text": "texte"})
+
+        with patch(
+            "nbs.transcription.load_audio", return_value=np.zeros(16000)
+        ), patch("nbs.transcription.get_whisper_pipeline", return_value=pipe):
+            worker = TranscriptionWorker(decode_workers=0)
+            report = worker.run([failing, ok])
+
+        assert report == {"done": 1, "failed": 1}
+        failing.save_transcription.assert_not_called()
+        ok.save_transcription.assert_called_once_with("texte", keep_cache=True)
+        filter_, update = jobs.update_one.call_args_list[0][0]
+        assert filter_ == {"episode_oid": failing.get_oid.return_value}
+        assert update["$set"]["status"] == "failed"
+        assert update["$set"]["error"] == "réseau indisponible"
+        assert update["$inc"] == {"attempts": 1}
+
+    def test_run_uses_cached_transcription(self, mock_jobs, tmp_path):
+        """Une transcription cachée (.txt) est enregistrée sans inférence"""
+        episode = make_episode(tmp_path, "cached", cached="déjà transcrit")
+
+        with patch("nbs.transcription.load_audio") as mock_load, patch(
+            "nbs.transcription.get_whisper_pipeline"
+        ) as mock_pipeline:
+            report = TranscriptionWorker(decode_workers=0).run([episode])
+
+        assert report == {"done": 1, "failed": 0}
+        mock_load.assert_not_called()
+        mock_pipeline.assert_not_called()
+        episode.save_transcription.assert_called_once_with(
+            "déjà transcrit", keep_cache=False
+        )
+
+    def test_run_whisper_cpp_pins_core_sets(self, mock_jobs, tmp_path):
+        """Le moteur whisper.cpp lance un processus par plage de cœurs"""
+        episodes = [make_episode(tmp_path, f"episode{i}") for i in range(4)]
+
+        with patch(
+            "nbs.transcription.split_core_sets", return_value=["0-3", "4-7"]
+        ), patch(
+            "nbs.transcription.extract_whisper_cpp", return_value=("texte", None)
+        ) as mock_cpp, patch(
+            "nbs.transcription.load_audio"
+        ) as mock_load:
+            worker = TranscriptionWorker(engine="whisper.cpp", whisper_cpp_workers=2)
+            report = worker.run(episodes)
+
+        assert report == {"done": 4, "failed": 0}
+        mock_load.assert_not_called()
+        assert mock_cpp.call_count == 4
+        for call_ in mock_cpp.call_args_list:
+            extra_env = call_[1]["extra_env"]
+            assert extra_env["WHISPER_CPUSET"] in ("0-3", "4-7")
+            assert extra_env["WHISPER_THREADS"] == "4"
+
+    def test_run_whisper_cpp_falls_back_to_hf(self, mock_jobs, tmp_path):
+        """Si whisper.cpp échoue, l'épisode est transcrit par le pipeline Hugging Face"""
+        from nbs.transcription import WhisperCppError
+
+        episode = make_episode(tmp_path, "episode")
+        pipe = MagicMock(return_value={"text": "texte hf"})
+
+        with patch(
+            "nbs.transcription.extract_whisper_cpp",
+            side_effect=WhisperCppError("docker absent"),
+        ), patch(
+            "nbs.transcription.load_audio", return_value=np.zeros(16000)
+        ) as mock_load, patch(
+            "nbs.transcription.get_whisper_pipeline", return_value=pipe
+        ):
+            report = TranscriptionWorker(engine="whisper.cpp", vad=True).run([episode])
+
+        assert report == {"done": 1, "failed": 0}
+        assert mock_load.call_args[1] == {"vad": True}
+        episode.save_transcription.assert_called_once_with("texte hf", keep_cache=True)
@@ -47,6 +47,7 @@ def mock_whisper_dependencies():
     # Mock pour mongo_episode
     mock_mongo_episode = MagicMock()
     mock_mongo_episode.get_audio_path.return_value = "/test/audio/path"
+    mock_mongo_episode.get_whisper_model.return_value = (MagicMock(), MagicMock())
 
     # Mock pour les modules ML lourds
     mock_torch = MagicMock()
@@ -259,17 +260,10 @@ class TestExtractWhisper:
         mock_torch = mock_whisper_dependencies["torch"]
         mock_torch.cuda.is_available.return_value = False
 
-        mock_transformers = mock_whisper_dependencies["transformers"]
-        mock_model = MagicMock()
-        mock_processor = MagicMock()
-        mock_transformers.AutoModelForSpeechSeq2Seq.from_pretrained.return_value = (
-            mock_model
+        mock_pipe = MagicMock(return_value={"text": "Test transcription"})
+        mock_whisper_dependencies["mongo_episode"].get_whisper_pipeline.return_value = (
+            mock_pipe
         )
-        mock_transformers.AutoProcessor.from_pretrained.return_value = mock_processor
-        mock_transformers.pipeline.return_value = MagicMock()
-        mock_transformers.pipeline.return_value.return_value = {
-            "text": "Test transcription"
-        }
 
         mock_dataset = MagicMock()
         mock_dataset[0] = {"audio": "mock_audio_data"}
@@ -280,9 +274,13 @@ class TestExtractWhisper:
 
         # Vérifications
         mock_torch.cuda.is_available.assert_called()
-        mock_transformers.AutoModelForSpeechSeq2Seq.from_pretrained.assert_called_once()
-        mock_transformers.AutoProcessor.from_pretrained.assert_called_once()
-        mock_model.to.assert_called_once_with("cpu")
+        get_whisper_pipeline = mock_whisper_dependencies[
+            "mongo_episode"
+        ].get_whisper_pipeline
+        get_whisper_pipeline.assert_called_once()
+        assert get_whisper_pipeline.call_args.kwargs["device"] == "cpu"
+        mock_pipe.assert_called_once()
+        assert mock_pipe.call_args[0][0] == "/test/audio.mp3"
         assert result == "Test transcription"
 
     @patch("datasets.load_dataset")
@@ -294,17 +292,10 @@ class TestExtractWhisper:
         mock_torch = mock_whisper_dependencies["torch"]
         mock_torch.cuda.is_available.return_value = True
 
-        mock_transformers = mock_whisper_dependencies["transformers"]
-        mock_model = MagicMock()
-        mock_processor = MagicMock()
-        mock_transformers.AutoModelForSpeechSeq2Seq.from_pretrained.return_value = (
-            mock_model
+        mock_pipe = MagicMock(return_value={"text": "Test transcription CUDA"})
+        mock_whisper_dependencies["mongo_episode"].get_whisper_pipeline.return_value = (
+            mock_pipe
         )
-        mock_transformers.AutoProcessor.from_pretrained.return_value = mock_processor
-        mock_transformers.pipeline.return_value = MagicMock()
-        mock_transformers.pipeline.return_value.return_value = {
-            "text": "Test transcription CUDA"
-        }
 
         mock_dataset = MagicMock()
         mock_dataset[0] = {"audio": "mock_audio_data"}
@@ -315,8 +306,12 @@ class TestExtractWhisper:
 
         # Vérifications
         mock_torch.cuda.is_available.assert_called()
-        mock_transformers.AutoModelForSpeechSeq2Seq.from_pretrained.assert_called_once()
-        mock_model.to.assert_called_once_with("cuda:0")
+        get_whisper_pipeline = mock_whisper_dependencies[
+            "mongo_episode"
+        ].get_whisper_pipeline
+        get_whisper_pipeline.assert_called_once()
+        assert get_whisper_pipeline.call_args.kwargs["device"] == "cuda:0"
+        assert get_whisper_pipeline.call_args.kwargs["dtype"] == "float16"
         assert result == "Test transcription CUDA"
 
     @patch("datasets.load_dataset")
@@ -328,18 +323,12 @@ class TestExtractWhisper:
         mock_torch = mock_whisper_dependencies["torch"]
         mock_torch.cuda.is_available.return_value = False
 
-        mock_transformers = mock_whisper_dependencies["transformers"]
-        mock_model = MagicMock()
-        mock_processor = MagicMock()
-        mock_transformers.AutoModelForSpeechSeq2Seq.from_pretrained.return_value = (
-            mock_model
-        )
-        mock_transformers.AutoProcessor.from_pretrained.return_value = mock_processor
-
-        # Mock du pipeline
+        # Mock du pipeline (en cache dans mongo_episode)
         mock_pipe = MagicMock()
         mock_pipe.return_value = {"text": "Transcription en français"}
-        mock_transformers.pipeline.return_value = mock_pipe
+        mock_whisper_dependencies["mongo_episode"].get_whisper_pipeline.return_value = (
+            mock_pipe
+        )
 
         mock_dataset = MagicMock()
         mock_dataset[0] = {"audio": "mock_audio_data"}
@@ -350,8 +339,8 @@ class TestExtractWhisper:
 
         # Vérifications - le pipeline doit être appelé avec generate_kwargs contenant language="fr"
         # (et non "french" qui cause des conflits avec forced_decoder_ids)
-        mock_transformers.pipeline.assert_called_once()
-        call_kwargs = mock_transformers.pipeline.call_args[1]
+        mock_pipe.assert_called_once()
+        call_kwargs = mock_pipe.call_args[1]
 
         # Vérifier que generate_kwargs est présent et contient language="fr"
         assert "generate_kwargs" in call_kwargs
@@ -81,8 +81,7 @@ if st.button("🔄 Rafraîchir Episodes"):
     else:
         st.warning("Pas de nouveaux épisodes aujourd'hui")
 
-episodes.get_missing_transcriptions()
-if len(episodes) > 0:
+if episodes.len_missing_transcriptions() > 0:
     if st.button("📥 Télécharger transcriptions "):
         with st.spinner("Téléchargement des transcriptions en cours..."):
             # Exécuter le script get_one_transcription.py situé dans le dossier scripts
@@ -125,9 +124,9 @@ from date_utils import DATE_FORMAT, format_date
 
 
 def affiche_last_date(episodes=episodes):
-    episodes.get_entries(limit=1)
-    if len(episodes) > 0:
-        date_text = format_date(episodes[0].to_dict().get("date"))
+    last_date = episodes.get_last_date()
+    if last_date is not None:
+        date_text = format_date(last_date)
     else:
         date_text = "No episodes yet"
     card(
@@ -139,10 +138,9 @@ def affiche_last_date(episodes=episodes):
 
 
 def affiche_missing_transcription(episodes=episodes):
-    episodes.get_missing_transcriptions()
     card(
         title="# missing transcriptions",
-        text=f"{len(episodes)}",
+        text=f"{episodes.len_missing_transcriptions()}",
         image="http://placekitten.com/300/250",
         url="/episodes",
     )
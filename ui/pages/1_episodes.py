@@ -8,7 +8,7 @@ from ui_tools import add_to_sys_path
 
 add_to_sys_path()
 
-from mongo_episode import Episodes, Episode
+from mongo_episode import Episodes, Episode, load_transcriptions
 import pandas as pd
 from bson import ObjectId
 
@@ -23,24 +23,30 @@ from date_utils import DATE_FORMAT, format_date
 @st.cache_data  # 👈 Add the caching decorator
 def get_episodes():
     episodes = Episodes()
-    episodes.get_entries()
-    all_episodes = [Episode.from_oid(oid) for oid in episodes.oid_episodes]
+    all_episodes = episodes.get_episodes()
     # Créer le DataFrame avec les données des épisodes
     episodes_data = []
     for i, episode in enumerate(all_episodes):
-        data = episode.to_dict()
+        # les transcriptions ne sont lues qu'à l'affichage d'un épisode
+        data = episode.to_dict(include_transcription=False)
         data["_id"] = str(episodes.oid_episodes[i])  # Ajouter l'OID
         episodes_data.append(data)
 
     episodes_df = pd.DataFrame(episodes_data)
     episodes_df["duree (min)"] = (episodes_df["duree"] / 60).round(1)
     episodes_df.drop(
-        columns=["url_telechargement", "type", "duree"],
+        columns=["url_telechargement", "type", "duree", "transcription"],
         inplace=True,
     )
     return episodes_df
 
 
+@st.cache_data
+def get_transcription(oid):
+    # une seule lecture par épisode affiché, et non à chaque rerun de la page
+    return load_transcriptions([ObjectId(oid)]).get(ObjectId(oid))
+
+
 @st.cache_data  # 👈 Add the caching decorator
 def print_episodes_info(episodes_df):
     st.write("### Informations sur les épisodes")
@@ -49,8 +55,8 @@ def print_episodes_info(episodes_df):
         f"{format_date(episodes_df['date'].min())} - {format_date(episodes_df['date'].max())}"
     )
     # Compter les transcriptions disponibles et manquantes
-    transcriptions_ok = episodes_df["transcription"].notna().sum()
-    transcriptions_missing = episodes_df["transcription"].isna().sum()
+    transcriptions_ok = episodes_df["has_transcription"].sum()
+    transcriptions_missing = (~episodes_df["has_transcription"]).sum()
 
     st.write(f"Transcriptions OK : {transcriptions_ok}")
     st.write(f"Transcriptions manquantes : {transcriptions_missing}")
@@ -86,7 +92,7 @@ def afficher_un_episode(episodes_df):
         st.write(f"**Description**: {episode_data['description']}")
 
         # Afficher la transcription si elle existe
-        if pd.notna(episode_data["transcription"]) and episode_data["transcription"]:
+        if episode_data["has_transcription"]:
             # Bouton pour relancer la transcription (AVANT la transcription)
             if st.button(
                 "🔄 Relancer la transcription",
@@ -98,9 +104,9 @@ def afficher_un_episode(episodes_df):
                     episode = Episode.from_oid(ObjectId(episode_data["_id"]))
 
                     # Supprimer la transcription de la DB
+                    episode.delete_transcription()
                     episode.collection.update_one(
-                        {"_id": episode.get_oid()},
-                        {"$unset": {"transcription": "", "whisper": ""}},
+                        {"_id": episode.get_oid()}, {"$unset": {"whisper": ""}}
                     )
 
                     # Supprimer le fichier cache si existe
@@ -120,14 +126,14 @@ def afficher_un_episode(episodes_df):
                     "Transcription en cours... Cela peut prendre plusieurs minutes."
                 ):
                     # Relancer la transcription
-                    episode.transcription = None  # Réinitialiser l'attribut
                     episode.set_transcription(verbose=True)
+                    get_transcription.clear()
                     st.success("✅ Transcription terminée avec succès!")
                     st.rerun()
 
             # Afficher la transcription dans un expander pour ne pas prendre trop de place
             with st.expander("📝 Voir la transcription", expanded=False):
-                st.write(episode_data["transcription"])
+                st.write(get_transcription(episode_data["_id"]))
         else:
             st.warning("⚠️ Aucune transcription disponible pour cet épisode")
 
@@ -149,12 +155,17 @@ def nb_mots_transcription(episodes_df):
     st.write("### Nombre de mots par transcription")
     # Compter le nombre de mots dans chaque transcription
 
-    episodes_df = episodes_df.copy()
+    episodes_df = episodes_df[episodes_df["has_transcription"]].copy()
     episodes_df["date"] = episodes_df["date"].apply(lambda x: format_date(x))
 
+    # Lire toutes les transcriptions en une requête
+    transcriptions = load_transcriptions(ObjectId(oid) for oid in episodes_df["_id"])
+
     # Calculer le nombre de mots par minute
     episodes_df["mots_par_minute"] = (
-        episodes_df["transcription"].apply(lambda x: len(x.split()))
+        episodes_df["_id"].apply(
+            lambda oid: len(transcriptions.get(ObjectId(oid), "").split())
+        )
         / episodes_df["duree (min)"]
     )
 
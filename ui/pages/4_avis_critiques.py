@@ -217,18 +217,18 @@ def save_summary_to_cache(episode_oid, episode_title, episode_date, summary):
 def get_episodes_with_transcriptions():
     """Récupère tous les épisodes et filtre ceux qui ont des transcriptions"""
     episodes = Episodes()
-    episodes.get_entries()
-    all_episodes = [Episode.from_oid(oid) for oid in episodes.oid_episodes]
-    episodes_df = pd.DataFrame([episode.to_dict() for episode in all_episodes])
+    all_episodes = episodes.get_episodes()
+    # les transcriptions ne sont lues qu'à la génération d'un résumé
+    episodes_df = pd.DataFrame(
+        [episode.to_dict(include_transcription=False) for episode in all_episodes]
+    )
     episodes_df["duree (min)"] = (episodes_df["duree"] / 60).round(1)
 
     # Ajouter les OIDs comme colonne
     episodes_df["oid"] = episodes.oid_episodes
 
     # Filtrer seulement les épisodes avec transcriptions
-    episodes_with_transcriptions = episodes_df[
-        episodes_df["transcription"].notna()
-    ].copy()
+    episodes_with_transcriptions = episodes_df[episodes_df["has_transcription"]].copy()
 
     return episodes_with_transcriptions
 
@@ -536,7 +536,7 @@ def afficher_selection_episode():
                 status_text = st.empty()
 
                 try:
-                    transcription = episode["transcription"]
+                    transcription = Episode.from_oid(episode["oid"]).transcription
                     if not transcription:
                         st.error(
                             "La transcription n'est pas disponible pour cet épisode"